@@ -16,6 +16,7 @@
 """Main Qiskit public functionality."""
 
 
+import importlib
 import pkgutil
 import sys
 import warnings
@@ -44,43 +45,100 @@ import qiskit.circuit.reset
 # importing the package you want to allow extensions for (in this case `backends`).
 __path__ = pkgutil.extend_path(__path__, __name__)
 
-# Please note these are global instances, not modules.
-from qiskit.providers.basicaer import BasicAer
-
 _config = _user_config.get_config()
 
-# Try to import the Aer provider if installed.
-try:
-    from qiskit.providers.aer import Aer
-except ImportError:
-    suppress_warnings = os.environ.get('QISKIT_SUPPRESS_PACKAGING_WARNINGS', '')
-    if suppress_warnings.upper() != 'Y':
-        if not _config.get('suppress_packaging_warnings') or suppress_warnings.upper() == 'N':
-            warnings.warn('Could not import the Aer provider from the qiskit-aer '
-                          'package. Install qiskit-aer or check your installation.',
-                          RuntimeWarning)
-# Try to import the IBMQ provider if installed.
-try:
-    from qiskit.providers.ibmq import IBMQ
-except ImportError:
+
+def _warn_missing_provider(message):
     suppress_warnings = os.environ.get('QISKIT_SUPPRESS_PACKAGING_WARNINGS', '')
     if suppress_warnings.upper() != 'Y':
         if not _config.get('suppress_packaging_warnings') or suppress_warnings.upper() == 'N':
-            warnings.warn('Could not import the IBMQ provider from the '
-                          'qiskit-ibmq-provider package. Install '
-                          'qiskit-ibmq-provider or check your installation.',
-                          RuntimeWarning)
-
-# Moved to after IBMQ and Aer imports due to import issues
-# with other modules that check for IBMQ (tools)
+            warnings.warn(message, RuntimeWarning)
+
+
+# The Aer and IBMQ providers are only imported when they are first used, but
+# the warnings about missing providers are still emitted on import, and the
+# missing providers are not attributes of the module.
+_PROVIDERS = {}
+if any(os.path.isdir(os.path.join(path, 'providers', 'aer')) for path in __path__):
+    _PROVIDERS['Aer'] = 'qiskit.providers.aer'
+else:
+    _warn_missing_provider('Could not import the Aer provider from the qiskit-aer '
+                           'package. Install qiskit-aer or check your installation.')
+if any(os.path.isdir(os.path.join(path, 'providers', 'ibmq')) for path in __path__):
+    _PROVIDERS['IBMQ'] = 'qiskit.providers.ibmq'
+else:
+    _warn_missing_provider('Could not import the IBMQ provider from the '
+                           'qiskit-ibmq-provider package. Install '
+                           'qiskit-ibmq-provider or check your installation.')
+
+# The execute function only imports the compiler when it is called.
 from qiskit.execute import execute  # noqa
-from qiskit.compiler import transpile, assemble, schedule, sequence  # noqa
 
 from .version import __version__  # noqa
-from .version import _get_qiskit_versions  # noqa
-
 
-__qiskit_version__ = _get_qiskit_versions()
+# Names imported from their modules on first access, by the module
+# ``__getattr__``, to keep ``import qiskit`` fast. Please note BasicAer, Aer
+# and IBMQ are global instances, not modules.
+_LAZY_ATTRIBUTES = {
+    'BasicAer': 'qiskit.providers.basicaer',
+    'transpile': 'qiskit.compiler',
+    'assemble': 'qiskit.compiler',
+    'schedule': 'qiskit.compiler',
+    'sequence': 'qiskit.compiler',
+}
+
+# Subpackages imported on first access as attributes of the qiskit module.
+_LAZY_SUBPACKAGES = frozenset([
+    'algorithms', 'assembler', 'circuit', 'compiler', 'converters', 'dagcircuit',
+    'extensions', 'opflow', 'providers', 'pulse', 'qasm', 'qobj', 'quantum_info', 'result',
+    'scheduler', 'test', 'tools', 'transpiler', 'utils', 'validation', 'visualization',
+])
+
+# Names exported by ``from qiskit import *``, which are imported on the star
+# import if they are lazy.
+__all__ = [
+    'QiskitError', 'ClassicalRegister', 'QuantumRegister', 'AncillaRegister', 'QuantumCircuit',
+    'execute', 'BasicAer', 'transpile', 'assemble', 'schedule', 'sequence',
+    'assembler', 'circuit', 'compiler', 'converters', 'dagcircuit', 'exceptions', 'extensions',
+    'providers', 'pulse', 'qasm', 'qobj', 'quantum_info', 'result', 'scheduler', 'tools',
+    'transpiler', 'utils', 'validation', 'visualization',
+] + list(_PROVIDERS)
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+    elif name in _PROVIDERS:
+        try:
+            value = getattr(importlib.import_module(_PROVIDERS[name]), name)
+        except ImportError as err:
+            raise AttributeError("module 'qiskit' has no attribute '{}'".format(name)) from err
+    elif name in _LAZY_SUBPACKAGES:
+        value = importlib.import_module('qiskit.' + name)
+    elif name == '__qiskit_version__':
+        from . import version
+        value = version.__qiskit_version__
+    else:
+        raise AttributeError("module 'qiskit' has no attribute '{}'".format(name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()).union(_LAZY_ATTRIBUTES, _PROVIDERS, _LAZY_SUBPACKAGES,
+                                       ['__qiskit_version__']))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ needs Python 3.7, so the names are imported now
+    for _name in ['BasicAer', 'transpile', 'assemble', 'schedule', 'sequence',
+                  '__qiskit_version__']:
+        __getattr__(_name)
+    for _name in list(_PROVIDERS):
+        try:
+            __getattr__(_name)
+        except AttributeError:
+            __all__.remove(_name)
 
 
 if sys.version_info[0] == 3 and sys.version_info[1] == 6:
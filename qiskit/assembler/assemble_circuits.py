@@ -16,27 +16,35 @@ from typing import Dict, List, Optional, Tuple
 
 from qiskit.assembler.run_config import RunConfig
 from qiskit.assembler.assemble_schedules import _assemble_instructions as _assemble_schedule
-from qiskit.circuit import QuantumCircuit
+from qiskit.circuit import Gate, Instruction, QuantumCircuit
 from qiskit.exceptions import QiskitError
 from qiskit.qobj import (QasmQobj, QobjExperimentHeader,
                          QasmQobjInstruction, QasmQobjExperimentConfig, QasmQobjExperiment,
                          QasmQobjConfig, QasmExperimentCalibrations, GateCalibration,
                          PulseQobjInstruction, PulseLibraryItem, converters, QobjHeader)
+from qiskit.qobj.columnar_qasm_qobj import ColumnarInstructionBuilder
 from qiskit.tools.parallel import parallel_map
 
 
 PulseLibrary = Dict[str, List[complex]]
 
 
+# The assemble methods of the instructions whose fields are read directly by
+# the columnar assembly
+_DEFAULT_ASSEMBLE = (Instruction.assemble, Gate.assemble)
+
+
 def _assemble_circuit(
         circuit: QuantumCircuit,
-        run_config: RunConfig
+        run_config: RunConfig,
+        columnar: bool = False
 ) -> Tuple[QasmQobjExperiment, Optional[PulseLibrary]]:
     """Assemble one circuit.
 
     Args:
         circuit: circuit to assemble
         run_config: configuration of the runtime environment
+        columnar: whether to assemble the circuit into a ``ColumnarQasmQobjExperiment``
 
     Returns:
         One experiment for the QasmQobj, and pulse library for pulse gates (which could be None)
@@ -89,6 +97,11 @@ def _assemble_circuit(
     if calibrations:
         config.calibrations = calibrations
 
+    if columnar:
+        builder = _assemble_columnar_instructions(circuit, qubit_labels, clbit_labels,
+                                                  memory_slots)
+        return builder.experiment(config=config, header=header), pulse_library
+
     # Convert conditionals from QASM-style (creg ?= int) to qobj-style
     # (register_bit ?= 1), by assuming device has unlimited register slots
     # (supported only for simulators). Map all measures to a register matching
@@ -122,14 +135,7 @@ def _assemble_circuit(
         # to the conditional instruction to map the creg ?= val condition
         # onto a gating register bit.
         if hasattr(instruction, '_condition'):
-            ctrl_reg, ctrl_val = instruction._condition
-            mask = 0
-            val = 0
-            for clbit in clbit_labels:
-                if clbit[0] == ctrl_reg.name:
-                    mask |= (1 << clbit_labels.index(clbit))
-                    val |= (((ctrl_val >> clbit[1]) & 1) << clbit_labels.index(clbit))
-
+            mask, val = _condition_mask(instruction._condition, clbit_labels)
             conditional_reg_idx = memory_slots + max_conditional_idx
             conversion_bfunc = QasmQobjInstruction(name='bfunc',
                                                    mask="0x%X" % mask,
@@ -148,6 +154,64 @@ def _assemble_circuit(
             pulse_library)
 
 
+def _assemble_columnar_instructions(circuit, qubit_labels, clbit_labels, memory_slots):
+    """Assemble the instructions of a circuit into columns.
+
+    The conditionals are converted as in :func:`_assemble_circuit`, and the
+    fields of the instructions which do not override their ``assemble``
+    method are read directly, without creating a ``QasmQobjInstruction``.
+
+    Returns:
+        ColumnarInstructionBuilder: the builder of the instructions.
+    """
+    qubit_indices = {tuple(label): index for index, label in enumerate(qubit_labels)}
+    clbit_indices = {tuple(label): index for index, label in enumerate(clbit_labels)}
+    is_conditional_experiment = any(op.condition for (op, qargs, cargs) in circuit.data)
+    max_conditional_idx = 0
+
+    builder = ColumnarInstructionBuilder()
+    for op, qargs, cargs in circuit.data:
+        qubits = [qubit_indices[(qubit.register.name, qubit.index)] for qubit in qargs]
+        memory = [clbit_indices[(clbit.register.name, clbit.index)] for clbit in cargs]
+        if type(op).assemble in _DEFAULT_ASSEMBLE:
+            name = op.name
+            params = [x.evalf(x) if hasattr(x, 'evalf') else x for x in op.params]
+            extras = {'label': op.label} if isinstance(op, Gate) and op.label else None
+            condition = op.condition
+        else:
+            extras = dict(op.assemble().__dict__)
+            name = extras.pop('name')
+            params = extras.pop('params', ())
+            condition = extras.pop('_condition', None)
+            # The placeholder bits are replaced by the bits of the circuit
+            for attr, bits in (('qubits', qubits), ('memory', memory)):
+                if bits:
+                    extras.pop(attr, None)
+        register = memory if name == 'measure' and is_conditional_experiment else ()
+
+        conditional = -1
+        if condition:
+            mask, val = _condition_mask(condition, clbit_labels)
+            conditional = memory_slots + max_conditional_idx
+            builder.append('bfunc', extras={'mask': "0x%X" % mask, 'relation': '==',
+                                            'val': "0x%X" % val, 'register': conditional})
+            max_conditional_idx += 1
+        builder.append(name, qubits, memory, register, params, conditional, extras)
+    return builder
+
+
+def _condition_mask(condition, clbit_labels):
+    """Return the mask and value of the clbits of a ``(creg, value)`` condition."""
+    ctrl_reg, ctrl_val = condition
+    mask = 0
+    val = 0
+    for index, clbit in enumerate(clbit_labels):
+        if clbit[0] == ctrl_reg.name:
+            mask |= (1 << index)
+            val |= (((ctrl_val >> clbit[1]) & 1) << index)
+    return mask, val
+
+
 def _assemble_pulse_gates(
         circuit: QuantumCircuit,
         run_config: RunConfig
@@ -240,7 +304,8 @@ def assemble_circuits(
         circuits: List[QuantumCircuit],
         run_config: RunConfig,
         qobj_id: int,
-        qobj_header: QobjHeader
+        qobj_header: QobjHeader,
+        columnar: bool = False
 ) -> QasmQobj:
     """Assembles a list of circuits into a qobj that can be run on the backend.
 
@@ -249,6 +314,8 @@ def assemble_circuits(
         run_config: configuration of the runtime environment
         qobj_id: identifier for the generated qobj
         qobj_header: header to pass to the results
+        columnar: whether to assemble the circuits into
+            :class:`~qiskit.qobj.ColumnarQasmQobjExperiment` experiments
 
     Returns:
         The qobj to be run on the backends
@@ -270,7 +337,7 @@ def assemble_circuits(
     qobj_config.memory_slots = max(memory_slot_sizes)
     qobj_config.n_qubits = max(qubit_sizes)
 
-    experiments_and_pulse_libs = parallel_map(_assemble_circuit, circuits, [run_config])
+    experiments_and_pulse_libs = parallel_map(_assemble_circuit, circuits, [run_config, columnar])
     experiments = []
     pulse_library = {}
     for exp, lib in experiments_and_pulse_libs:
@@ -192,6 +192,8 @@ Gates and Instructions
    Instruction
    InstructionSet
    EquivalenceLibrary
+   CommutationLibrary
+   GateMatrixCache
 
 Parametric Quantum Circuits
 ---------------------------
@@ -202,6 +204,7 @@ Parametric Quantum Circuits
     Parameter
     ParameterVector
     ParameterExpression
+    ParameterBindingPlan
 
 Random Circuits
 ---------------
@@ -226,6 +229,9 @@ from .reset import Reset
 from .parameter import Parameter
 from .parametervector import ParameterVector
 from .parameterexpression import ParameterExpression
+from .parameterbindingplan import ParameterBindingPlan
 from .equivalence import EquivalenceLibrary
+from .commutation_library import CommutationLibrary
+from .gate_matrix_cache import GateMatrixCache
 from .classicalfunction.types import Int1, Int2
 from .classicalfunction import classical_function
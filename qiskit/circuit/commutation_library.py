@@ -0,0 +1,191 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Library of commutation relations between gates."""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class CommutationLibrary:
+    """Library deciding whether two gates commute, with a cache of the answers.
+
+    The standard gates which commute with a Pauli operator on some of their
+    qubits (e.g. the control of a :class:`.CXGate` commutes with ``Z`` and
+    its target with ``X``) are recorded in a rule table: two gates commute
+    if, on every qubit they share, they commute with a same Pauli operator.
+    For the other pairs the library compares the matrices of both products of
+    the gates, on the qubits they act on only.
+
+    The answers are cached, in a cache bounded with a least recently used
+    policy. They are keyed by the gates, their parameters and the relative
+    placement of their qubits, so a pair of gates found at different positions
+    of a circuit is only checked once.
+
+    The :data:`SessionCommutationLibrary` instance is shared by the
+    :class:`~qiskit.transpiler.passes.CommutationAnalysis` pass (and through
+    it by :class:`~qiskit.transpiler.passes.CommutativeCancellation`) and by
+    :class:`~qiskit.dagcircuit.DAGDependency`.
+    """
+
+    def __init__(self, maxsize=2 ** 14):
+        """Create a commutation library.
+
+        Args:
+            maxsize (int): maximum number of cached answers.
+        """
+        self._maxsize = maxsize
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def commute(self, op1, qargs1, op2, qargs2):
+        """Return whether two unitary gates commute.
+
+        Args:
+            op1 (Gate): the first gate. It must not be parameterized.
+            qargs1 (list): the qubits of the first gate, any hashable objects.
+            op2 (Gate): the second gate. It must not be parameterized.
+            qargs2 (list): the qubits of the second gate.
+
+        Returns:
+            bool: ``True`` if the gates commute.
+        """
+        shared = set(qargs1).intersection(qargs2)
+        if not shared:
+            return True
+
+        rules1 = _pauli_rules(op1)
+        rules2 = _pauli_rules(op2)
+        if rules1 is not None and rules2 is not None:
+            paulis1 = dict(zip(qargs1, rules1))
+            paulis2 = dict(zip(qargs2, rules2))
+            if all(set(paulis1[qubit]).intersection(paulis2[qubit]) for qubit in shared):
+                return True
+
+        # Relative placement of the qubits, by order of first occurrence
+        placement = {}
+        for qubit in list(qargs1) + list(qargs2):
+            placement.setdefault(qubit, len(placement))
+        qargs1 = tuple(placement[qubit] for qubit in qargs1)
+        qargs2 = tuple(placement[qubit] for qubit in qargs2)
+        try:
+            key = (_gate_key(op1), qargs1, _gate_key(op2), qargs2)
+            hash(key)
+        except TypeError:
+            # Unhashable parameters, e.g. the matrix of a unitary gate
+            return _commute_dense(op1, qargs1, op2, qargs2, len(placement))
+
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return self._cache[key]
+        result = _commute_dense(op1, qargs1, op2, qargs2, len(placement))
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = result
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self):
+        """Return the statistics of the cache.
+
+        Returns:
+            dict: the numbers of ``hits`` and ``misses`` of the cache, and its
+            current and maximum sizes ``currsize`` and ``maxsize``.
+        """
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses,
+                    'currsize': len(self._cache), 'maxsize': self._maxsize}
+
+    def clear_cache(self):
+        """Clear the cached answers and their statistics."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _gate_key(op):
+    """Return a hashable key identifying a gate and its parameters."""
+    return type(op), op.name, op.num_qubits, tuple(op.params)
+
+
+def _commute_dense(op1, qargs1, op2, qargs2, num_qubits):
+    """Return whether two gates commute by comparing the matrices of both products."""
+    # pylint: disable=cyclic-import
+    from qiskit.quantum_info.operators import Operator
+
+    identity = Operator(np.eye(2 ** num_qubits))
+    op12 = identity.compose(op1, qargs=list(qargs1)).compose(op2, qargs=list(qargs2))
+    op21 = identity.compose(op2, qargs=list(qargs2)).compose(op1, qargs=list(qargs1))
+    return op12 == op21
+
+
+_PAULI_RULES = None
+
+
+def _pauli_rules(op):
+    """Return the Paulis the standard gate ``op`` commutes with on each of its
+    qubits, or ``None`` if it is not in the rule table.
+    """
+    global _PAULI_RULES  # pylint: disable=global-statement
+    if _PAULI_RULES is None:
+        _PAULI_RULES = _build_pauli_rules()
+    return _PAULI_RULES.get(type(op))
+
+
+def _build_pauli_rules():
+    """Build the rule table of the standard gates.
+
+    The table maps a gate class to a string per qubit holding the Paulis the
+    gate commutes with when they act on that qubit. An empty string means the
+    gate commutes with no Pauli on that qubit.
+    """
+    # pylint: disable=cyclic-import
+    from qiskit.circuit.library import standard_gates as gates
+
+    rules = {gates.IGate: ('XYZ',)}
+    for gate in (gates.ZGate, gates.SGate, gates.SdgGate, gates.TGate, gates.TdgGate,
+                 gates.RZGate, gates.U1Gate, gates.PhaseGate):
+        rules[gate] = ('Z',)
+    for gate in (gates.XGate, gates.RXGate, gates.SXGate, gates.SXdgGate):
+        rules[gate] = ('X',)
+    for gate in (gates.YGate, gates.RYGate):
+        rules[gate] = ('Y',)
+    for gate in (gates.HGate, gates.U2Gate, gates.U3Gate, gates.UGate, gates.RGate):
+        rules[gate] = ('',)
+    for gate in (gates.CZGate, gates.CRZGate, gates.CU1Gate, gates.CPhaseGate,
+                 gates.RZZGate):
+        rules[gate] = ('Z', 'Z')
+    for gate in (gates.CXGate, gates.CRXGate, gates.CSXGate, gates.RZXGate):
+        rules[gate] = ('Z', 'X')
+    for gate in (gates.CYGate, gates.CRYGate):
+        rules[gate] = ('Z', 'Y')
+    for gate in (gates.CHGate, gates.CU3Gate, gates.CUGate):
+        rules[gate] = ('Z', '')
+    rules[gates.RXXGate] = ('X', 'X')
+    rules[gates.RYYGate] = ('Y', 'Y')
+    rules[gates.SwapGate] = ('', '')
+    rules[gates.iSwapGate] = ('', '')
+    rules[gates.DCXGate] = ('', '')
+    rules[gates.CCXGate] = ('Z', 'Z', 'X')
+    rules[gates.CSwapGate] = ('Z', '', '')
+    return rules
+
+
+SessionCommutationLibrary = CommutationLibrary()
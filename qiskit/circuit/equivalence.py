@@ -13,6 +13,7 @@
 """Gate equivalence library."""
 
 import io
+import uuid
 from collections import namedtuple
 
 import retworkx as rx
@@ -46,6 +47,10 @@ class EquivalenceLibrary():
 
         self._map = {}
 
+        # Changed on every mutation, to invalidate the basis translation plans
+        # computed from this library.
+        self._version = uuid.uuid4()
+
     def add_equivalence(self, gate, equivalent_circuit):
         """Add a new equivalence to the library. Future queries for the Gate
         will include the given circuit, in addition to all existing equivalences
@@ -74,6 +79,7 @@ class EquivalenceLibrary():
             self._map[key] = Entry(search_base=True, equivalences=[])
 
         self._map[key].equivalences.append(equiv)
+        self._version = uuid.uuid4()
 
     def has_entry(self, gate):
         """Check if a library contains any decompositions for gate.
@@ -119,6 +125,7 @@ class EquivalenceLibrary():
 
         self._map[key] = Entry(search_base=False,
                                equivalences=equivs)
+        self._version = uuid.uuid4()
 
     def get_entry(self, gate):
         """Gets the set of QuantumCircuits circuits from the library which
@@ -232,6 +239,16 @@ class EquivalenceLibrary():
 
         return graph
 
+    def _version_key(self):
+        """Return a key identifying the current content of this library and its bases.
+
+        The key changes whenever this library or one of its bases is mutated,
+        and is kept when the library is copied or pickled.
+        """
+        if self._base is None:
+            return (self._version,)
+        return (self._version,) + self._base._version_key()
+
     def _get_all_keys(self):
         base_keys = self._base._get_all_keys() if self._base is not None else set()
 
@@ -0,0 +1,132 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of the matrices of the standard gates."""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+_STANDARD_GATES_MODULE = 'qiskit.circuit.library.standard_gates.'
+
+
+class GateMatrixCache:
+    """Cache of the matrices of the standard gates.
+
+    The matrices of the standard gates without parameters (e.g.
+    :class:`.HGate` or :class:`.CXGate`) are computed once and kept for the
+    lifetime of the cache. The matrices of the parameterized standard gates are
+    cached by the gate class and parameters, in a cache bounded with a least
+    recently used policy. The matrices of other gates are not cached, they are
+    computed by :meth:`~qiskit.circuit.Gate.to_matrix` on every lookup.
+
+    The cached matrices are read-only arrays, shared by all the users of the
+    cache, which must not modify them.
+
+    The :data:`SessionGateMatrixCache` instance is shared by
+    :class:`~qiskit.quantum_info.Operator`,
+    :class:`~qiskit.quantum_info.Statevector`,
+    :class:`~qiskit.quantum_info.DensityMatrix` (and through them by the
+    :class:`~qiskit.transpiler.passes.ConsolidateBlocks` and
+    :class:`~qiskit.transpiler.passes.CommutationAnalysis` passes), the
+    BasicAer simulators and the synthesis routines.
+    """
+
+    def __init__(self, maxsize=2 ** 12):
+        """Create a gate matrix cache.
+
+        Args:
+            maxsize (int): maximum number of cached matrices of parameterized
+                gates.
+        """
+        self._maxsize = maxsize
+        self._constants = {}
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def matrix(self, gate):
+        """Return the matrix of a gate.
+
+        Args:
+            gate (Gate): the gate.
+
+        Returns:
+            np.ndarray: the matrix of the gate, which must not be modified.
+
+        Raises:
+            CircuitError: if the gate has no matrix definition.
+        """
+        key = _matrix_key(gate)
+        if key is None:
+            return gate.to_matrix()
+        try:
+            hash(key)
+        except TypeError:
+            # Unhashable parameters
+            return gate.to_matrix()
+
+        cache = self._cache if key[-1] else self._constants
+        with self._lock:
+            matrix = cache.get(key)
+            if matrix is not None:
+                if cache is self._cache:
+                    cache.move_to_end(key)
+                self._hits += 1
+                return matrix
+        matrix = np.ascontiguousarray(gate.to_matrix(), dtype=complex)
+        matrix.setflags(write=False)
+        with self._lock:
+            self._misses += 1
+            cache[key] = matrix
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+        return matrix
+
+    def cache_info(self):
+        """Return the statistics of the cache.
+
+        Returns:
+            dict: the numbers of ``hits`` and ``misses`` of the cache, the
+            number ``constants`` of cached matrices of gates without parameters,
+            and the current and maximum numbers ``currsize`` and ``maxsize`` of
+            cached matrices of parameterized gates.
+        """
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses,
+                    'constants': len(self._constants), 'currsize': len(self._cache),
+                    'maxsize': self._maxsize}
+
+    def clear_cache(self):
+        """Clear the cached matrices and their statistics."""
+        with self._lock:
+            self._constants.clear()
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+def _matrix_key(gate):
+    """Return a key identifying the matrix of a standard gate, or ``None`` for
+    the other gates and the standard gates without a matrix definition. The
+    parameters of the gate are the last item of the key.
+    """
+    if not type(gate).__module__.startswith(_STANDARD_GATES_MODULE) or \
+            not hasattr(gate, '__array__'):
+        return None
+    return (type(gate), gate.num_qubits, getattr(gate, 'num_ctrl_qubits', None),
+            getattr(gate, 'ctrl_state', None), tuple(gate.params))
+
+
+SessionGateMatrixCache = GateMatrixCache()
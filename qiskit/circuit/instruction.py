@@ -39,7 +39,6 @@ import numpy
 from qiskit.circuit.exceptions import CircuitError
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
-from qiskit.qobj.qasm_qobj import QasmQobjInstruction
 from qiskit.circuit.parameter import ParameterExpression
 from .tools import pi_check
 
@@ -250,6 +249,9 @@ class Instruction:
 
     def assemble(self):
         """Assemble a QasmQobjInstruction"""
+        # pylint: disable=cyclic-import
+        from qiskit.qobj.qasm_qobj import QasmQobjInstruction
+
         instruction = QasmQobjInstruction(name=self.name)
         # Evaluate parameters
         if self.params:
@@ -15,7 +15,6 @@
 from typing import Optional, Union
 
 import numpy as np
-from qiskit.quantum_info.random import random_unitary
 from qiskit.circuit import QuantumCircuit
 from qiskit.circuit.library.generalized_gates.permutation import Permutation
 
@@ -82,6 +81,10 @@ class QuantumVolume(QuantumCircuit):
 
         # Parameters
         depth = depth or num_qubits  # how many layers of SU(4)
+        # Importing quantum_info with the circuit library would slow down `import qiskit`
+        # pylint: disable=cyclic-import
+        from qiskit.quantum_info.random import random_unitary
+
         width = int(np.floor(num_qubits/2))  # how many SU(4)s fit in each layer
         name = "quantum_volume_" + str([num_qubits, depth, seed]).replace(' ', '')
         super().__init__(num_qubits, name=name)
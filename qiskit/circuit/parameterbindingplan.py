@@ -0,0 +1,204 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""
+Precompiled plan to bind many sets of values to a parameterized circuit.
+"""
+import copy
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .exceptions import CircuitError
+from .instruction import Instruction
+from .parameterexpression import ParameterExpression
+from .parametertable import ParameterTable
+
+
+class ParameterBindingPlan:
+    """Binding plan of a parameterized circuit, for binding many sets of values.
+
+    Binding values with :meth:`.QuantumCircuit.bind_parameters` copies the whole
+    circuit and substitutes the values in every parameter expression
+    symbolically, for every set of values. A binding plan analyzes the circuit
+    once: it records which instruction parameters (and whether the global
+    phase) depend on the circuit parameters and compiles each of these
+    expressions to a numeric function. :meth:`bind_many` then evaluates the
+    expressions for all the sets of values at once and builds the bound
+    circuits, copying only the parameterized instructions.
+
+    The unparameterized instructions of the bound circuits are shared with the
+    original circuit, so they should not be modified in place.
+
+    Example::
+
+        from qiskit.circuit import ParameterBindingPlan
+
+        plan = ParameterBindingPlan(transpiled_ansatz)
+        values = np.random.random((1000, len(plan.parameters)))
+        bound_circuits = plan.bind_many(values)
+    """
+
+    def __init__(self, circuit, parameters: Optional[Iterable] = None):
+        """Create a binding plan for ``circuit``.
+
+        Args:
+            circuit (QuantumCircuit): The parameterized circuit. It must not be
+                modified after the plan has been created.
+            parameters (Iterable[Parameter]): Order of the parameters in the
+                rows of values given to :meth:`bind_many`. Defaults to the
+                circuit parameters sorted by name.
+
+        Raises:
+            CircuitError: If ``parameters`` does not match the circuit
+                parameters, or the circuit has parameterized calibrations.
+        """
+        if parameters is None:
+            parameters = sorted(circuit.parameters, key=lambda param: param.name)
+        else:
+            parameters = list(circuit._unroll_param_dict({p: p for p in parameters}))
+            if set(parameters) != circuit.parameters or len(parameters) != len(set(parameters)):
+                raise CircuitError('The parameters of the binding plan ({}) must be the '
+                                   'circuit parameters ({}).'.format(
+                                       [str(p) for p in parameters],
+                                       [str(p) for p in circuit.parameters]))
+        for cals in circuit.calibrations.values():
+            for _, cal_params in cals:
+                if any(isinstance(p, ParameterExpression) and p.parameters for p in cal_params):
+                    raise CircuitError('Binding plans do not support parameterized '
+                                       'calibrations.')
+
+        self._circuit = circuit
+        self._parameters = parameters
+        positions = {param: idx for idx, param in enumerate(parameters)}
+
+        # Positions in circuit.data of every parameterized instruction, and for
+        # each of them the (param_index, function, parameter positions) slots.
+        data_positions = {}
+        for idx, (instr, _, _) in enumerate(circuit.data):
+            data_positions.setdefault(id(instr), []).append(idx)
+        slots = {}
+        for param in parameters:
+            for instr, param_index in circuit._parameter_table[param]:
+                instr_slots = slots.setdefault(id(instr), {})
+                if param_index not in instr_slots:
+                    instr_slots[param_index] = _compile(instr.params[param_index], positions)
+        self._instructions = [(data_positions[instr_id], sorted(instr_slots.items()))
+                              for instr_id, instr_slots in slots.items()]
+
+        if isinstance(circuit.global_phase, ParameterExpression) and \
+                circuit.global_phase.parameters:
+            self._global_phase = _compile(circuit.global_phase, positions)
+        else:
+            self._global_phase = None
+
+    @property
+    def parameters(self) -> List:
+        """The circuit parameters, in the order of the values given to :meth:`bind_many`."""
+        return list(self._parameters)
+
+    def bind_many(self, values) -> List:
+        """Bind every row of ``values`` to the circuit.
+
+        Args:
+            values (np.ndarray): Array of shape ``(num_binds, num_parameters)``
+                where each row holds the values of :attr:`parameters`.
+
+        Returns:
+            list[QuantumCircuit]: The ``num_binds`` bound circuits.
+
+        Raises:
+            CircuitError: If ``values`` does not have the right shape, or a bound
+                expression is complex.
+        """
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 2 or values.shape[1] != len(self._parameters):
+            raise CircuitError('Expected values of shape (num_binds, {}), got {}.'.format(
+                len(self._parameters), values.shape))
+        num_binds = values.shape[0]
+
+        # Evaluate every expression for all the binds at once.
+        instructions = [(data_idxs, [(param_index, _evaluate(function, values, num_binds))
+                                     for param_index, function in instr_slots])
+                        for data_idxs, instr_slots in self._instructions]
+        if self._global_phase is not None:
+            global_phases = _evaluate(self._global_phase, values, num_binds)
+
+        circuit = self._circuit
+        bound_circuits = []
+        for bind in range(num_binds):
+            parameter_values = None
+            bound = copy.copy(circuit)
+            bound.qregs = circuit.qregs.copy()
+            bound.cregs = circuit.cregs.copy()
+            bound._qubits = circuit._qubits.copy()
+            bound._clbits = circuit._clbits.copy()
+            bound._calibrations = copy.deepcopy(circuit._calibrations)
+            bound._parameter_table = ParameterTable()
+            bound._data = data = circuit._data.copy()
+            for data_idxs, instr_slots in instructions:
+                instr = data[data_idxs[0]][0]
+                new_instr = _copy_instruction(instr)
+                for param_index, param_values in instr_slots:
+                    new_instr.params[param_index] = \
+                        new_instr.validate_parameter(param_values[bind])
+                if new_instr._definition is not None:
+                    if parameter_values is None:
+                        parameter_values = dict(zip(self._parameters, values[bind].tolist()))
+                    _bind_definition(new_instr, instr, parameter_values)
+                for idx in data_idxs:
+                    _, qargs, cargs = data[idx]
+                    data[idx] = (new_instr, qargs, cargs)
+            if self._global_phase is not None:
+                bound.global_phase = global_phases[bind]
+            bound_circuits.append(bound)
+        return bound_circuits
+
+
+def _compile(expression, positions):
+    """Compile a parameter expression to a numeric function of the plan values.
+
+    Returns:
+        tuple: the function and the positions of its arguments in the values.
+    """
+    params = sorted(expression.parameters, key=lambda param: positions[param])
+    return expression._numeric_function(params), [positions[param] for param in params]
+
+
+def _evaluate(compiled, values, num_binds):
+    """Evaluate a compiled expression for every row of ``values``, as floats."""
+    function, columns = compiled
+    result = np.broadcast_to(function(*values[:, columns].T), (num_binds,))
+    if np.iscomplexobj(result):
+        if np.any(np.abs(result.imag) > 1e-10):
+            raise CircuitError('Bound parameter expression is complex.')
+        result = result.real
+    return result.tolist()
+
+
+def _copy_instruction(instr):
+    """Copy an instruction, without copying its definition."""
+    cpy = copy.copy(instr)
+    cpy._params = copy.copy(instr._params)
+    return cpy
+
+
+def _bind_definition(new_instr, instr, parameter_values):
+    """Set the definition of the bound copy ``new_instr`` of ``instr``."""
+    if type(instr)._define is not Instruction._define:
+        # The definition is built from the parameters, rebuild it on demand.
+        new_instr._definition = None
+        return
+    # Custom instruction, its definition refers to the circuit parameters.
+    definition = copy.deepcopy(instr._definition)
+    definition.assign_parameters({param: parameter_values[param]
+                                  for param in definition.parameters}, inplace=True)
+    new_instr._definition = definition
@@ -14,6 +14,7 @@ ParameterExpression Class to enable creating simple expressions of Parameters.
 """
 from typing import Callable, Dict, Set, Union
 
+import functools
 import numbers
 import operator
 
@@ -23,6 +24,30 @@ from qiskit.circuit.exceptions import CircuitError
 
 ParameterValueType = Union['ParameterExpression', float, int]
 
+# Compiling an expression to a numeric function costs about as much as ten
+# symbolic substitutions, so scalar evaluations of an expression are only
+# compiled once the expression has been evaluated this many times.
+_COMPILE_THRESHOLD = 4
+_EVALUATION_COUNTS = {}
+_EVALUATION_COUNTS_SIZE = 10000
+
+
+@functools.lru_cache(maxsize=4096)
+def _numeric_function(symbol_expr, symbols):
+    """Compile a sympy expression to a numpy function of ``symbols``.
+
+    The functions are shared by all the equal expressions.
+    """
+    import sympy
+    return sympy.lambdify(symbols, symbol_expr, modules='numpy')
+
+
+@functools.lru_cache(maxsize=4096)
+def _derivative(symbol_expr, symbol):
+    """Symbolic derivative of a sympy expression, shared by all the equal expressions."""
+    import sympy
+    return sympy.Derivative(symbol_expr, symbol).doit()
+
 
 class ParameterExpression:
     """ParameterExpression class to enable creating expressions of Parameters."""
@@ -115,6 +140,74 @@ class ParameterExpression:
 
         return ParameterExpression(free_parameter_symbols, bound_symbol_expr)
 
+    def evaluate(self, parameter_values: Dict) -> Union[float, complex, numpy.ndarray]:
+        """Numerically evaluate the expression.
+
+        Unlike :meth:`bind`, no intermediate symbolic expression is created: the
+        expression is compiled to a numpy function, which is cached and shared
+        by all the equal expressions. Arrays of values are evaluated at once.
+
+        Args:
+            parameter_values: Mapping of every Parameter of the expression to
+                its numeric value, or to an array of values. Arrays are
+                broadcast against each other.
+
+        Raises:
+            CircuitError:
+                - If parameter_values contains Parameters outside those in self.
+                - If parameter_values does not contain every Parameter in self.
+            ZeroDivisionError:
+                - If evaluating the expression requires division by zero.
+
+        Returns:
+            The value of the expression, as a float if it is real and a complex
+            otherwise, or an array of values if arrays were given.
+        """
+        self._raise_if_passed_unknown_parameters(parameter_values.keys())
+        unbound_parameters = self.parameters - parameter_values.keys()
+        if unbound_parameters:
+            raise CircuitError('Cannot evaluate expression with unbound parameters '
+                               '{}.'.format([str(p) for p in unbound_parameters]))
+
+        if not self.parameters:
+            value = complex(self)
+            return value.real if value.imag == 0 else value
+
+        parameters = sorted(self.parameters, key=lambda param: param.name)
+        values = [parameter_values[param] for param in parameters]
+        if not any(isinstance(value, (numpy.ndarray, list, tuple)) for value in values):
+            key = (self._symbol_expr, tuple(parameters))
+            count = _EVALUATION_COUNTS.get(key, 0)
+            if count < _COMPILE_THRESHOLD:
+                if len(_EVALUATION_COUNTS) > _EVALUATION_COUNTS_SIZE:
+                    _EVALUATION_COUNTS.clear()
+                _EVALUATION_COUNTS[key] = count + 1
+                bound = self.bind(dict(zip(parameters, values)))
+                value = complex(bound)
+                return value.real if value.imag == 0 else value
+
+        function = self._numeric_function(parameters)
+        with numpy.errstate(divide='ignore', invalid='ignore'):
+            try:
+                result = function(*values)
+            except ZeroDivisionError as error:
+                raise ZeroDivisionError('Evaluating expression {} with {} results in '
+                                        'division by zero.'.format(self, parameter_values)) \
+                    from error
+        shape = numpy.broadcast(*values).shape
+        result = numpy.broadcast_to(result, shape) if shape else numpy.asarray(result)
+        if numpy.any(numpy.isinf(result)):
+            raise ZeroDivisionError('Evaluating expression {} with {} results in '
+                                    'division by zero.'.format(self, parameter_values))
+        if numpy.iscomplexobj(result) and not numpy.any(result.imag):
+            result = result.real
+        return result if shape else result.item()
+
+    def _numeric_function(self, parameters):
+        """Numpy function evaluating the expression, taking ``parameters`` as arguments."""
+        symbols = tuple(self._parameter_symbols[param] for param in parameters)
+        return _numeric_function(self._symbol_expr, symbols)
+
     def subs(self,
              parameter_map: Dict) -> 'ParameterExpression':
         """Returns a new Expression with replacement Parameters.
@@ -248,10 +341,9 @@ class ParameterExpression:
             return 0.0
 
         # Compute the gradient of the parameter expression w.r.t. param
-        import sympy as sy
         key = self._parameter_symbols[param]
         # TODO enable nth derivative
-        expr_grad = sy.Derivative(self._symbol_expr, key).doit()
+        expr_grad = _derivative(self._symbol_expr, key)
 
         # generate the new dictionary of symbols
         # this needs to be done since in the derivative some symbols might disappear (e.g.
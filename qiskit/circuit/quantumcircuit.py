@@ -188,6 +188,7 @@ class QuantumCircuit:
         self._parameter_table = ParameterTable()
 
         self._layout = None
+        self._final_layout = None
         self._global_phase = 0
         self.global_phase = global_phase
 
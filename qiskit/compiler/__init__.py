@@ -28,9 +28,18 @@ Circuit and Pulse Compilation Functions
    transpile
    sequence
 
+Transpilation Cache
+===================
+
+.. autosummary::
+   :toctree: ../stubs/
+
+   TranspileCache
+
 """
 
 from .assemble import assemble
 from .transpile import transpile
+from .transpile_cache import TranspileCache
 from .schedule import schedule
 from .sequence import sequence
@@ -61,6 +61,7 @@ def assemble(experiments: Union[QuantumCircuit, List[QuantumCircuit], Schedule,
              parameter_binds: Optional[List[Dict[Parameter, float]]] = None,
              parametric_pulses: Optional[List[str]] = None,
              init_qubits: bool = True,
+             columnar: bool = False,
              **run_config: Dict) -> Qobj:
     """Assemble a list of circuits or pulse schedules into a ``Qobj``.
 
@@ -122,6 +123,10 @@ def assemble(experiments: Union[QuantumCircuit, List[QuantumCircuit], Schedule,
             ['gaussian', 'constant']
         init_qubits: Whether to reset the qubits to the ground state for each shot.
                      Default: ``True``.
+        columnar: Whether to assemble circuits into
+            :class:`~qiskit.qobj.ColumnarQasmQobjExperiment` experiments, which
+            store their instructions in numpy arrays instead of
+            :class:`~qiskit.qobj.QasmQobjInstruction` objects. Default: ``False``.
         **run_config: Extra arguments used to configure the run (e.g., for Aer configurable
             backends). Refer to the backend documentation for details on these
             arguments.
@@ -152,7 +157,8 @@ def assemble(experiments: Union[QuantumCircuit, List[QuantumCircuit], Schedule,
         end_time = time()
         _log_assembly_time(start_time, end_time)
         return assemble_circuits(circuits=bound_experiments, qobj_id=qobj_id,
-                                 qobj_header=qobj_header, run_config=run_config)
+                                 qobj_header=qobj_header, run_config=run_config,
+                                 columnar=columnar)
 
     elif all(isinstance(exp, (Schedule, Instruction)) for exp in experiments):
         run_config = _parse_pulse_args(backend, qubit_lo_freq, meas_lo_freq,
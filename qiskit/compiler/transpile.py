@@ -17,9 +17,10 @@ from time import time
 from typing import List, Union, Dict, Callable, Any, Optional, Tuple
 
 from qiskit import user_config
-from qiskit.circuit import Delay
+from qiskit.circuit import Barrier, Delay
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.quantumregister import Qubit
+from qiskit.compiler.transpile_cache import TranspileCache
 from qiskit.converters import isinstanceint, isinstancelist, dag_to_circuit, circuit_to_dag
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers import BaseBackend
@@ -59,8 +60,10 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
               pass_manager: Optional[PassManager] = None,
               callback: Optional[Callable[[BasePass, DAGCircuit, float,
                                            PropertySet, int], Any]] = None,
-              output_name: Optional[Union[str, List[str]]] = None) -> Union[QuantumCircuit,
-                                                                            List[QuantumCircuit]]:
+              output_name: Optional[Union[str, List[str]]] = None,
+              cache: Optional[TranspileCache] = None,
+              append_to: Optional[Union[QuantumCircuit, List[QuantumCircuit]]] = None
+              ) -> Union[QuantumCircuit, List[QuantumCircuit]]:
     """Transpile one or more circuits, according to some desired transpilation targets.
 
     All arguments may be given as either a singleton or list. In case of a list,
@@ -182,6 +185,27 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
 
         output_name: A list with strings to identify the output circuits. The length of
             the list should be exactly the length of the ``circuits`` parameter.
+        cache: A :class:`~qiskit.compiler.TranspileCache` used to look up
+            circuits transpiled before with the same options, and to store the
+            newly transpiled ones. If ``None``, no caching is done.
+        append_to: Previously transpiled circuit(s) to extend with ``circuits``.
+            Instead of transpiling the whole extended circuit again, only the
+            appended circuits are transpiled, starting from the layout the
+            qubits have at the end of ``append_to``, and the result is
+            composed onto ``append_to``. The appended circuits must act on
+            the (virtual) qubits of the original circuits, and be transpiled
+            with the same target as ``append_to``. Their classical registers
+            missing from ``append_to`` are added to the result. A barrier is
+            inserted at the start of every appended circuit, as the
+            transpiler must not assume its qubits are in their initial state.
+            Note that at ``optimization_level=3`` the swaps before the final
+            measurements of a circuit are removed, so circuits meant to be
+            extended should be transpiled at a lower level.
+
+            For example, for a circuit built and run in segments::
+
+                transpiled = transpile(first_segment, backend)
+                transpiled = transpile(second_segment, backend, append_to=transpiled)
 
     Returns:
         The transpiled circuit(s).
@@ -218,6 +242,21 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
                       " pass_manager.run(circuit)", DeprecationWarning, stacklevel=2)
         return pass_manager.run(circuits, output_name=output_name, callback=callback)
 
+    if append_to is not None:
+        append_to = append_to if isinstance(append_to, list) else [append_to]
+        if len(append_to) != len(circuits):
+            raise TranspilerError("The number of circuits to append to ({}) does not match "
+                                  "the number of circuits ({}).".format(len(append_to),
+                                                                         len(circuits)))
+        if initial_layout is not None:
+            raise TranspilerError("The initial_layout of appended circuits is given by the "
+                                  "final layout of the circuits they are appended to.")
+        initial_layout = [_appended_initial_layout(circuit, prefix)
+                          for circuit, prefix in zip(circuits, append_to)]
+        if all(layout is None for layout in initial_layout):
+            initial_layout = None
+        circuits = [_with_leading_barrier(circuit) for circuit in circuits]
+
     if optimization_level is None:
         # Take optimization level from the configuration or 1 as default.
         config = user_config.get_config()
@@ -237,9 +276,19 @@ def transpile(circuits: Union[QuantumCircuit, List[QuantumCircuit]],
                                            callback, output_name)
 
     _check_circuits_coupling_map(circuits, transpile_args, backend)
+    if append_to is not None and any(args['faulty_qubits_map'] for args in transpile_args):
+        raise TranspilerError("Appending to transpiled circuits is not supported for "
+                              "backends with faulty qubits.")
 
     # Transpile circuits in parallel
-    circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_args)))
+    if cache is None:
+        circuits = parallel_map(_transpile_circuit, list(zip(circuits, transpile_args)))
+    else:
+        circuits = _transpile_with_cache(circuits, transpile_args, cache)
+
+    if append_to is not None:
+        circuits = [_append_transpiled(prefix, circuit, output_name is not None)
+                    for prefix, circuit in zip(append_to, circuits)]
 
     end_time = time()
     _log_transpile_time(start_time, end_time)
@@ -284,6 +333,92 @@ def _log_transpile_time(start_time, end_time):
     LOG.info(log_msg)
 
 
+def _final_virtual_layout(circuit):
+    """Return the physical qubit of every virtual qubit at the end of ``circuit``."""
+    positions = circuit._layout.get_virtual_bits()
+    final_layout = circuit._final_layout
+    if final_layout is None:
+        return positions
+    physical_qubits = circuit.qubits
+    return {virtual: final_layout[physical_qubits[physical]]
+            for virtual, physical in positions.items()}
+
+
+def _appended_initial_layout(circuit, prefix):
+    """Initial layout of ``circuit`` when it is appended to the transpiled ``prefix``."""
+    if prefix._layout is None:
+        return None
+    positions = _final_virtual_layout(prefix)
+    missing = [qubit for qubit in circuit.qubits if qubit not in positions]
+    if missing:
+        raise TranspilerError("The qubits {} of the appended circuit {} are not qubits of the "
+                              "circuit it is appended to.".format(missing, circuit.name))
+    return {qubit: positions[qubit] for qubit in circuit.qubits}
+
+
+def _with_leading_barrier(circuit):
+    """Return a copy of ``circuit`` starting with a barrier on all its qubits."""
+    if not circuit.qubits:
+        return circuit
+    circuit = circuit.copy()
+    circuit.data.insert(0, (Barrier(circuit.num_qubits), circuit.qubits, []))
+    return circuit
+
+
+def _append_transpiled(prefix, circuit, keep_name):
+    """Compose the transpiled ``circuit`` onto the transpiled ``prefix``."""
+    qubit_indices = {qubit: idx for idx, qubit in enumerate(prefix.qubits)}
+    if any(qubit not in qubit_indices for qubit in circuit.qubits):
+        raise TranspilerError("The appended circuit {} was not transpiled to the qubits of the "
+                              "circuit it is appended to.".format(circuit.name))
+    result = prefix.copy()
+    for creg in circuit.cregs:
+        if creg not in result.cregs:
+            result.add_register(creg)
+    clbit_indices = {clbit: idx for idx, clbit in enumerate(result.clbits)}
+    if any(clbit not in clbit_indices for clbit in circuit.clbits):
+        raise TranspilerError("The appended circuit {} has classical bits which are not in "
+                              "the circuit it is appended to.".format(circuit.name))
+    result.compose(circuit,
+                   qubits=[qubit_indices[qubit] for qubit in circuit.qubits],
+                   clbits=[clbit_indices[clbit] for clbit in circuit.clbits],
+                   inplace=True)
+    if keep_name:
+        result.name = circuit.name
+    # The appended circuit starts where the prefix ends: chain the permutations.
+    if prefix._final_layout is None:
+        result._final_layout = circuit._final_layout
+    elif circuit._final_layout is not None:
+        physical_qubits = result.qubits
+        result._final_layout = Layout({
+            qubit: circuit._final_layout[physical_qubits[physical]]
+            for qubit, physical in prefix._final_layout.get_virtual_bits().items()})
+    return result
+
+
+def _transpile_with_cache(circuits, transpile_args, cache):
+    """Transpile in parallel the circuits missing from ``cache`` and store them."""
+    keys = [TranspileCache.key(circuit, args) for circuit, args in zip(circuits, transpile_args)]
+    results = [None] * len(circuits)
+    missing = []
+    for idx, key in enumerate(keys):
+        cached = cache.get(key) if key is not None else None
+        if cached is None:
+            missing.append(idx)
+        else:
+            # The key ignores the circuit name and metadata, restore them.
+            results[idx] = cached.copy(name=transpile_args[idx]['output_name'])
+            results[idx].metadata = circuits[idx].metadata
+
+    transpiled = parallel_map(_transpile_circuit,
+                              [(circuits[idx], transpile_args[idx]) for idx in missing])
+    for idx, circuit in zip(missing, transpiled):
+        if keys[idx] is not None:
+            cache.put(keys[idx], circuit.copy())
+        results[idx] = circuit
+    return results
+
+
 def _transpile_circuit(circuit_config_tuple: Tuple[QuantumCircuit, Dict]) -> QuantumCircuit:
     """Select a PassManager and run a single circuit through it.
     Args:
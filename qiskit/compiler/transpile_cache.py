@@ -0,0 +1,318 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Cache of transpiled circuits keyed by circuit structure and target."""
+
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+from qiskit.version import __version__
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.transpiler.coupling import CouplingMap
+from qiskit.transpiler.layout import Layout
+
+LOG = logging.getLogger(__name__)
+
+
+class TranspileCache:
+    """Cache of transpiled circuits for :func:`~qiskit.compiler.transpile`.
+
+    The circuits are keyed by a structural hash of the input circuit (its
+    registers, instructions, parameters and global phase, but not its name or
+    metadata) and of the transpilation target (basis gates, coupling map,
+    backend properties, initial layout, the layout, routing, translation and
+    scheduling methods, instruction durations, seed and optimization level).
+    Recently used circuits are kept in memory, and if a ``cache_dir`` is given
+    every transpiled circuit is also stored on disk, so it can be reused by
+    other processes.
+
+    The backend properties are identified by their backend name, version and
+    last update date. If the calibration data changes without those being
+    updated, the stale entries must be dropped with :meth:`invalidate` or
+    :meth:`clear`.
+
+    Circuits with pulse calibrations and calls to ``transpile`` with a
+    ``callback`` are never cached. Note that for calls without a
+    ``seed_transpiler`` the same (randomized) result is returned on every hit.
+
+    Example::
+
+        from qiskit.compiler import transpile, TranspileCache
+
+        cache = TranspileCache(max_size=256)
+        for _ in range(100):
+            transpiled = transpile(circuit, backend, cache=cache)
+        print(cache.stats)
+    """
+
+    def __init__(self, max_size: int = 128, cache_dir: Optional[str] = None):
+        """Create a new transpile cache.
+
+        Args:
+            max_size: Maximum number of transpiled circuits kept in memory.
+            cache_dir: If set, directory where the transpiled circuits are also
+                stored on disk. It is created if it does not exist.
+        """
+        self.max_size = max_size
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Usage statistics of the cache.
+
+        Returns:
+            dict: with the number of ``hits`` (including the ``disk_hits``
+            served from ``cache_dir``), ``misses`` and the current ``size`` of
+            the in-memory cache.
+        """
+        return {'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'size': len(self._entries)}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove every entry of the cache, including the ones on disk."""
+        self._entries.clear()
+        if self.cache_dir is not None:
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith('.pickle'):
+                    os.remove(os.path.join(self.cache_dir, filename))
+
+    def invalidate(self, backend_name: Optional[str] = None):
+        """Drop the entries transpiled against the properties of a backend.
+
+        This must be called when the calibration data of a backend changes
+        without its ``last_update_date`` being updated. The entries stored on
+        disk for that backend are removed as well.
+
+        Args:
+            backend_name: Name of the backend whose entries are dropped. If
+                ``None``, every entry of the cache is dropped.
+        """
+        if backend_name is None:
+            self.clear()
+            return
+        # Match the whole key, the name of another backend may start with the
+        # prefix (e.g. ``fake`` and ``fake-backend``).
+        pattern = re.compile(re.escape(_backend_prefix(backend_name)) + '[0-9a-f]{64}')
+        for key in [key for key in self._entries if pattern.fullmatch(key)]:
+            del self._entries[key]
+        if self.cache_dir is not None:
+            for filename in os.listdir(self.cache_dir):
+                if filename.endswith('.pickle') and pattern.fullmatch(filename[:-7]):
+                    os.remove(os.path.join(self.cache_dir, filename))
+
+    def get(self, key: str) -> Optional[QuantumCircuit]:
+        """Look up a transpiled circuit.
+
+        Args:
+            key: Key computed by :meth:`key`.
+
+        Returns:
+            QuantumCircuit: the cached circuit, or ``None`` if not found.
+        """
+        circuit = self._entries.get(key)
+        if circuit is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return circuit
+        if self.cache_dir is not None:
+            try:
+                with open(self._path(key), 'rb') as fd:
+                    circuit = pickle.load(fd)
+            except FileNotFoundError:
+                pass
+            except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as error:
+                LOG.warning("Ignoring unreadable transpile cache entry %s: %s", key, error)
+            else:
+                self._hits += 1
+                self._disk_hits += 1
+                self._store_in_memory(key, circuit)
+                return circuit
+        self._misses += 1
+        return None
+
+    def put(self, key: str, circuit: QuantumCircuit):
+        """Store a transpiled circuit.
+
+        Args:
+            key: Key computed by :meth:`key`.
+            circuit: The transpiled circuit.
+        """
+        self._store_in_memory(key, circuit)
+        if self.cache_dir is not None:
+            self._store_on_disk(key, circuit)
+
+    def _store_on_disk(self, key, circuit):
+        # Storing on disk is best effort: the circuit may not be picklable (e.g.
+        # through its metadata) or the directory may be full or removed, which
+        # must not fail the transpilation.
+        tmp_path = None
+        try:
+            # Write atomically, other processes may read the same directory.
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as tmp_file:
+                pickle.dump(circuit, tmp_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+            LOG.debug("Not storing transpile cache entry %s on disk: %s", key, error)
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _store_in_memory(self, key, circuit):
+        self._entries[key] = circuit
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.pickle')
+
+    @staticmethod
+    def key(circuit: QuantumCircuit, transpile_config: Dict) -> Optional[str]:
+        """Compute the cache key of a circuit and its transpilation config.
+
+        Args:
+            circuit: The circuit to transpile.
+            transpile_config: The transpilation config of the circuit, as built
+                by ``transpile``.
+
+        Returns:
+            str: the key, or ``None`` if the circuit can not be cached.
+        """
+        if circuit.calibrations or transpile_config['callback'] is not None:
+            return None
+        pm_config = transpile_config['pass_manager_config']
+        faulty_qubits_map = transpile_config['faulty_qubits_map']
+        target = (
+            tuple(pm_config.basis_gates) if pm_config.basis_gates is not None else None,
+            _coupling_map_key(pm_config.coupling_map),
+            _backend_properties_key(pm_config.backend_properties),
+            _layout_key(pm_config.initial_layout),
+            pm_config.layout_method,
+            pm_config.routing_method,
+            pm_config.translation_method,
+            pm_config.scheduling_method,
+            _durations_key(pm_config.instruction_durations),
+            pm_config.seed_transpiler,
+            transpile_config['optimization_level'],
+            transpile_config['backend_num_qubits'],
+            tuple(sorted(faulty_qubits_map.items())) if faulty_qubits_map else None,
+        )
+        digest = hashlib.sha256(repr((__version__, _circuit_key(circuit), target)).encode())
+        # Prefix the keys with the backend name, for selective invalidation.
+        if pm_config.backend_properties is not None:
+            return _backend_prefix(pm_config.backend_properties.backend_name) + \
+                digest.hexdigest()
+        return digest.hexdigest()
+
+
+def _backend_prefix(backend_name):
+    return backend_name.replace(os.sep, '_') + '-'
+
+
+def _register_key(register):
+    return (type(register).__name__, register.name, register.size)
+
+
+def _bit_key(bit):
+    return (_register_key(bit.register), bit.index)
+
+
+def _param_key(param):
+    if isinstance(param, ParameterExpression):
+        # Parameters are identified by their uuid, so that a cached circuit is
+        # only returned for circuits containing the very same parameters.
+        return (str(param), tuple(sorted(str(p._uuid) for p in param.parameters)))
+    if isinstance(param, np.ndarray):
+        return (param.shape, param.dtype.str, param.tobytes())
+    if isinstance(param, QuantumCircuit):
+        return _circuit_key(param)
+    return repr(param)
+
+
+def _instruction_key(instruction):
+    condition = instruction.condition
+    if condition is not None:
+        condition = (_register_key(condition[0]), condition[1])
+    definition = None
+    # The definition of library gates is fixed by their class, the one of
+    # custom instructions is part of their structure.
+    if instruction._definition is not None and \
+            not type(instruction).__module__.startswith(('qiskit.circuit.library',
+                                                        'qiskit.extensions')):
+        definition = _circuit_key(instruction._definition)
+    return (type(instruction).__module__, type(instruction).__qualname__,
+            instruction.name, instruction.num_qubits, instruction.num_clbits,
+            tuple(_param_key(param) for param in instruction.params),
+            condition, definition)
+
+
+def _circuit_key(circuit):
+    qubit_indices = {bit: idx for idx, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: idx for idx, bit in enumerate(circuit.clbits)}
+    return (tuple(_register_key(reg) for reg in circuit.qregs),
+            tuple(_register_key(reg) for reg in circuit.cregs),
+            _param_key(circuit.global_phase),
+            tuple((_instruction_key(instruction),
+                   tuple(qubit_indices[qubit] for qubit in qargs),
+                   tuple(clbit_indices[clbit] for clbit in cargs))
+                  for instruction, qargs, cargs in circuit.data))
+
+
+def _coupling_map_key(coupling_map):
+    if isinstance(coupling_map, CouplingMap):
+        return tuple(sorted(coupling_map.get_edges()))
+    return None
+
+
+def _backend_properties_key(backend_properties):
+    if backend_properties is None:
+        return None
+    return (backend_properties.backend_name, backend_properties.backend_version,
+            str(backend_properties.last_update_date))
+
+
+def _layout_key(layout):
+    if isinstance(layout, Layout):
+        return tuple(sorted((physical, _bit_key(virtual))
+                            for physical, virtual in layout.get_physical_bits().items()))
+    return None
+
+
+def _durations_key(durations):
+    if durations is None:
+        return None
+    return (durations.dt,
+            tuple(sorted(durations.duration_by_name.items())),
+            tuple(sorted(durations.duration_by_name_qubits.items())))
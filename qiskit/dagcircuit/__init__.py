@@ -25,6 +25,7 @@ DAG Circuits
 
    DAGCircuit
    DAGNode
+   DAGLayer
    DAGDepNode
    DAGDependency
 
@@ -38,6 +39,7 @@ Exceptions
 """
 from .dagcircuit import DAGCircuit
 from .dagnode import DAGNode
+from .daglayer import DAGLayer
 from .dagdepnode import DAGDepNode
 from .exceptions import DAGCircuitError
 from .dagdependency import DAGDependency
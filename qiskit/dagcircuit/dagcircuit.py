@@ -34,6 +34,7 @@ from qiskit.circuit.gate import Gate
 from qiskit.circuit.parameterexpression import ParameterExpression
 from qiskit.dagcircuit.exceptions import DAGCircuitError
 from qiskit.dagcircuit.dagnode import DAGNode
+from qiskit.dagcircuit.daglayer import DAGLayer
 
 
 class DAGCircuit:
@@ -364,23 +365,30 @@ class DAGCircuit:
         qargs = qargs or []
         cargs = cargs or []
 
-        all_cbits = self._bits_in_condition(op.condition)
-        all_cbits = set(all_cbits).union(cargs)
+        if op.condition is None and not cargs:
+            all_cbits = ()
+        else:
+            all_cbits = self._bits_in_condition(op.condition)
+            all_cbits = set(all_cbits).union(cargs)
+            self._check_condition(op.name, op.condition)
 
-        self._check_condition(op.name, op.condition)
-        self._check_bits(qargs, self.output_map)
-        self._check_bits(all_cbits, self.output_map)
+        # Resolve the wires to the indices of their output nodes, which also
+        # checks they are in the circuit
+        output_map = self.output_map
+        try:
+            output_ids = [output_map[wire]._node_id
+                          for wire in itertools.chain(qargs, all_cbits)]
+        except KeyError:
+            self._check_bits(qargs, output_map)
+            self._check_bits(all_cbits, output_map)
+            raise
 
         node_index = self._add_op_node(op, qargs, cargs)
 
         # Add new in-edges from predecessors of the output nodes to the
         # operation node while deleting the old in-edges of the output nodes
         # and adding new edges from the operation node to each output node
-
-        al = [qargs, all_cbits]
-        self._multi_graph.insert_node_on_in_edges_multiple(
-            node_index,
-            [self.output_map[q]._node_id for q in itertools.chain(*al)])
+        self._multi_graph.insert_node_on_in_edges_multiple(node_index, output_ids)
         return self._multi_graph[node_index]
 
     def apply_operation_front(self, op, qargs, cargs, condition=None):
@@ -1265,12 +1273,14 @@ class DAGCircuit:
         a layer has depth 1. The total number of layers equals the
         circuit depth d. The layers are indexed from 0 to d-1 with the
         earliest layer at index 0. The layers are constructed using a
-        greedy algorithm. Each returned layer is a dict containing
-        {"graph": circuit graph, "partition": list of qubit lists}.
+        greedy algorithm. Each returned layer is a :class:`.DAGLayer`, a
+        mapping {"graph": circuit graph, "partition": list of qubit lists}.
 
-        The returned layer contains new (but semantically equivalent) DAGNodes.
-        These are not the same as nodes of the original dag, but are equivalent
-        via DAGNode.semantic_eq(node1, node2).
+        The op nodes of a layer, ``layer.op_nodes``, are nodes of this circuit.
+        The circuit graph of a layer is only built when it is accessed, and
+        contains new (but semantically equivalent) DAGNodes. These are not the
+        same as nodes of the original dag, but are equivalent via
+        DAGNode.semantic_eq(node1, node2).
 
         TODO: Gates that use the same cbits will end up in different
         layers as this is currently implemented. This may not be
@@ -1298,60 +1308,22 @@ class DAGCircuit:
             if not op_nodes:
                 return
 
-            # Construct a shallow copy of self
-            new_layer = DAGCircuit()
-            new_layer.name = self.name
-
-            # add in the registers - this adds the input/output nodes
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-
-            for node in op_nodes:
-                # this creates new DAGNodes in the new_layer
-                new_layer.apply_operation_back(node.op,
-                                               node.qargs,
-                                               node.cargs)
-
-            # The quantum registers that have an operation in this layer.
-            support_list = [
-                op_node.qargs
-                for op_node in new_layer.op_nodes()
-                if op_node.name not in {"barrier", "snapshot", "save", "load", "noise"}
-            ]
-
-            yield {"graph": new_layer, "partition": support_list}
+            yield DAGLayer(self, op_nodes)
 
     def serial_layers(self):
         """Yield a layer for all gates of this circuit.
 
         A serial layer is a circuit with one gate. The layers have the
-        same structure as in layers().
+        same structure as in layers(), and their circuit graphs hold copies
+        of the operations.
         """
         for next_node in self.topological_op_nodes():
-            new_layer = DAGCircuit()
-            for qreg in self.qregs.values():
-                new_layer.add_qreg(qreg)
-            for creg in self.cregs.values():
-                new_layer.add_creg(creg)
             # Save the support of the operation we add to the layer
             support_list = []
-            # Operation data
-            op = copy.copy(next_node.op)
-            qa = copy.copy(next_node.qargs)
-            ca = copy.copy(next_node.cargs)
-            co = copy.copy(next_node.condition)
-            _ = self._bits_in_condition(co)
-
-            # Add node to new_layer
-            new_layer.apply_operation_back(op, qa, ca)
-            # Add operation to partition
             if next_node.name not in ["barrier",
                                       "snapshot", "save", "load", "noise"]:
-                support_list.append(list(qa))
-            l_dict = {"graph": new_layer, "partition": support_list}
-            yield l_dict
+                support_list.append(list(next_node.qargs))
+            yield DAGLayer(self, [next_node], support_list, copy_ops=True)
 
     def multigraph_layers(self):
         """Yield layers of the multigraph."""
@@ -16,14 +16,13 @@
 import math
 import heapq
 from collections import OrderedDict, defaultdict
-import numpy as np
 import retworkx as rx
 
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.classicalregister import ClassicalRegister
+from qiskit.circuit.commutation_library import SessionCommutationLibrary
 from qiskit.dagcircuit.exceptions import DAGDependencyError
 from qiskit.dagcircuit.dagdepnode import DAGDepNode
-from qiskit.quantum_info.operators import Operator
 
 
 class DAGDependency:
@@ -563,21 +562,4 @@ def _does_commute(node1, node2):
         intersection_c = set(carg1).intersection(set(carg2))
         return not (intersection_q or intersection_c)
 
-    # Known non-commuting gates (TODO: add more).
-    non_commute_gates = [{'x', 'y'}, {'x', 'z'}]
-    if qarg1 == qarg2 and ({node1.name, node2.name} in non_commute_gates):
-        return False
-
-    # Create matrices to check commutation relation if no other criteria are matched
-    qarg = list(set(node1.qargs + node2.qargs))
-    qbit_num = len(qarg)
-
-    qarg1 = [qarg.index(q) for q in node1.qargs]
-    qarg2 = [qarg.index(q) for q in node2.qargs]
-
-    id_op = Operator(np.eye(2 ** qbit_num))
-
-    op12 = id_op.compose(node1.op, qargs=qarg1).compose(node2.op, qargs=qarg2)
-    op21 = id_op.compose(node2.op, qargs=qarg2).compose(node1.op, qargs=qarg1)
-
-    return op12 == op21
+    return SessionCommutationLibrary.commute(node1.op, node1.qargs, node2.op, node2.qargs)
@@ -15,6 +15,7 @@
 """Object to represent the information at a node in the DAGCircuit."""
 
 from qiskit.exceptions import QiskitError
+from qiskit.dagcircuit.dagnode import qargs_sort_key
 
 
 class DAGDepNode:
@@ -25,7 +26,7 @@ class DAGDepNode:
     """
 
     __slots__ = ['type', '_op', 'name', '_qargs', 'cargs', 'condition',
-                 'sort_key', 'node_id', 'successors', 'predecessors',
+                 '_sort_key', 'node_id', 'successors', 'predecessors',
                  'reachable', 'matchedwith', 'isblocked', 'successorstovisit',
                  'qindices', 'cindices']
 
@@ -41,7 +42,7 @@ class DAGDepNode:
         self.cargs = cargs if cargs is not None else []
         self.condition = condition
         self.node_id = nid
-        self.sort_key = str(self._qargs)
+        self._sort_key = None
         self.successors = successors if successors is not None else []
         self.predecessors = predecessors if predecessors is not None else []
         self.reachable = reachable
@@ -73,7 +74,19 @@ class DAGDepNode:
     def qargs(self, new_qargs):
         """Sets the qargs to be the given list of qargs."""
         self._qargs = new_qargs
-        self.sort_key = str(new_qargs)
+        self._sort_key = None
+
+    @property
+    def sort_key(self):
+        """str: The key ordering the node in the topological sorts of the DAG,
+        the string of its qargs. It is computed the first time it is used."""
+        if self._sort_key is None:
+            self._sort_key = qargs_sort_key(self._qargs)
+        return self._sort_key
+
+    @sort_key.setter
+    def sort_key(self, value):
+        self._sort_key = value
 
     @staticmethod
     def semantic_eq(node1, node2):
@@ -116,7 +129,7 @@ class DAGDepNode:
         dagdepnode.cargs = self.cargs
         dagdepnode.condition = self.condition
         dagdepnode.node_id = self.node_id
-        dagdepnode.sort_key = self.sort_key
+        dagdepnode._sort_key = self._sort_key
         dagdepnode.successors = self.successors
         dagdepnode.predecessors = self.predecessors
         dagdepnode.reachable = self.reachable
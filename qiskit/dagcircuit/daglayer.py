@@ -0,0 +1,101 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Lightweight view on a layer of a DAGCircuit."""
+
+import copy
+from collections.abc import Mapping
+
+_DIRECTIVES = frozenset(["barrier", "snapshot", "save", "load", "noise"])
+
+
+class DAGLayer(Mapping):
+    """A layer of a :class:`~qiskit.dagcircuit.DAGCircuit`, as yielded by
+    :meth:`~qiskit.dagcircuit.DAGCircuit.layers` and
+    :meth:`~qiskit.dagcircuit.DAGCircuit.serial_layers`.
+
+    The layer only refers to op nodes of the circuit it was taken from, in the
+    order they were added to the circuit, and to the partition of their qubits.
+    The circuit of the layer, holding new (but semantically equivalent) nodes,
+    is only built the first time it is accessed, as ``layer.graph`` or
+    ``layer["graph"]``. A layer is a mapping with the keys ``"graph"`` and
+    ``"partition"``, like the dictionaries previously returned by these methods.
+
+    The layer is only valid as long as the circuit it was taken from is not
+    modified.
+    """
+
+    __slots__ = ('dag', 'op_nodes', 'partition', '_copy_ops', '_graph')
+
+    def __init__(self, dag, op_nodes, partition=None, copy_ops=False):
+        """Create a layer.
+
+        Args:
+            dag (DAGCircuit): the circuit the layer is taken from.
+            op_nodes (list[DAGNode]): the op nodes of the layer, which act on
+                disjoint wires, in the order they were added to ``dag``.
+            partition (list[list[Qubit]]): the qubits of the op nodes which
+                are not directives. If ``None``, it is computed from the nodes.
+            copy_ops (bool): whether the circuit of the layer holds copies of
+                the operations, instead of the operations of ``dag``.
+        """
+        self.dag = dag
+        self.op_nodes = op_nodes
+        if partition is None:
+            partition = [node.qargs for node in op_nodes if node.name not in _DIRECTIVES]
+        self.partition = partition
+        self._copy_ops = copy_ops
+        self._graph = None
+
+    @property
+    def node_ids(self):
+        """list[int]: the ids of the op nodes of the layer in its circuit."""
+        return [node._node_id for node in self.op_nodes]
+
+    @property
+    def graph(self):
+        """DAGCircuit: the layer as a circuit with the registers of its circuit."""
+        if self._graph is None:
+            # pylint: disable=cyclic-import
+            from qiskit.dagcircuit.dagcircuit import DAGCircuit
+
+            graph = DAGCircuit()
+            graph.name = self.dag.name
+            for creg in self.dag.cregs.values():
+                graph.add_creg(creg)
+            for qreg in self.dag.qregs.values():
+                graph.add_qreg(qreg)
+            for node in self.op_nodes:
+                if self._copy_ops:
+                    graph.apply_operation_back(copy.copy(node.op), copy.copy(node.qargs),
+                                               copy.copy(node.cargs))
+                else:
+                    graph.apply_operation_back(node.op, node.qargs, node.cargs)
+            self._graph = graph
+        return self._graph
+
+    def __getitem__(self, key):
+        if key == 'graph':
+            return self.graph
+        if key == 'partition':
+            return self.partition
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(('graph', 'partition'))
+
+    def __len__(self):
+        return 2
+
+    def __repr__(self):
+        return "DAGLayer(%s, partition=%s)" % ([node.name for node in self.op_nodes],
+                                               self.partition)
@@ -15,6 +15,7 @@
 """Object to represent the information at a node in the DAGCircuit."""
 
 import warnings
+from functools import lru_cache
 
 from qiskit.exceptions import QiskitError
 
@@ -27,7 +28,7 @@ class DAGNode:
     """
 
     __slots__ = ['type', '_op', 'name', '_qargs', 'cargs', 'condition', '_wire',
-                 'sort_key', '_node_id']
+                 '_sort_key', '_node_id']
 
     def __init__(self, type=None, op=None, name=None, qargs=None, cargs=None,
                  condition=None, wire=None, nid=-1):
@@ -45,7 +46,7 @@ class DAGNode:
         self.condition = self._op.condition if self._op is not None else None
         self._wire = wire
         self._node_id = nid
-        self.sort_key = str(self._qargs)
+        self._sort_key = None
 
     @property
     def op(self):
@@ -69,7 +70,19 @@ class DAGNode:
     def qargs(self, new_qargs):
         """Sets the qargs to be the given list of qargs."""
         self._qargs = new_qargs
-        self.sort_key = str(new_qargs)
+        self._sort_key = None
+
+    @property
+    def sort_key(self):
+        """str: The key ordering the node in the topological sorts of the DAG,
+        the string of its qargs. It is computed the first time it is used."""
+        if self._sort_key is None:
+            self._sort_key = qargs_sort_key(self._qargs)
+        return self._sort_key
+
+    @sort_key.setter
+    def sort_key(self, value):
+        self._sort_key = value
 
     @property
     def wire(self):
@@ -126,3 +139,23 @@ class DAGNode:
                                 if node1._wire == node2._wire:
                                     result = True
         return result
+
+
+def qargs_sort_key(qargs):
+    """Return the sort key of a node acting on ``qargs``, ``str(qargs)``.
+
+    The keys of lists of qubits are shared between the nodes acting on the
+    same qubits.
+    """
+    if isinstance(qargs, list):
+        try:
+            return _list_sort_key(tuple(qargs))
+        except TypeError:
+            # Unhashable qargs
+            pass
+    return str(qargs)
+
+
+@lru_cache(maxsize=2 ** 12)
+def _list_sort_key(qargs):
+    return str(list(qargs))
@@ -21,11 +21,6 @@ Executing Experiments (:mod:`qiskit.execute`)
 """
 import logging
 from time import time
-from qiskit.compiler import transpile, assemble, schedule
-from qiskit.providers import BaseBackend
-from qiskit.providers.backend import Backend
-from qiskit.qobj.utils import MeasLevel, MeasReturnType
-from qiskit.pulse import Schedule
 from qiskit.exceptions import QiskitError
 
 logger = logging.getLogger(__name__)
@@ -233,6 +228,15 @@ def execute(experiments, backend,
 
             job = execute(qc, backend, shots=4321)
     """
+    # The compiler and the providers are only imported when executing, to keep
+    # `import qiskit` fast.
+    # pylint: disable=cyclic-import
+    from qiskit.compiler import transpile, assemble, schedule
+    from qiskit.providers import BaseBackend
+    from qiskit.providers.backend import Backend
+    from qiskit.qobj.utils import MeasLevel, MeasReturnType
+    from qiskit.pulse import Schedule
+
     if isinstance(experiments, Schedule) or (isinstance(experiments, list) and
                                              isinstance(experiments[0], Schedule)):
         # do not transpile a schedule circuit
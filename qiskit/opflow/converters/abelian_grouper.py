@@ -13,11 +13,14 @@
 """AbelianGrouper Class"""
 
 import warnings
-from typing import List, Tuple, Dict, cast, Optional
+from typing import List, Tuple, Dict, Optional
 
 import numpy as np
 import retworkx as rx
 
+from qiskit.circuit import ParameterExpression
+from qiskit.tools.parallel import parallel_map
+
 from .converter_base import ConverterBase
 from ..list_ops.list_op import ListOp
 from ..list_ops.summed_op import SummedOp
@@ -40,13 +43,16 @@ class AbelianGrouper(ConverterBase):
     diagonalized together.
     """
 
-    def __init__(self, traverse: bool = True) -> None:
+    def __init__(self, traverse: bool = True, grouping: str = 'coloring') -> None:
         """
         Args:
             traverse: Whether to convert only the Operator passed to ``convert``, or traverse
                 down that Operator.
+            grouping: The grouping method passed to :meth:`group_subops`, ``'coloring'`` or
+                ``'sorted_insertion'``.
         """
         self._traverse = traverse
+        self._grouping = grouping
 
     def convert(self, operator: OperatorBase) -> OperatorBase:
         """Check if operator is a SummedOp, in which case covert it into a sum of mutually
@@ -70,7 +76,7 @@ class AbelianGrouper(ConverterBase):
             if isinstance(operator, SummedOp) and all(isinstance(op, PauliOp)
                                                       for op in operator.oplist):
                 # For now, we only support graphs over Paulis.
-                return self.group_subops(operator)
+                return self.group_subops(operator, grouping=self._grouping)
             elif self._traverse:
                 return operator.traverse(self.convert)
             else:
@@ -86,19 +92,27 @@ class AbelianGrouper(ConverterBase):
 
     @classmethod
     def group_subops(cls, list_op: ListOp, fast: Optional[bool] = None,
-                     use_nx: Optional[bool] = None) -> ListOp:
+                     use_nx: Optional[bool] = None, grouping: str = 'coloring') -> ListOp:
         """Given a ListOp, attempt to group into Abelian ListOps of the same type.
 
+        Two grouping methods are available. ``'coloring'`` builds the graph of the Paulis
+        which do not commute qubit-wise and colors it greedily. ``'sorted_insertion'``
+        inserts the Paulis, by decreasing magnitude of their coefficients, in the first
+        group they commute with, and does not need the graph, whose number of edges grows
+        quadratically with the number of Paulis, so it scales to much larger operators.
+
         Args:
             list_op: The Operator to group into Abelian groups
             fast: Ignored - parameter will be removed in future release
             use_nx: Ignored - parameter will be removed in future release
+            grouping: The grouping method, ``'coloring'`` or ``'sorted_insertion'``.
 
         Returns:
             The grouped Operator.
 
         Raises:
-            OpflowError: If any of list_op's sub-ops is not ``PauliOp``.
+            OpflowError: If any of list_op's sub-ops is not ``PauliOp``, or the grouping
+                method is unknown.
         """
         if fast is not None or use_nx is not None:
             warnings.warn('Options `fast` and `use_nx` of `AbelianGrouper.group_subops` are '
@@ -115,14 +129,19 @@ class AbelianGrouper(ConverterBase):
                     'Cannot determine Abelian groups if any Operator in list_op is not '
                     '`PauliOp`. E.g., {} ({})'.format(op, type(op)))
 
-        edges = cls._commutation_graph(list_op)
-        nodes = range(len(list_op))
+        if grouping == 'coloring':
+            edges = cls._commutation_graph(list_op)
+            nodes = range(len(list_op))
 
-        graph = rx.PyGraph()
-        graph.add_nodes_from(nodes)
-        graph.add_edges_from_no_data(edges)
-        # Keys in coloring_dict are nodes, values are colors
-        coloring_dict = rx.graph_greedy_color(graph)
+            graph = rx.PyGraph()
+            graph.add_nodes_from(nodes)
+            graph.add_edges_from_no_data(edges)
+            # Keys in coloring_dict are nodes, values are colors
+            coloring_dict = rx.graph_greedy_color(graph)
+        elif grouping == 'sorted_insertion':
+            coloring_dict = cls._sorted_insertion(list_op)
+        else:
+            raise OpflowError('Unknown grouping method {}.'.format(grouping))
 
         groups = {}  # type: Dict
         # sort items so that the output is consistent with all options (fast and use_nx)
@@ -138,6 +157,10 @@ class AbelianGrouper(ConverterBase):
     def _commutation_graph(list_op: ListOp) -> List[Tuple[int, int]]:
         """Create edges (i, j) if i and j are not commutable.
 
+        The Paulis are compared on their x and z bits, packed into 64-bit words, by chunks
+        of rows bounding the memory used. The chunks are processed in parallel for large
+        lists of Paulis.
+
         Note:
             This method is applicable to only PauliOps.
 
@@ -147,10 +170,89 @@ class AbelianGrouper(ConverterBase):
         Returns:
             A list of pairs of indices of the operators that are not commutable
         """
-        # convert a Pauli operator into int vector where {I: 0, X: 2, Y: 3, Z: 1}
-        mat1 = np.array([op.primitive.z + 2 * op.primitive.x for op in list_op], dtype=np.int8)
-        mat2 = mat1[:, None]
-        # mat3[i, j] is True if i and j are commutable with TPB
-        mat3 = (((mat1 * mat2) * (mat1 - mat2)) == 0).all(axis=2)
-        # return [(i, j) if mat3[i, j] is False and i < j]
-        return cast(List[Tuple[int, int]], list(zip(*np.where(np.triu(np.logical_not(mat3), k=1)))))
+        x_words, z_words = _pack_paulis(list_op)
+        num_paulis, num_words = x_words.shape
+        chunk_size = max(1, _CHUNK_WORDS // (num_paulis * num_words))
+        chunks = [(start, min(start + chunk_size, num_paulis))
+                  for start in range(0, num_paulis, chunk_size)]
+        if num_paulis * num_paulis * num_words < _PARALLEL_MIN_WORDS:
+            chunk_edges = [_non_commuting_pairs(chunk, x_words, z_words) for chunk in chunks]
+        else:
+            chunk_edges = parallel_map(_non_commuting_pairs, chunks,
+                                       task_args=(x_words, z_words))
+        return [edge for edges in chunk_edges for edge in edges]
+
+    @staticmethod
+    def _sorted_insertion(list_op: ListOp) -> Dict[int, int]:
+        """Group the Paulis by sorted insertion.
+
+        Each Pauli, by decreasing magnitude of its coefficient, is added to the first group
+        it commutes qubit-wise with, or to a new group. A group is represented by the x and z
+        bits of the Pauli acting on each of its qubits, so the Pauli is compared with all the
+        groups at once.
+
+        Args:
+            list_op: list_op
+
+        Returns:
+            A dictionary from the index of each operator to the index of its group.
+        """
+        x_words, z_words = _pack_paulis(list_op)
+        num_paulis, num_words = x_words.shape
+        group_x = np.empty((num_paulis, num_words), dtype=np.uint64)
+        group_z = np.empty((num_paulis, num_words), dtype=np.uint64)
+        num_groups = 0
+        groups = {}
+        magnitudes = [0 if isinstance(op.coeff, ParameterExpression) else abs(op.coeff)
+                      for op in list_op.oplist]
+        order = sorted(range(num_paulis), key=lambda idx: -magnitudes[idx])
+        for idx in order:
+            pauli_x, pauli_z = x_words[idx], z_words[idx]
+            conflicts = ((group_x[:num_groups] | group_z[:num_groups]) & (pauli_x | pauli_z)
+                         & ((group_x[:num_groups] ^ pauli_x) | (group_z[:num_groups] ^ pauli_z)))
+            free = np.flatnonzero(~conflicts.any(axis=1))
+            if len(free):
+                group = free[0]
+                group_x[group] |= pauli_x
+                group_z[group] |= pauli_z
+            else:
+                group = num_groups
+                group_x[group] = pauli_x
+                group_z[group] = pauli_z
+                num_groups += 1
+            groups[idx] = int(group)
+        return groups
+
+
+# Number of 64-bit words compared at once when building the commutation graph
+_CHUNK_WORDS = 2 ** 21
+# Number of word comparisons above which the commutation graph is built in parallel
+_PARALLEL_MIN_WORDS = 2 ** 32
+
+
+def _pack_paulis(list_op: ListOp) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the x and z bits of the Paulis of list_op, packed into 64-bit words."""
+    num_qubits = list_op.num_qubits
+    num_words = max(1, -(-num_qubits // 64))
+    x_bits = np.zeros((len(list_op), 64 * num_words), dtype=bool)
+    z_bits = np.zeros((len(list_op), 64 * num_words), dtype=bool)
+    for idx, op in enumerate(list_op.oplist):
+        x_bits[idx, :num_qubits] = op.primitive.x
+        z_bits[idx, :num_qubits] = op.primitive.z
+    return (np.packbits(x_bits, axis=1).view(np.uint64),
+            np.packbits(z_bits, axis=1).view(np.uint64))
+
+
+def _non_commuting_pairs(chunk: Tuple[int, int], x_words: np.ndarray,
+                         z_words: np.ndarray) -> List[Tuple[int, int]]:
+    """Return the pairs (i, j), with i in the chunk of rows and i < j, of Paulis which do not
+    commute qubit-wise, i.e. act with different non-identity Paulis on some qubit."""
+    start, stop = chunk
+    conflicts = np.zeros((stop - start, len(x_words) - start), dtype=bool)
+    for word in range(x_words.shape[1]):
+        row_x, row_z = x_words[start:stop, word, None], z_words[start:stop, word, None]
+        col_x, col_z = x_words[None, start:, word], z_words[None, start:, word]
+        conflicts |= ((row_x | row_z) & (col_x | col_z)
+                      & ((row_x ^ col_x) | (row_z ^ col_z))) != 0
+    rows, cols = np.nonzero(np.triu(conflicts, k=1))
+    return list(zip((rows + start).tolist(), (cols + start).tolist()))
@@ -333,7 +333,7 @@ class CircuitSampler(ConverterBase):
                 if param not in input_params:
                     raise ValueError('unexpected parameter: {0}'.format(param))
                 param_mappings[param] = input_params[param]
-            return float(inst_param.bind(param_mappings))
+            return float(inst_param.evaluate(param_mappings))
 
         gate_index = 0
         for inst, _, _ in circuit.data:
@@ -132,7 +132,7 @@ class EvolvedOp(PrimitiveOp):
                 return ListOp([self.assign_parameters(param_dict) for param_dict in unrolled_dict])
             if self.coeff.parameters <= set(unrolled_dict.keys()):
                 binds = {param: unrolled_dict[param] for param in self.coeff.parameters}
-                param_value = float(self.coeff.bind(binds))
+                param_value = float(self.coeff.evaluate(binds))
         return EvolvedOp(
             self.primitive.bind_parameters(param_dict), coeff=param_value)  # type: ignore
 
@@ -20,6 +20,7 @@ from typing import Callable, Iterable, List, Optional, Tuple, Union
 import numpy as np
 from qiskit.utils.quantum_instance import QuantumInstance
 from qiskit.circuit import ParameterExpression, ParameterVector
+from qiskit.circuit.parameterexpression import _derivative
 from qiskit.providers import BaseBackend
 
 from ..converters.converter_base import ConverterBase
@@ -138,7 +139,7 @@ class DerivativeBase(ConverterBase):
         if not isinstance(keys, IterableAbc):
             keys = [keys]
         for key in keys:
-            expr_grad += sy.Derivative(expr, key).doit()
+            expr_grad += _derivative(expr, key)
 
         # generate the new dictionary of symbols
         # this needs to be done since in the derivative some symbols might disappear (e.g.
@@ -252,7 +252,7 @@ class CircuitStateFn(StateFn):
                     and self.coeff.parameters <= set(unrolled_dict.keys()):
                 param_instersection = set(unrolled_dict.keys()) & self.coeff.parameters
                 binds = {param: unrolled_dict[param] for param in param_instersection}
-                param_value = float(self.coeff.bind(binds))
+                param_value = float(self.coeff.evaluate(binds))
             # & is set intersection, check if any parameters in unrolled are present in circuit
             # This is different from bind_parameters in Terra because they check for set equality
             if set(unrolled_dict.keys()) & self.primitive.parameters:
@@ -14,8 +14,12 @@
 
 """
 
+from functools import lru_cache
+from itertools import count
 from string import ascii_uppercase, ascii_lowercase
 import numpy as np
+from qiskit.circuit.gate_matrix_cache import SessionGateMatrixCache
+from qiskit.circuit.library.standard_gates import CXGate, U3Gate
 from qiskit.exceptions import QiskitError
 
 
@@ -176,3 +180,223 @@ def _einsum_matmul_index_helper(gate_indices, number_of_qubits):
     # Combine indices into matrix multiplication string format
     # for numpy.einsum function
     return mat_left, mat_right, tens_in, tens_out
+
+
+class GateKernel:
+    """A gate matrix precompiled to be applied to the qubit axes of a tensor.
+
+    Diagonal gates are applied as a broadcast product, and gates with a
+    single non-zero entry in every row and column (like ``cx``) by moving
+    slices of the tensor. Other gates are contracted with ``numpy.tensordot``.
+    """
+
+    def __init__(self, gate, axes, ndim):
+        """Compile a gate.
+
+        Args:
+            gate (matrix_like): an N-qubit matrix.
+            axes (list[int]): the tensor axes of the N qubits of the matrix,
+                from the least to the most significant one.
+            ndim (int): the number of axes of the tensors the gate is applied to.
+        """
+        gate = np.array(gate, dtype=complex)
+        num_qubits = len(axes)
+        # Axes of the gate tensor are ordered from the most significant qubit
+        tensor_axes = list(reversed(axes))
+        self._diagonal = None
+        self._moves = None
+        if not np.any(gate - np.diag(np.diagonal(gate))):
+            diagonal = np.transpose(np.reshape(np.diagonal(gate), num_qubits * [2]),
+                                    np.argsort(tensor_axes))
+            shape = ndim * [1]
+            for axis in axes:
+                shape[axis] = 2
+            self._diagonal = np.reshape(diagonal, shape)
+        elif np.all(np.count_nonzero(gate, axis=0) == 1) and \
+                np.all(np.count_nonzero(gate, axis=1) == 1):
+            self._moves = []
+            for row in range(2 ** num_qubits):
+                col = np.flatnonzero(gate[row])[0]
+                self._moves.append((_basis_slice(row, axes, ndim),
+                                    _basis_slice(col, axes, ndim),
+                                    gate[row, col]))
+        else:
+            self._tensor = np.reshape(gate, 2 * num_qubits * [2])
+            self._contracted = (list(range(num_qubits, 2 * num_qubits)), tensor_axes)
+            self._destination = tensor_axes
+
+    def __call__(self, tensor):
+        """Apply the gate to a tensor.
+
+        Args:
+            tensor (np.ndarray): a complex tensor, which may be modified in place.
+
+        Returns:
+            np.ndarray: the tensor with the gate applied.
+        """
+        if self._diagonal is not None:
+            tensor *= self._diagonal
+            return tensor
+        if self._moves is not None:
+            out = np.empty_like(tensor)
+            for out_slice, in_slice, phase in self._moves:
+                if phase == 1:
+                    out[out_slice] = tensor[in_slice]
+                else:
+                    np.multiply(tensor[in_slice], phase, out=out[out_slice])
+            return out
+        return np.moveaxis(np.tensordot(self._tensor, tensor, self._contracted),
+                           range(len(self._destination)), self._destination)
+
+
+def _basis_slice(index, axes, ndim):
+    """Index of the subtensor where the qubits on ``axes`` are in basis state ``index``."""
+    basis_slice = ndim * [slice(None)]
+    for bit, axis in enumerate(axes):
+        basis_slice[axis] = (index >> bit) & 1
+    return tuple(basis_slice)
+
+
+def gate_instruction_matrix(instruction):
+    """Return the matrix of a gate instruction.
+
+    Args:
+        instruction (QasmQobjInstruction): a qobj instruction.
+
+    Returns:
+        array: the matrix, or ``None`` if the instruction is not a gate.
+    """
+    if instruction.name == 'unitary':
+        return instruction.params[0]
+    if instruction.name in ('U', 'u1', 'u2', 'u3', 'CX', 'cx'):
+        return _gate_matrix(instruction.name, getattr(instruction, 'params', None))
+    return None
+
+
+def _gate_matrix(name, params):
+    """Return the shared read-only matrix of a named gate from the gate matrix cache."""
+    if name in ('CX', 'cx'):
+        return SessionGateMatrixCache.matrix(CXGate())
+    # The matrix of a U3Gate is the one of single_gate_matrix
+    theta, phi, lam = map(float, single_gate_params(name, params))
+    return SessionGateMatrixCache.matrix(U3Gate(theta, phi, lam))
+
+
+def compile_gate_kernels(instructions, number_of_qubits, offset, ndim, max_fused_qubits=1):
+    """Precompile the gates of a list of qobj instructions.
+
+    Every gate is compiled to a :class:`GateKernel`. The adjacent unconditional
+    gates are greedily collected into blocks acting on at most
+    ``max_fused_qubits`` qubits, in the style of the
+    :class:`~qiskit.transpiler.passes.Collect2qBlocks` and
+    :class:`~qiskit.transpiler.passes.ConsolidateBlocks` passes, and every
+    block of several gates is fused into a single kernel of its unitary. The
+    kernels of the ``u1``, ``u2``, ``u3`` and ``cx`` gates are cached. The
+    ``id``, ``u0`` and ``barrier`` instructions are dropped.
+
+    Args:
+        instructions (list[QasmQobjInstruction]): the instructions.
+        number_of_qubits (int): the number of qubits of the experiment.
+        offset (int): the tensor axis of the most significant qubit.
+        ndim (int): the number of axes of the tensors the kernels are applied to.
+        max_fused_qubits (int): the maximum number of qubits of a fused block.
+            With ``1`` only the runs of single-qubit gates are fused and with
+            ``0`` no gates are fused.
+
+    Returns:
+        tuple: the list of ``(instruction, kernel)`` pairs in execution order,
+        where ``kernel`` is ``None`` for the instructions which are not gates
+        and ``instruction`` is ``None`` for fused blocks of several gates, and
+        the number of gates fused into these blocks.
+    """
+    def axis(qubit):
+        return offset + number_of_qubits - 1 - qubit
+
+    def kernel(instruction, gate):
+        params = getattr(instruction, 'params', None)
+        if instruction.name != 'unitary':
+            try:
+                return _cached_gate_kernel(instruction.name, tuple(params or ()),
+                                           tuple(instruction.qubits), number_of_qubits,
+                                           offset, ndim)
+            except TypeError:
+                # Unhashable parameters
+                pass
+        return GateKernel(gate, [axis(qubit) for qubit in instruction.qubits], ndim)
+
+    compiled = []
+    num_fused = 0
+    # Open blocks of gates on disjoint sets of qubits, by creation index, and
+    # the open block of each qubit. A block is a [qubits, gates] pair.
+    blocks = {}
+    block_of = {}
+    block_indices = count()
+
+    def flush(qubits):
+        close(sorted({block_of[qubit] for qubit in qubits if qubit in block_of}))
+
+    def close(indices):
+        nonlocal num_fused
+        for index in indices:
+            block_qubits, gates = blocks.pop(index)
+            for qubit in block_qubits:
+                del block_of[qubit]
+            if len(gates) == 1:
+                compiled.append((gates[0][0], kernel(*gates[0])))
+            else:
+                block_qubits = sorted(block_qubits)
+                compiled.append((None, GateKernel(_block_matrix(block_qubits, gates),
+                                                  [axis(qubit) for qubit in block_qubits],
+                                                  ndim)))
+                num_fused += len(gates)
+
+    for instruction in instructions:
+        if instruction.name in ('id', 'u0', 'barrier'):
+            continue
+        gate = gate_instruction_matrix(instruction)
+        qubits = getattr(instruction, 'qubits', [])
+        if gate is not None and getattr(instruction, 'conditional', None) is None and \
+                len(qubits) <= max_fused_qubits:
+            touched = sorted({block_of[qubit] for qubit in qubits if qubit in block_of})
+            block_qubits = set(qubits).union(*(blocks[index][0] for index in touched))
+            while len(block_qubits) > max_fused_qubits:
+                # Close the oldest touched blocks until the gate fits with the others
+                close(touched[:1])
+                touched = touched[1:]
+                block_qubits = set(qubits).union(*(blocks[index][0] for index in touched))
+            if touched:
+                # Merge the touched blocks, which commute as they act on
+                # disjoint qubits, into the first one.
+                index = touched[0]
+                for other in touched[1:]:
+                    blocks[index][1].extend(blocks.pop(other)[1])
+                blocks[index][0] = block_qubits
+            else:
+                index = next(block_indices)
+                blocks[index] = [set(qubits), []]
+            blocks[index][1].append((instruction, gate))
+            for qubit in blocks[index][0]:
+                block_of[qubit] = index
+            continue
+        flush(qubits)
+        compiled.append((instruction, None if gate is None else kernel(instruction, gate)))
+    flush(list(block_of))
+    return compiled, num_fused
+
+
+def _block_matrix(qubits, gates):
+    """Return the unitary matrix of a block of gates on the sorted ``qubits``."""
+    num_qubits = len(qubits)
+    positions = {qubit: num_qubits - 1 - idx for idx, qubit in enumerate(qubits)}
+    matrix = np.reshape(np.eye(2 ** num_qubits, dtype=complex), 2 * num_qubits * [2])
+    for instruction, gate in gates:
+        matrix = GateKernel(gate, [positions[qubit] for qubit in instruction.qubits],
+                            2 * num_qubits)(matrix)
+    return np.reshape(matrix, (2 ** num_qubits, 2 ** num_qubits))
+
+
+@lru_cache(maxsize=1024)
+def _cached_gate_kernel(name, params, qubits, number_of_qubits, offset, ndim):
+    """Return the cached kernel of a named gate on given qubits."""
+    return GateKernel(_gate_matrix(name, list(params)),
+                      [offset + number_of_qubits - 1 - qubit for qubit in qubits], ndim)
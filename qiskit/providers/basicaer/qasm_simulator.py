@@ -42,9 +42,8 @@ from qiskit.result import Result
 from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_vecmul_index
+from .basicaertools import GateKernel
+from .basicaertools import compile_gate_kernels
 
 logger = logging.getLogger(__name__)
 
@@ -104,13 +103,18 @@ class QasmSimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_statevector": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "fusion_max_qubits": 1
     }
 
     # Class level variable to return the final state at the end of simulation
     # This should be set to True for the statevector simulator
     SHOW_FINAL_STATE = False
 
+    # Maximum number of amplitudes of the batch of statevectors of the shots
+    # simulated together, when measurements can not be sampled
+    MAX_BATCH_AMPLITUDES = 2 ** 22
+
     def __init__(self, configuration=None, provider=None):
         super().__init__(configuration=(
             configuration or QasmBackendConfiguration.from_dict(self.DEFAULT_CONFIGURATION)),
@@ -124,51 +128,87 @@ class QasmSimulatorPy(BaseBackend):
         self._number_of_cmembits = 0
         self._number_of_qubits = 0
         self._shots = 0
+        self._random_numbers = None
+        self._random_column = 0
         self._memory = False
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_max_qubits = self.DEFAULT_OPTIONS["fusion_max_qubits"]
         self._qobj_config = None
         # TEMP
         self._sample_measure = False
 
-    def _add_unitary(self, gate, qubits):
+    def _add_unitary(self, gate, qubits, shots=None):
         """Apply an N-qubit unitary matrix.
 
         Args:
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
+            shots (np.ndarray): indices of the shots to apply the matrix to.
+                If ``None``, it is applied to all the shots.
+        """
+        # The first axis of the statevector is the shots
+        axes = [self._number_of_qubits - qubit for qubit in qubits]
+        self._add_kernel(GateKernel(gate, axes, self._number_of_qubits + 1), shots)
+
+    def _add_kernel(self, kernel, shots=None):
+        """Apply a precompiled gate.
+
+        Args:
+            kernel (GateKernel): the gate kernel.
+            shots (np.ndarray): indices of the shots to apply the gate to.
+                If ``None``, it is applied to all the shots.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_vecmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
-                                 num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._statevector = np.einsum(indexes, gate_tensor, self._statevector,
-                                      dtype=complex, casting='no')
-
-    def _get_measure_outcome(self, qubit):
+        if shots is None:
+            self._statevector = kernel(self._statevector)
+        else:
+            self._statevector[shots] = kernel(self._statevector[shots])
+
+    def _get_measure_outcome(self, qubit, shots=None):
         """Simulate the outcome of measurement of a qubit.
 
         Args:
             qubit (int): the qubit to measure
+            shots (np.ndarray): indices of the shots to measure. If ``None``,
+                all the shots are measured.
 
         Return:
-            tuple: pair (outcome, probability) where outcome is '0' or '1' and
-            probability is the probability of the returned outcome.
+            tuple: pair (outcomes, probabilities) of arrays with, for every
+            measured shot, whether the outcome is '1' and the probability of
+            the outcome.
         """
-        # Axis for numpy.sum to compute probabilities
-        axis = list(range(self._number_of_qubits))
-        axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.sum(np.abs(self._statevector) ** 2, axis=tuple(axis))
-        # Compute einsum index string for 1-qubit matrix multiplication
-        random_number = self._local_random.rand()
-        if random_number < probabilities[0]:
-            return '0', probabilities[0]
-        # Else outcome was '1'
-        return '1', probabilities[1]
+        statevector = self._statevector if shots is None else self._statevector[shots]
+        # Axis for numpy.sum to compute probabilities, the first axis is the shots
+        axis = list(range(1, self._number_of_qubits + 1))
+        axis.remove(self._number_of_qubits - qubit)
+        probabilities = np.sum(np.abs(statevector) ** 2, axis=tuple(axis))
+        # Every measurement uses the next column of random numbers
+        random_numbers = self._random_numbers[:, self._random_column]
+        self._random_column += 1
+        if shots is not None:
+            random_numbers = random_numbers[shots]
+        # The outcome is '0' if the random number is below its probability
+        outcomes = random_numbers >= probabilities[:, 0]
+        return outcomes, probabilities[np.arange(len(outcomes)), outcomes.astype(int)]
+
+    def _project(self, qubit, outcomes, probabilities, shots=None):
+        """Project the qubit onto the measurement outcomes and renormalize.
+
+        Args:
+            qubit (int): the measured qubit.
+            outcomes (np.ndarray): the outcome of every measured shot.
+            probabilities (np.ndarray): the probability of every outcome.
+            shots (np.ndarray): indices of the measured shots. If ``None``,
+                all the shots were measured.
+        """
+        update = np.zeros((len(outcomes), 2))
+        update[np.arange(len(outcomes)), outcomes.astype(int)] = 1 / np.sqrt(probabilities)
+        shape = [len(outcomes)] + self._number_of_qubits * [1]
+        shape[self._number_of_qubits - qubit] = 2
+        if shots is None:
+            self._statevector *= np.reshape(update, shape)
+        else:
+            self._statevector[shots] *= np.reshape(update, shape)
 
     def _add_sample_measure(self, measure_params, num_samples):
         """Generate memory samples from current statevector.
@@ -193,7 +233,8 @@ class QasmSimulatorPy(BaseBackend):
             # Remove from largest qubit to smallest so list position is correct
             # with respect to position from end of the list
             axis.remove(self._number_of_qubits - 1 - qubit)
-        probabilities = np.reshape(np.sum(np.abs(self._statevector) ** 2,
+        # Measurements are only sampled from a single shot
+        probabilities = np.reshape(np.sum(np.abs(self._statevector[0]) ** 2,
                                           axis=tuple(axis)),
                                    2 ** num_measured)
         # Generate samples on measured qubits as ints with qubit
@@ -204,7 +245,7 @@ class QasmSimulatorPy(BaseBackend):
         # Convert the ints to bitstrings
         memory = []
         for sample in samples:
-            classical_memory = self._classical_memory
+            classical_memory = int(self._classical_memory[0])
             for qubit, cmembit in measure_params:
                 pos = measured_qubits.index(qubit)
                 qubit_outcome = int((sample & (1 << pos)) >> pos)
@@ -214,52 +255,119 @@ class QasmSimulatorPy(BaseBackend):
             memory.append(hex(int(value, 2)))
         return memory
 
-    def _add_qasm_measure(self, qubit, cmembit, cregbit=None):
+    def _add_qasm_measure(self, qubit, cmembit, cregbit=None, shots=None):
         """Apply a measure instruction to a qubit.
 
         Args:
             qubit (int): qubit is the qubit measured.
             cmembit (int): is the classical memory bit to store outcome in.
             cregbit (int, optional): is the classical register bit to store outcome in.
+            shots (np.ndarray): indices of the shots to measure. If ``None``,
+                all the shots are measured.
         """
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
+        outcomes, probabilities = self._get_measure_outcome(qubit, shots)
         # update classical state
-        membit = 1 << cmembit
-        self._classical_memory = (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
-
+        self._classical_memory = _set_bit(self._classical_memory, cmembit, outcomes, shots)
         if cregbit is not None:
-            regbit = 1 << cregbit
-            self._classical_register = \
-                (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
-
+            self._classical_register = _set_bit(self._classical_register, cregbit,
+                                                outcomes, shots)
         # update quantum state
-        if outcome == '0':
-            update_diag = [[1 / np.sqrt(probability), 0], [0, 0]]
-        else:
-            update_diag = [[0, 0], [0, 1 / np.sqrt(probability)]]
-        # update classical state
-        self._add_unitary(update_diag, [qubit])
+        self._project(qubit, outcomes, probabilities, shots)
 
-    def _add_qasm_reset(self, qubit):
+    def _add_qasm_reset(self, qubit, shots=None):
         """Apply a reset instruction to a qubit.
 
         Args:
             qubit (int): the qubit being rest
+            shots (np.ndarray): indices of the shots to reset. If ``None``,
+                all the shots are reset.
 
         This is done by doing a simulating a measurement
         outcome and projecting onto the outcome state while
-        renormalizing.
+        renormalizing, then flipping the qubit of the shots
+        with outcome '1'.
         """
         # get measure outcome
-        outcome, probability = self._get_measure_outcome(qubit)
+        outcomes, probabilities = self._get_measure_outcome(qubit, shots)
         # update quantum state
-        if outcome == '0':
-            update = [[1 / np.sqrt(probability), 0], [0, 0]]
-            self._add_unitary(update, [qubit])
+        self._project(qubit, outcomes, probabilities, shots)
+        flipped = np.flatnonzero(outcomes)
+        if shots is not None:
+            flipped = shots[flipped]
+        if len(flipped):
+            self._add_unitary([[0, 1], [1, 0]], [qubit], flipped)
+
+    def _add_bfunc(self, operation, shots=None):
+        """Apply a boolean function instruction to the classical register.
+
+        Args:
+            operation (QasmQobjInstruction): the bfunc instruction.
+            shots (np.ndarray): indices of the shots to apply the function
+                to. If ``None``, it is applied to all the shots.
+
+        Raises:
+            BasicAerError: if the relation of the function is invalid.
+        """
+        mask = int(operation.mask, 16)
+        relation = operation.relation
+        val = int(operation.val, 16)
+
+        cregbit = operation.register
+        cmembit = operation.memory if hasattr(operation, 'memory') else None
+
+        register = self._classical_register if shots is None else \
+            self._classical_register[shots]
+        compared = (register & mask) - val
+
+        if relation == '==':
+            outcomes = (compared == 0)
+        elif relation == '!=':
+            outcomes = (compared != 0)
+        elif relation == '<':
+            outcomes = (compared < 0)
+        elif relation == '<=':
+            outcomes = (compared <= 0)
+        elif relation == '>':
+            outcomes = (compared > 0)
+        elif relation == '>=':
+            outcomes = (compared >= 0)
         else:
-            update = [[0, 1 / np.sqrt(probability)], [0, 0]]
-            self._add_unitary(update, [qubit])
+            raise BasicAerError('Invalid boolean function relation.')
+        outcomes = np.asarray(outcomes, dtype=bool)
+
+        # Store outcome in register and optionally memory slot
+        self._classical_register = _set_bit(self._classical_register, cregbit, outcomes, shots)
+        if cmembit is not None:
+            self._classical_memory = _set_bit(self._classical_memory, cmembit, outcomes, shots)
+
+    def _get_conditional_shots(self, operation):
+        """Return the indices of the shots for which a conditional operation applies.
+
+        Args:
+            operation (QasmQobjInstruction): the operation.
+
+        Returns:
+            np.ndarray: the indices of the shots, or ``None`` if the operation
+            applies to all the shots.
+        """
+        conditional = getattr(operation, 'conditional', None)
+        if isinstance(conditional, int):
+            selected = (self._classical_register >> conditional) & 1 != 0
+        elif conditional is not None:
+            mask = int(operation.conditional.mask, 16)
+            if mask == 0:
+                return None
+            # Shift out the trailing zeros of the mask
+            shift = (mask & -mask).bit_length() - 1
+            selected = (self._classical_memory & mask) >> shift == \
+                int(operation.conditional.val, 16)
+        else:
+            return None
+        selected = np.asarray(selected, dtype=bool)
+        if selected.all():
+            return None
+        return np.flatnonzero(selected)
 
     def _validate_initial_statevector(self):
         """Validate an initial statevector"""
@@ -278,6 +386,7 @@ class QasmSimulatorPy(BaseBackend):
         # Reset default options
         self._initial_statevector = self.DEFAULT_OPTIONS["initial_statevector"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_max_qubits = self.DEFAULT_OPTIONS["fusion_max_qubits"]
         if backend_options is None:
             backend_options = {}
 
@@ -301,23 +410,33 @@ class QasmSimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for custom maximum number of qubits of fused gates
+        if 'fusion_max_qubits' in backend_options:
+            self._fusion_max_qubits = backend_options['fusion_max_qubits']
+        elif hasattr(qobj_config, 'fusion_max_qubits'):
+            self._fusion_max_qubits = qobj_config.fusion_max_qubits
+
+    def _initialize_statevector(self, num_shots=1):
+        """Set the initial statevector of a batch of shots for simulation
 
-    def _initialize_statevector(self):
-        """Set the initial statevector for simulation"""
+        Args:
+            num_shots (int): the number of shots simulated together.
+        """
         if self._initial_statevector is None:
             # Set to default state of all qubits in |0>
-            self._statevector = np.zeros(2 ** self._number_of_qubits,
+            self._statevector = np.zeros((num_shots, 2 ** self._number_of_qubits),
                                          dtype=complex)
-            self._statevector[0] = 1
+            self._statevector[:, 0] = 1
         else:
-            self._statevector = self._initial_statevector.copy()
-        # Reshape to rank-N tensor
+            self._statevector = np.repeat(self._initial_statevector[np.newaxis],
+                                          num_shots, axis=0)
+        # Reshape to a batch of rank-N tensors
         self._statevector = np.reshape(self._statevector,
-                                       self._number_of_qubits * [2])
+                                       [num_shots] + self._number_of_qubits * [2])
 
     def _get_statevector(self):
-        """Return the current statevector"""
-        vec = np.reshape(self._statevector, 2 ** self._number_of_qubits)
+        """Return the current statevector (of the last simulated shot)"""
+        vec = np.reshape(self._statevector[-1], 2 ** self._number_of_qubits)
         vec[abs(vec) < self._chop_threshold] = 0.0
         return vec
 
@@ -342,9 +461,9 @@ class QasmSimulatorPy(BaseBackend):
         # the first measure.
         else:
             measure_flag = False
-            for instruction in experiment.instructions:
+            for name in experiment.instruction_names():
                 # If circuit contains reset operations we cannot sample
-                if instruction.name == "reset":
+                if name == "reset":
                     self._sample_measure = False
                     return
                 # If circuit contains a measure option then we can
@@ -352,10 +471,10 @@ class QasmSimulatorPy(BaseBackend):
                 if measure_flag:
                     # If we find a non-measure instruction
                     # we cannot do measure sampling
-                    if instruction.name not in ["measure", "barrier", "id", "u0"]:
+                    if name not in ["measure", "barrier", "id", "u0"]:
                         self._sample_measure = False
                         return
-                elif instruction.name == "measure":
+                elif name == "measure":
                     measure_flag = True
             # If we made it to the end of the circuit without returning
             # measure sampling is allowed
@@ -374,12 +493,18 @@ class QasmSimulatorPy(BaseBackend):
         Additional Information:
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
+                * "fusion_max_qubits": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
             zero state. This size of this vector must be correct for the number
             of qubits in all experiments in the qobj.
 
+            The "fusion_max_qubits" option specifies the maximum number of
+            qubits of the blocks of adjacent gates fused into a single unitary
+            before the simulation. The default value 1 only fuses the runs of
+            single-qubit gates, and 0 disables the fusion.
+
             Example::
 
                 backend_options = {
@@ -445,6 +570,7 @@ class QasmSimulatorPy(BaseBackend):
                 "status": status string for the simulation
                 "success": boolean
                 "time_taken": simulation time of this single experiment
+                "metadata": {"fused_gates": number of gates fused together}
                 }
         Raises:
             BasicAerError: if an error occurred.
@@ -484,54 +610,42 @@ class QasmSimulatorPy(BaseBackend):
             measure_sample_ops = []
         else:
             shots = self._shots
-        for _ in range(shots):
-            self._initialize_statevector()
+        # The shots are simulated together, in batches of statevectors
+        # fitting in MAX_BATCH_AMPLITUDES amplitudes.
+        batch_size = max(1, min(shots, self.MAX_BATCH_AMPLITUDES >> self._number_of_qubits))
+        # The instructions of columnar experiments are created on every access
+        operations = experiment.instructions
+        classical_dtype = _classical_dtype(experiment, operations)
+        # Number of random numbers drawn by each shot, one per measure or reset
+        num_draws = 0 if self._sample_measure else \
+            sum(op.name in ('measure', 'reset') for op in operations)
+        # Precompile and fuse the gates, the first axis of the statevector is the shots
+        instructions, fused_gates = compile_gate_kernels(
+            operations, self._number_of_qubits, 1, self._number_of_qubits + 1,
+            self._fusion_max_qubits)
+        for batch_start in range(0, shots, batch_size):
+            num_shots = min(batch_size, shots - batch_start)
+            self._initialize_statevector(num_shots)
             # apply global_phase
             self._statevector *= np.exp(1j * global_phase)
             # Initialize classical memory to all 0
-            self._classical_memory = 0
-            self._classical_register = 0
-            for operation in experiment.instructions:
-                conditional = getattr(operation, 'conditional', None)
-                if isinstance(conditional, int):
-                    conditional_bit_set = (self._classical_register >> conditional) & 1
-                    if not conditional_bit_set:
-                        continue
-                elif conditional is not None:
-                    mask = int(operation.conditional.mask, 16)
-                    if mask > 0:
-                        value = self._classical_memory & mask
-                        while (mask & 0x1) == 0:
-                            mask >>= 1
-                            value >>= 1
-                        if value != int(operation.conditional.val, 16):
-                            continue
-
-                # Check if single  gate
-                if operation.name == 'unitary':
-                    qubits = operation.qubits
-                    gate = operation.params[0]
-                    self._add_unitary(gate, qubits)
-                elif operation.name in ('U', 'u1', 'u2', 'u3'):
-                    params = getattr(operation, 'params', None)
-                    qubit = operation.qubits[0]
-                    gate = single_gate_matrix(operation.name, params)
-                    self._add_unitary(gate, [qubit])
-                # Check if CX gate
-                elif operation.name in ('id', 'u0'):
-                    pass
-                elif operation.name in ('CX', 'cx'):
-                    qubit0 = operation.qubits[0]
-                    qubit1 = operation.qubits[1]
-                    gate = cx_gate_matrix()
-                    self._add_unitary(gate, [qubit0, qubit1])
+            self._classical_memory = np.zeros(num_shots, dtype=classical_dtype)
+            self._classical_register = np.zeros(num_shots, dtype=classical_dtype)
+            # Draw the random numbers of the shots in order, so that they get
+            # the same outcomes as when simulated one by one
+            self._random_numbers = self._local_random.rand(num_shots, num_draws)
+            self._random_column = 0
+            for operation, kernel in instructions:
+                # Indices of the shots the operation applies to, None for all
+                shots_idx = self._get_conditional_shots(operation)
+
+                # Check if gate
+                if kernel is not None:
+                    self._add_kernel(kernel, shots_idx)
                 # Check if reset
                 elif operation.name == 'reset':
                     qubit = operation.qubits[0]
-                    self._add_qasm_reset(qubit)
-                # Check if barrier
-                elif operation.name == 'barrier':
-                    pass
+                    self._add_qasm_reset(qubit, shots_idx)
                 # Check if measure
                 elif operation.name == 'measure':
                     qubit = operation.qubits[0]
@@ -544,40 +658,9 @@ class QasmSimulatorPy(BaseBackend):
                         measure_sample_ops.append((qubit, cmembit))
                     else:
                         # If not sampling perform measurement as normal
-                        self._add_qasm_measure(qubit, cmembit, cregbit)
+                        self._add_qasm_measure(qubit, cmembit, cregbit, shots_idx)
                 elif operation.name == 'bfunc':
-                    mask = int(operation.mask, 16)
-                    relation = operation.relation
-                    val = int(operation.val, 16)
-
-                    cregbit = operation.register
-                    cmembit = operation.memory if hasattr(operation, 'memory') else None
-
-                    compared = (self._classical_register & mask) - val
-
-                    if relation == '==':
-                        outcome = (compared == 0)
-                    elif relation == '!=':
-                        outcome = (compared != 0)
-                    elif relation == '<':
-                        outcome = (compared < 0)
-                    elif relation == '<=':
-                        outcome = (compared <= 0)
-                    elif relation == '>':
-                        outcome = (compared > 0)
-                    elif relation == '>=':
-                        outcome = (compared >= 0)
-                    else:
-                        raise BasicAerError('Invalid boolean function relation.')
-
-                    # Store outcome in register and optionally memory slot
-                    regbit = 1 << cregbit
-                    self._classical_register = \
-                        (self._classical_register & (~regbit)) | (int(outcome) << cregbit)
-                    if cmembit is not None:
-                        membit = 1 << cmembit
-                        self._classical_memory = \
-                            (self._classical_memory & (~membit)) | (int(outcome) << cmembit)
+                    self._add_bfunc(operation, shots_idx)
                 else:
                     backend = self.name()
                     err_msg = '{0} encountered unrecognized operation "{1}"'
@@ -589,9 +672,8 @@ class QasmSimulatorPy(BaseBackend):
                     # If sampling we generate all shot samples from the final statevector
                     memory = self._add_sample_measure(measure_sample_ops, self._shots)
                 else:
-                    # Turn classical_memory (int) into bit string and pad zero for unused cmembits
-                    outcome = bin(self._classical_memory)[2:]
-                    memory.append(hex(int(outcome, 2)))
+                    # Turn classical_memory (int) into hex string for every shot
+                    memory.extend(hex(int(value)) for value in self._classical_memory)
 
         # Add data
         data = {'counts': dict(Counter(memory))}
@@ -614,6 +696,7 @@ class QasmSimulatorPy(BaseBackend):
                 'status': 'DONE',
                 'success': True,
                 'time_taken': (end - start),
+                'metadata': {'fused_gates': fused_gates},
                 'header': experiment.header.to_dict()}
 
     def _validate(self, qobj):
@@ -629,6 +712,47 @@ class QasmSimulatorPy(BaseBackend):
             if experiment.config.memory_slots == 0:
                 logger.warning('No classical registers in circuit "%s", '
                                'counts will be empty.', name)
-            elif 'measure' not in [op.name for op in experiment.instructions]:
+            elif 'measure' not in experiment.instruction_names():
                 logger.warning('No measurements in circuit "%s", '
                                'classical register will remain all zeros.', name)
+
+
+def _classical_dtype(experiment, instructions):
+    """Return the dtype holding the classical memory and register of an experiment.
+
+    The bits are stored in 64 bits integers, or in Python integers if the
+    experiment uses more bits.
+    """
+    num_bits = experiment.config.memory_slots
+    for instruction in instructions:
+        for bits in (getattr(instruction, 'memory', None), getattr(instruction, 'register', None),
+                     getattr(instruction, 'conditional', None)):
+            if isinstance(bits, int):
+                num_bits = max(num_bits, bits + 1)
+            elif isinstance(bits, list) and bits:
+                num_bits = max(num_bits, max(bits) + 1)
+        if instruction.name == 'bfunc':
+            num_bits = max(num_bits, int(instruction.mask, 16).bit_length(),
+                           int(instruction.val, 16).bit_length())
+    return np.int64 if num_bits < 63 else object
+
+
+def _set_bit(values, bit, outcomes, shots=None):
+    """Set a bit of the classical values of the shots to their outcomes.
+
+    Args:
+        values (np.ndarray): the classical memory or register of every shot.
+        bit (int): the bit to set.
+        outcomes (np.ndarray): the boolean outcomes of the updated shots.
+        shots (np.ndarray): indices of the updated shots. If ``None``, all the
+            shots are updated.
+
+    Returns:
+        np.ndarray: the updated values.
+    """
+    mask = 1 << bit
+    outcomes = outcomes.astype(values.dtype) << bit
+    if shots is None:
+        return (values & ~mask) | outcomes
+    values[shots] = (values[shots] & ~mask) | outcomes
+    return values
@@ -109,6 +109,7 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_statevector": vector_like
                 * "chop_threshold": double
+                * "fusion_max_qubits": int
 
             The "initial_statevector" option specifies a custom initial
             initial statevector for the simulator to be used instead of the all
@@ -119,6 +120,11 @@ class StatevectorSimulatorPy(QasmSimulatorPy):
             setting small values to zero in the output statevector. The default
             value is 1e-15.
 
+            The "fusion_max_qubits" option specifies the maximum number of
+            qubits of the blocks of adjacent gates fused into a single unitary
+            before the simulation. The default value 1 only fuses the runs of
+            single-qubit gates, and 0 disables the fusion.
+
             Example::
 
                 backend_options = {
@@ -37,9 +37,8 @@ from qiskit.providers import BaseBackend
 from qiskit.providers.basicaer.basicaerjob import BasicAerJob
 from qiskit.result import Result
 from .exceptions import BasicAerError
-from .basicaertools import single_gate_matrix
-from .basicaertools import cx_gate_matrix
-from .basicaertools import einsum_matmul_index
+from .basicaertools import GateKernel
+from .basicaertools import compile_gate_kernels
 
 logger = logging.getLogger(__name__)
 
@@ -103,7 +102,8 @@ class UnitarySimulatorPy(BaseBackend):
 
     DEFAULT_OPTIONS = {
         "initial_unitary": None,
-        "chop_threshold": 1e-15
+        "chop_threshold": 1e-15,
+        "fusion_max_qubits": 1
     }
 
     def __init__(self, configuration=None, provider=None):
@@ -116,6 +116,7 @@ class UnitarySimulatorPy(BaseBackend):
         self._number_of_qubits = 0
         self._initial_unitary = None
         self._chop_threshold = 1e-15
+        self._fusion_max_qubits = 1
         self._global_phase = 0
 
     def _add_unitary(self, gate, qubits):
@@ -125,16 +126,10 @@ class UnitarySimulatorPy(BaseBackend):
             gate (matrix_like): an N-qubit unitary matrix
             qubits (list): the list of N-qubits.
         """
-        # Get the number of qubits
-        num_qubits = len(qubits)
-        # Compute einsum index string for 1-qubit matrix multiplication
-        indexes = einsum_matmul_index(qubits, self._number_of_qubits)
-        # Convert to complex rank-2N tensor
-        gate_tensor = np.reshape(np.array(gate, dtype=complex),
-                                 num_qubits * [2, 2])
-        # Apply matrix multiplication
-        self._unitary = np.einsum(indexes, gate_tensor, self._unitary,
-                                  dtype=complex, casting='no')
+        # The gate acts on the row axes of the unitary tensor
+        axes = [self._number_of_qubits - 1 - qubit for qubit in qubits]
+        kernel = GateKernel(gate, axes, 2 * self._number_of_qubits)
+        self._unitary = kernel(self._unitary)
 
     def _validate_initial_unitary(self):
         """Validate an initial unitary matrix"""
@@ -154,6 +149,7 @@ class UnitarySimulatorPy(BaseBackend):
         # Reset default options
         self._initial_unitary = self.DEFAULT_OPTIONS["initial_unitary"]
         self._chop_threshold = self.DEFAULT_OPTIONS["chop_threshold"]
+        self._fusion_max_qubits = self.DEFAULT_OPTIONS["fusion_max_qubits"]
         if backend_options is None:
             backend_options = {}
 
@@ -184,6 +180,11 @@ class UnitarySimulatorPy(BaseBackend):
             self._chop_threshold = backend_options['chop_threshold']
         elif hasattr(qobj_config, 'chop_threshold'):
             self._chop_threshold = qobj_config.chop_threshold
+        # Check for custom maximum number of qubits of fused gates
+        if 'fusion_max_qubits' in backend_options:
+            self._fusion_max_qubits = backend_options['fusion_max_qubits']
+        elif hasattr(qobj_config, 'fusion_max_qubits'):
+            self._fusion_max_qubits = qobj_config.fusion_max_qubits
 
     def _initialize_unitary(self):
         """Set the initial unitary for simulation"""
@@ -221,6 +222,7 @@ class UnitarySimulatorPy(BaseBackend):
             backend_options: Is a dict of options for the backend. It may contain
                 * "initial_unitary": matrix_like
                 * "chop_threshold": double
+                * "fusion_max_qubits": int
 
             The "initial_unitary" option specifies a custom initial unitary
             matrix for the simulator to be used instead of the identity
@@ -231,6 +233,11 @@ class UnitarySimulatorPy(BaseBackend):
             setting small values to zero in the output unitary. The default
             value is 1e-15.
 
+            The "fusion_max_qubits" option specifies the maximum number of
+            qubits of the blocks of adjacent gates fused into a single unitary
+            before the simulation. The default value 1 only fuses the runs of
+            single-qubit gates, and 0 disables the fusion.
+
             Example::
 
                 backend_options = {
@@ -297,6 +304,7 @@ class UnitarySimulatorPy(BaseBackend):
                 "status": status string for the simulation
                 "success": boolean
                 "time taken": simulation time of this single experiment
+                "metadata": {"fused_gates": number of gates fused together}
                 }
 
         Raises:
@@ -311,28 +319,13 @@ class UnitarySimulatorPy(BaseBackend):
         self._validate_initial_unitary()
         self._initialize_unitary()
 
-        for operation in experiment.instructions:
-            if operation.name == 'unitary':
-                qubits = operation.qubits
-                gate = operation.params[0]
-                self._add_unitary(gate, qubits)
-            # Check if single  gate
-            elif operation.name in ('U', 'u1', 'u2', 'u3'):
-                params = getattr(operation, 'params', None)
-                qubit = operation.qubits[0]
-                gate = single_gate_matrix(operation.name, params)
-                self._add_unitary(gate, [qubit])
-            elif operation.name in ('id', 'u0'):
-                pass
-            # Check if CX gate
-            elif operation.name in ('CX', 'cx'):
-                qubit0 = operation.qubits[0]
-                qubit1 = operation.qubits[1]
-                gate = cx_gate_matrix()
-                self._add_unitary(gate, [qubit0, qubit1])
-            # Check if barrier
-            elif operation.name == 'barrier':
-                pass
+        # Precompile and fuse the gates, they act on the row axes of the unitary tensor
+        instructions, fused_gates = compile_gate_kernels(
+            experiment.instructions, self._number_of_qubits, 0, 2 * self._number_of_qubits,
+            self._fusion_max_qubits)
+        for operation, kernel in instructions:
+            if kernel is not None:
+                self._unitary = kernel(self._unitary)
             else:
                 backend = self.name()
                 err_msg = '{0} encountered unrecognized operation "{1}"'
@@ -346,6 +339,7 @@ class UnitarySimulatorPy(BaseBackend):
                 'status': 'DONE',
                 'success': True,
                 'time_taken': (end - start),
+                'metadata': {'fused_gates': fused_gates},
                 'header': experiment.header.to_dict()}
 
     def _validate(self, qobj):
@@ -371,8 +365,8 @@ class UnitarySimulatorPy(BaseBackend):
                             'Setting shots=1 for circuit "%s".',
                             self.name(), name)
                 experiment.config.shots = 1
-            for operation in experiment.instructions:
-                if operation.name in ['measure', 'reset']:
+            for operation_name in experiment.instruction_names():
+                if operation_name in ['measure', 'reset']:
                     raise BasicAerError('Unsupported "%s" instruction "%s" ' +
                                         'in circuit "%s" ', self.name(),
-                                        operation.name, name)
+                                        operation_name, name)
@@ -37,6 +37,7 @@ Qasm
    QasmQobjInstruction
    QasmQobjExperimentConfig
    QasmQobjExperiment
+   ColumnarQasmQobjExperiment
    QasmQobjConfig
    QasmExperimentCalibrations
    GateCalibration
@@ -76,6 +77,7 @@ from qiskit.qobj.qasm_qobj import QasmQobjInstruction
 from qiskit.qobj.qasm_qobj import QasmQobjExperiment
 from qiskit.qobj.qasm_qobj import QasmQobjConfig
 from qiskit.qobj.qasm_qobj import QasmQobjExperimentConfig
+from qiskit.qobj.columnar_qasm_qobj import ColumnarQasmQobjExperiment
 
 from .utils import validate_qobj_against_schema
 
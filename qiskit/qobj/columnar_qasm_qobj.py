@@ -0,0 +1,436 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Module providing a columnar representation of QASM Qobj experiments."""
+
+import io
+import itertools
+import json
+import numbers
+
+import numpy
+
+from qiskit.circuit.parameterexpression import ParameterExpression
+from qiskit.qobj.qasm_qobj import (QasmQobjExperiment, QasmQobjExperimentConfig,
+                                   QasmQobjExperimentHeader, QasmQobjInstruction)
+
+# Attributes of the instructions, in the order of QasmQobjInstruction.to_dict
+_ATTRIBUTES = ('params', 'qubits', 'register', 'memory', '_condition', 'conditional', 'label',
+               'mask', 'relation', 'val', 'snapshot_type')
+# Attributes stored in columns, as lists of integers
+_BIT_COLUMNS = ('qubits', 'register', 'memory')
+# Columns of integers, and the offsets of the instructions in the columns
+_INTEGER_COLUMNS = ('opcodes', 'qubits', 'memory', 'register', 'conditional')
+_OFFSETS = ('qubit_offsets', 'memory_offsets', 'register_offsets', 'param_offsets')
+
+
+class ColumnarQasmQobjExperiment(QasmQobjExperiment):
+    """A QASM Qobj experiment with its instructions stored in columns.
+
+    The instructions are stored in numpy arrays instead of a list of
+    :class:`QasmQobjInstruction` objects: an array of opcodes indexing the
+    ``names`` of the instructions, flat arrays of the ``qubits``, ``memory``
+    and ``register`` bits and of the real ``params`` of all the instructions,
+    with arrays of the offsets of each instruction in them, and an array of
+    the ``conditional`` registers. The attributes of the instructions which
+    do not fit in these columns (e.g. the ``mask`` and ``val`` of ``bfunc``
+    instructions, labels or complex parameters) are stored in the ``extras``
+    dictionary, keyed by the index of their instruction.
+
+    It is created by :func:`~qiskit.compiler.assemble` with ``columnar=True``,
+    or from a :class:`QasmQobjExperiment` by :meth:`from_experiment`, and
+    serializes to the same dictionary as the equivalent
+    :class:`QasmQobjExperiment` without creating an object per instruction.
+    It can also be serialized to a compact binary form with :meth:`to_bytes`.
+
+    The :attr:`instructions` are created from the columns on every access,
+    modifying them does not modify the experiment.
+    """
+
+    def __init__(self, config=None, header=None, names=None, opcodes=None,
+                 qubits=None, qubit_offsets=None, memory=None, memory_offsets=None,
+                 register=None, register_offsets=None, params=None, param_offsets=None,
+                 conditional=None, extras=None):
+        """Instantiate a ColumnarQasmQobjExperiment.
+
+        Args:
+            config (QasmQobjExperimentConfig): A config object for the experiment
+            header (QasmQobjExperimentHeader): A header object for the experiment
+            names (list[str]): The names of the instructions indexed by ``opcodes``
+            opcodes (np.ndarray): The opcode of each instruction
+            qubits (np.ndarray): The qubits of all the instructions
+            qubit_offsets (np.ndarray): The offsets of the qubits of each
+                instruction in ``qubits``, with a last item the number of qubits
+            memory (np.ndarray): The memory slots of all the instructions
+            memory_offsets (np.ndarray): The offsets of the memory slots of
+                each instruction in ``memory``
+            register (np.ndarray): The register slots of all the instructions
+            register_offsets (np.ndarray): The offsets of the register slots
+                of each instruction in ``register``
+            params (np.ndarray): The real parameters of all the instructions
+            param_offsets (np.ndarray): The offsets of the parameters of each
+                instruction in ``params``
+            conditional (np.ndarray): The conditional register of each
+                instruction, or -1 for unconditional instructions
+            extras (dict): The other attributes of the instructions, as
+                dictionaries keyed by the index of their instruction
+        """
+        # pylint: disable=super-init-not-called
+        self.config = config or QasmQobjExperimentConfig()
+        self.header = header or QasmQobjExperimentHeader()
+        self.names = list(names or [])
+        self.opcodes = _column(opcodes, numpy.int32)
+        num_instructions = len(self.opcodes)
+        self.qubits = _column(qubits, numpy.int32)
+        self.qubit_offsets = _offsets(qubit_offsets, num_instructions)
+        self.memory = _column(memory, numpy.int32)
+        self.memory_offsets = _offsets(memory_offsets, num_instructions)
+        self.register = _column(register, numpy.int32)
+        self.register_offsets = _offsets(register_offsets, num_instructions)
+        self.params = _column(params, numpy.float64)
+        self.param_offsets = _offsets(param_offsets, num_instructions)
+        self.conditional = _column(conditional, numpy.int64) if conditional is not None \
+            else numpy.full(num_instructions, -1, dtype=numpy.int64)
+        self.extras = extras or {}
+
+    @property
+    def instructions(self):
+        """The list of :class:`QasmQobjInstruction` objects of the experiment."""
+        instructions = []
+        for fields in self._instruction_fields():
+            if '_condition' in fields:
+                fields['condition'] = fields.pop('_condition')
+            instructions.append(QasmQobjInstruction(**fields))
+        return instructions
+
+    def instruction_names(self):
+        """Return the name of each instruction.
+
+        Returns:
+            list[str]: the names of the instructions, in order.
+        """
+        names = self.names
+        return [names[opcode] for opcode in self.opcodes.tolist()]
+
+    def _instruction_fields(self):
+        """Yield the attributes of each instruction, keyed as in its dictionary."""
+        columns = zip(self.instruction_names(),
+                      _split(self.params, self.param_offsets),
+                      _split(self.qubits, self.qubit_offsets),
+                      _split(self.register, self.register_offsets),
+                      _split(self.memory, self.memory_offsets),
+                      self.conditional.tolist())
+        all_extras = self.extras
+        for index, (name, params, qubits, register, memory, conditional) in enumerate(columns):
+            fields = {'name': name}
+            extras = all_extras.get(index)
+            if extras is None:
+                if params:
+                    fields['params'] = params
+                if qubits:
+                    fields['qubits'] = qubits
+                if register:
+                    fields['register'] = register
+                if memory:
+                    fields['memory'] = memory
+                if conditional >= 0:
+                    fields['conditional'] = conditional
+            else:
+                # Empty columns are absent attributes, which may be in the extras
+                values = {'params': params or None, 'qubits': qubits or None,
+                          'register': register or None, 'memory': memory or None,
+                          'conditional': conditional if conditional >= 0 else None}
+                for attr in _ATTRIBUTES:
+                    value = values.get(attr)
+                    if value is None:
+                        value = extras.get(attr)
+                    if value is not None:
+                        fields[attr] = value
+            yield fields
+
+    def to_dict(self):
+        """Return a dictionary format representation of the Experiment.
+
+        Returns:
+            dict: The dictionary form of the experiment, the same as the one
+            of the equivalent :class:`QasmQobjExperiment`.
+        """
+        instructions = list(self._instruction_fields())
+        for index, extras in self.extras.items():
+            # TODO: Remove the param type conversion when Aer understands
+            # ParameterExpression type
+            if 'params' in extras:
+                instructions[index]['params'] = [
+                    float(param) if isinstance(param, ParameterExpression) else param
+                    for param in extras['params']]
+        return {'config': self.config.to_dict(),
+                'header': self.header.to_dict(),
+                'instructions': instructions}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create a new ColumnarQasmQobjExperiment object from a dictionary.
+
+        Args:
+            data (dict): A dictionary for the experiment, as output by
+                :meth:`QasmQobjExperiment.to_dict`
+
+        Returns:
+            ColumnarQasmQobjExperiment: The object from the input dictionary.
+        """
+        return cls.from_experiment(QasmQobjExperiment.from_dict(data))
+
+    @classmethod
+    def from_experiment(cls, experiment):
+        """Create a new ColumnarQasmQobjExperiment from a QASM Qobj experiment.
+
+        Args:
+            experiment (QasmQobjExperiment): The experiment to convert
+
+        Returns:
+            ColumnarQasmQobjExperiment: The experiment in columnar form.
+        """
+        builder = ColumnarInstructionBuilder()
+        for instruction in experiment.instructions:
+            builder.append_fields(**instruction.__dict__)
+        return builder.experiment(config=experiment.config, header=experiment.header)
+
+    def to_bytes(self):
+        """Serialize the experiment to bytes.
+
+        The columns are stored as numpy arrays in an uncompressed ``.npz``
+        archive, along with the config, header, names and extras of the
+        experiment serialized as JSON. The integer columns are stored with
+        the smallest integer type holding their values, and the offsets as
+        the number of values of each instruction. Complex numbers and numpy
+        arrays in the extras are supported.
+
+        Returns:
+            bytes: The serialized experiment.
+        """
+        metadata = {'config': self.config.to_dict(),
+                    'header': self.header.to_dict(),
+                    'names': self.names,
+                    'extras': [[index, extras] for index, extras in self.extras.items()]}
+        arrays = {'metadata': numpy.frombuffer(json.dumps(metadata, default=_encode).encode(),
+                                               dtype=numpy.uint8),
+                  'params': self.params}
+        for name in _INTEGER_COLUMNS:
+            arrays[name] = _narrow(getattr(self, name))
+        for name in _OFFSETS:
+            arrays[name] = _narrow(numpy.diff(getattr(self, name)))
+        buffer = io.BytesIO()
+        numpy.savez(buffer, **arrays)
+        return buffer.getvalue()
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Deserialize an experiment serialized by :meth:`to_bytes`.
+
+        Args:
+            data (bytes): The serialized experiment.
+
+        Returns:
+            ColumnarQasmQobjExperiment: The deserialized experiment.
+        """
+        with numpy.load(io.BytesIO(data), allow_pickle=False) as arrays:
+            columns = {name: arrays[name] for name in arrays.files}
+        metadata = json.loads(columns.pop('metadata').tobytes().decode(),
+                              object_hook=_decode)
+        for name in _OFFSETS:
+            offsets = numpy.zeros(len(columns[name]) + 1, dtype=numpy.int64)
+            numpy.cumsum(columns[name], out=offsets[1:])
+            columns[name] = offsets
+        return cls(config=QasmQobjExperimentConfig.from_dict(metadata['config']),
+                   header=QasmQobjExperimentHeader.from_dict(metadata['header']),
+                   names=metadata['names'],
+                   extras={index: extras for index, extras in metadata['extras']},
+                   **columns)
+
+    def __repr__(self):
+        return "ColumnarQasmQobjExperiment(config=%s, header=%s, num_instructions=%s)" % (
+            repr(self.config), repr(self.header), len(self.opcodes))
+
+
+class ColumnarInstructionBuilder:
+    """Builder of the columns of the instructions of a
+    :class:`ColumnarQasmQobjExperiment`."""
+
+    def __init__(self):
+        self._opcode_of_name = {}
+        self.names = []
+        self.opcodes = []
+        self.qubits, self.qubit_offsets = [], [0]
+        self.memory, self.memory_offsets = [], [0]
+        self.register, self.register_offsets = [], [0]
+        self.params, self.param_offsets = [], [0]
+        self.conditional = []
+        self.extras = {}
+
+    def append(self, name, qubits=(), memory=(), register=(), params=(), conditional=-1,
+               extras=None):
+        """Append an instruction.
+
+        Args:
+            name (str): The name of the instruction
+            qubits (list[int]): The qubits of the instruction
+            memory (list[int]): The memory slots of the instruction
+            register (list[int]): The register slots of the instruction
+            params (list): The parameters of the instruction, stored in the
+                extras unless they are all real numbers
+            conditional (int): The conditional register of the instruction,
+                or -1 if it is unconditional
+            extras (dict): The other attributes of the instruction
+        """
+        opcode = self._opcode_of_name.get(name)
+        if opcode is None:
+            opcode = self._opcode_of_name[name] = len(self.names)
+            self.names.append(name)
+        if params:
+            reals = _reals(params)
+            if reals is None:
+                extras = dict(extras or {}, params=params)
+            else:
+                self.params.extend(reals)
+        if extras:
+            self.extras[len(self.opcodes)] = extras
+        self.opcodes.append(opcode)
+        self.qubits.extend(qubits)
+        self.qubit_offsets.append(len(self.qubits))
+        self.memory.extend(memory)
+        self.memory_offsets.append(len(self.memory))
+        self.register.extend(register)
+        self.register_offsets.append(len(self.register))
+        self.param_offsets.append(len(self.params))
+        self.conditional.append(conditional)
+
+    def append_fields(self, name, **fields):
+        """Append an instruction from its attributes.
+
+        The non-empty lists of integer bits and the non-negative integer
+        conditional registers are stored in the columns, and the other
+        attributes in the extras of the instruction.
+
+        Args:
+            name (str): The name of the instruction
+            fields: The attributes of the instruction, as in
+                :class:`QasmQobjInstruction`
+        """
+        columns = {}
+        extras = {}
+        for attr, value in fields.items():
+            if value is None:
+                continue
+            if attr in _BIT_COLUMNS:
+                if isinstance(value, list) and value and \
+                        all(isinstance(bit, numbers.Integral) for bit in value):
+                    columns[attr] = value
+                    continue
+            elif attr == 'params':
+                if value:
+                    columns[attr] = value
+                    continue
+            elif attr == 'conditional':
+                if isinstance(value, numbers.Integral) and value >= 0:
+                    columns[attr] = value
+                    continue
+            extras[attr] = value
+        self.append(name, extras=extras, **columns)
+
+    def experiment(self, config=None, header=None):
+        """Return the experiment of the appended instructions.
+
+        Args:
+            config (QasmQobjExperimentConfig): A config object for the experiment
+            header (QasmQobjExperimentHeader): A header object for the experiment
+
+        Returns:
+            ColumnarQasmQobjExperiment: The experiment.
+        """
+        return ColumnarQasmQobjExperiment(
+            config=config, header=header, names=self.names, opcodes=self.opcodes,
+            qubits=self.qubits, qubit_offsets=self.qubit_offsets,
+            memory=self.memory, memory_offsets=self.memory_offsets,
+            register=self.register, register_offsets=self.register_offsets,
+            params=self.params, param_offsets=self.param_offsets,
+            conditional=self.conditional, extras=self.extras)
+
+
+def _reals(params):
+    """Return the parameters as floats, or ``None`` if they are not all real numbers."""
+    if all(type(param) is float for param in params):  # pylint: disable=unidiomatic-typecheck
+        return params
+    reals = []
+    for param in params:
+        if isinstance(param, ParameterExpression):
+            try:
+                param = float(param)
+            except TypeError:
+                return None
+        if not isinstance(param, (float, numpy.floating)):
+            return None
+        reals.append(param)
+    return reals
+
+
+def _split(values, offsets):
+    """Split a column into the lists of values of each instruction, or empty
+    tuples for the instructions without values."""
+    offsets = offsets.tolist()
+    if not len(values):  # pylint: disable=len-as-condition
+        return itertools.repeat((), len(offsets) - 1)
+    values = values.tolist()
+    return [values[start:stop] if start != stop else ()
+            for start, stop in zip(offsets[:-1], offsets[1:])]
+
+
+def _column(values, dtype):
+    """Return the values as a one dimensional array."""
+    if values is None:
+        return numpy.zeros(0, dtype=dtype)
+    return numpy.asarray(values, dtype=dtype).reshape(-1)
+
+
+def _offsets(offsets, num_instructions):
+    """Return the offsets of the instructions in a column."""
+    if offsets is None:
+        return numpy.zeros(num_instructions + 1, dtype=numpy.int64)
+    return numpy.asarray(offsets, dtype=numpy.int64).reshape(-1)
+
+
+def _narrow(values):
+    """Return an integer column with the smallest integer type holding its values."""
+    if not len(values):  # pylint: disable=len-as-condition
+        return values.astype(numpy.uint8)
+    dtype = numpy.result_type(numpy.min_scalar_type(values.min()),
+                              numpy.min_scalar_type(values.max()))
+    return values.astype(dtype)
+
+
+def _encode(obj):
+    """Encode the complex numbers and numpy objects of the extras in JSON."""
+    if isinstance(obj, complex):
+        return {'__complex__': [obj.real, obj.imag]}
+    if isinstance(obj, numpy.ndarray):
+        return {'__ndarray__': obj.tolist(), 'dtype': obj.dtype.str}
+    if isinstance(obj, numpy.generic):
+        return _encode(obj.item()) if isinstance(obj, numpy.complexfloating) else obj.item()
+    raise TypeError('Object of type %s is not JSON serializable' % type(obj).__name__)
+
+
+def _decode(obj):
+    """Decode the objects encoded by :func:`_encode`."""
+    if '__complex__' in obj:
+        return complex(*obj['__complex__'])
+    if '__ndarray__' in obj:
+        return numpy.array(obj['__ndarray__'], dtype=numpy.dtype(obj['dtype']))
+    return obj
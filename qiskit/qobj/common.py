@@ -16,7 +16,7 @@ import json
 import os
 from types import SimpleNamespace
 
-import fastjsonschema
+from qiskit.validation.jsonschema.compiled_validators import compiled_validator
 
 
 path_part = 'schemas/qobj_schema.json'
@@ -25,7 +25,24 @@ path = os.path.join(
     path_part)
 with open(path) as fd:
     json_schema = json.loads(fd.read())
-validator = fastjsonschema.compile(json_schema)
+
+
+def validator(data):
+    """Validate a qobj dictionary against the qobj schema.
+
+    The schema validator is compiled, or loaded from the disk cache of
+    ``qiskit.validation.jsonschema.compiled_validators``, on first use.
+
+    Args:
+        data (dict): the qobj dictionary.
+
+    Returns:
+        dict: the validated dictionary.
+
+    Raises:
+        JsonSchemaException: if the dictionary does not conform to the schema.
+    """
+    return compiled_validator('qobj')(data)
 
 
 class QobjDictField(SimpleNamespace):
@@ -194,6 +194,14 @@ class QasmQobjExperiment:
             out += '\t%s\n' % instruction
         return out
 
+    def instruction_names(self):
+        """Return the name of each instruction.
+
+        Returns:
+            list[str]: the names of the instructions, in order.
+        """
+        return [instruction.name for instruction in self.instructions]
+
     def to_dict(self):
         """Return a dictionary format representation of the Experiment.
 
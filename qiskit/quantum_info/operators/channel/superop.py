@@ -19,6 +19,7 @@ import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.gate_matrix_cache import SessionGateMatrixCache
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.channel.quantum_channel import QuantumChannel
@@ -373,7 +374,7 @@ class SuperOp(QuantumChannel):
             # If instruction is a gate first we see if it has a
             # `to_matrix` definition and if so use that.
             try:
-                kraus = [obj.to_matrix()]
+                kraus = [SessionGateMatrixCache.matrix(obj)]
                 dim = len(kraus[0])
                 chan = SuperOp(_to_superop('Kraus', (kraus, None), dim, dim))
             except QiskitError:
@@ -22,6 +22,7 @@ import numpy as np
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
+from qiskit.circuit.gate_matrix_cache import SessionGateMatrixCache
 from qiskit.circuit.library.standard_gates import IGate, XGate, YGate, ZGate, HGate, SGate, TGate
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.predicates import is_unitary_matrix, matrix_equal
@@ -487,6 +488,10 @@ class Operator(BaseOperator, TolerancesMixin):
     @classmethod
     def _init_instruction(cls, instruction):
         """Convert a QuantumCircuit or Instruction to an Operator."""
+        if isinstance(instruction, Instruction):
+            mat = cls._instruction_to_matrix(instruction)
+            if mat is not None:
+                return Operator(np.array(mat, dtype=complex))
         # Initialize an identity operator of the correct size of the circuit
         dimension = 2 ** instruction.num_qubits
         op = Operator(np.eye(dimension))
@@ -504,9 +509,10 @@ class Operator(BaseOperator, TolerancesMixin):
         mat = None
         if hasattr(obj, 'to_matrix'):
             # If instruction is a gate first we see if it has a
-            # `to_matrix` definition and if so use that.
+            # `to_matrix` definition and if so use that. The matrices of the
+            # standard gates are shared read-only arrays.
             try:
-                mat = obj.to_matrix()
+                mat = SessionGateMatrixCache.matrix(obj)
             except QiskitError:
                 pass
         return mat
@@ -0,0 +1,143 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""In-place kernels applying qubit matrices to the data of quantum states."""
+
+import itertools
+
+import numpy as np
+
+# Maximum number of amplitudes a dense matrix is applied to at once, which
+# bounds the temporary memory of the dense kernel.
+_CHUNK_SIZE = 2 ** 16
+
+
+def apply_qubit_matrix(tensor, mat, axes):
+    """Apply a matrix to qubit axes of a tensor, in place.
+
+    Matrices are directly multiplied with tensors of at most ``_CHUNK_SIZE``
+    amplitudes. For larger tensors, diagonal matrices are applied as a
+    broadcast product. The qubits on which
+    a matrix acts as the identity unless they are all in the state
+    :math:`|1\\rangle` (the controls of controlled gates) are dropped, and the
+    matrix on the other qubits is only applied to the slice of the tensor
+    where they are. Other matrices are applied to chunks of the tensor, by
+    gathering the sub-tensors of the basis states of the qubits. None of these
+    kernels transposes or copies the full tensor.
+
+    Args:
+        tensor (np.ndarray): a complex tensor, or a view on one, with a
+            dimension 2 on every axis of ``axes``.
+        mat (np.ndarray): a ``2**k x 2**k`` matrix.
+        axes (list[int]): the tensor axes of the ``k`` qubits of the matrix,
+            from the least to the most significant one.
+    """
+    mat = np.asarray(mat, dtype=complex)
+    if not axes:
+        tensor *= mat[0, 0]
+        return
+    if tensor.size <= _CHUNK_SIZE:
+        _apply_small(tensor, mat, axes)
+        return
+    diagonal = np.diagonal(mat)
+    if np.count_nonzero(mat) == np.count_nonzero(diagonal):
+        _apply_diagonal(tensor, diagonal, axes)
+        return
+    controls = _control_bits(mat)
+    if controls:
+        targets = [bit for bit in range(len(axes)) if bit not in controls]
+        control_mask = sum(1 << bit for bit in controls)
+        indices = [control_mask | sum(((idx >> pos) & 1) << bit
+                                      for pos, bit in enumerate(targets))
+                   for idx in range(1 << len(targets))]
+        index = tensor.ndim * [slice(None)]
+        for bit in controls:
+            index[axes[bit]] = 1
+        control_axes = sorted(axes[bit] for bit in controls)
+        target_axes = [axes[bit] - np.searchsorted(control_axes, axes[bit])
+                       for bit in targets]
+        apply_qubit_matrix(tensor[tuple(index)], mat[np.ix_(indices, indices)],
+                           target_axes)
+        return
+    _apply_dense(tensor, mat, axes)
+
+
+def _apply_small(tensor, mat, axes):
+    """Apply a matrix to qubit axes of a small tensor by a matrix product."""
+    # Move the axes of the qubits first, from the most significant one
+    tensor_axes = list(reversed(axes))
+    perm = tensor_axes + [axis for axis in range(tensor.ndim) if axis not in axes]
+    moved = np.transpose(tensor, perm)
+    result = np.dot(mat, np.reshape(moved, (len(mat), -1)))
+    moved[...] = np.reshape(result, moved.shape)
+
+
+def _apply_diagonal(tensor, diagonal, axes):
+    """Multiply a tensor in place by a diagonal matrix on qubit axes."""
+    # Axes of the diagonal tensor are ordered from the most significant qubit
+    diagonal_axes = list(reversed(axes))
+    diagonal = np.transpose(np.reshape(diagonal, len(axes) * [2]),
+                            np.argsort(diagonal_axes))
+    shape = tensor.ndim * [1]
+    for axis in axes:
+        shape[axis] = 2
+    tensor *= np.reshape(diagonal, shape)
+
+
+def _control_bits(mat):
+    """Return the bits of the matrix indices on which it is controlled."""
+    dim = len(mat)
+    indices = np.arange(dim)
+    identity = np.eye(dim, dtype=complex)
+    controls = []
+    for bit in range(dim.bit_length() - 1):
+        unset = ((indices >> bit) & 1) == 0
+        # The matrix must be the identity on the rows and columns where the bit is 0
+        if np.array_equal(mat[unset], identity[unset]) and \
+                np.array_equal(mat[:, unset], identity[:, unset]):
+            controls.append(bit)
+    return controls
+
+
+def _apply_dense(tensor, mat, axes):
+    """Apply a dense matrix in place to qubit axes of a tensor, chunk by chunk."""
+    dim = len(mat)
+    other_axes = [axis for axis in range(tensor.ndim) if axis not in axes]
+    # Loop over the most significant other axes until the chunks are small enough
+    loop_axes = []
+    size = tensor.size
+    for axis in other_axes:
+        if size <= _CHUNK_SIZE:
+            break
+        loop_axes.append(axis)
+        size //= tensor.shape[axis]
+    chunk_axes = [axis - np.searchsorted(loop_axes, axis) for axis in axes]
+    chunk_ndim = tensor.ndim - len(loop_axes)
+    slices = [_basis_slice(idx, chunk_axes, chunk_ndim) for idx in range(dim)]
+
+    index = tensor.ndim * [slice(None)]
+    for values in itertools.product(*[range(tensor.shape[axis]) for axis in loop_axes]):
+        for axis, value in zip(loop_axes, values):
+            index[axis] = value
+        chunk = tensor[tuple(index)]
+        stacked = np.array([chunk[basis_slice] for basis_slice in slices])
+        result = np.dot(mat, np.reshape(stacked, (dim, -1)))
+        for row, basis_slice in enumerate(slices):
+            chunk[basis_slice] = np.reshape(result[row], stacked.shape[1:])
+
+
+def _basis_slice(index, axes, ndim):
+    """Index of the sub-tensor where the qubits on ``axes`` are in basis state ``index``."""
+    basis_slice = ndim * [slice(None)]
+    for bit, axis in enumerate(axes):
+        basis_slice[axis] = (index >> bit) & 1
+    return tuple(basis_slice)
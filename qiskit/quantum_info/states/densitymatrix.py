@@ -21,6 +21,7 @@ from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.states.quantum_state import QuantumState
+from qiskit.quantum_info.states._kernels import apply_qubit_matrix
 from qiskit.quantum_info.operators.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.scalar_op import ScalarOp
@@ -549,6 +550,11 @@ class DensityMatrix(QuantumState, TolerancesMixin):
             raise QiskitError(
                 "Operator input dimensions are not equal to statevector subsystem dimensions."
             )
+        if self.num_qubits and other.num_qubits:
+            # Qubit evolution of a copy of the matrix in place
+            ret = DensityMatrix(np.array(self._data, dtype=complex), dims=self._dims)
+            ret._evolve_qubits(other.data, qargs)
+            return ret
         # Reshape statevector and operator
         tensor = np.reshape(self.data, self._shape)
         # Construct list of tensor indices of statevector to be contracted
@@ -570,6 +576,18 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         return DensityMatrix(np.reshape(tensor, (new_dim, new_dim)),
                              dims=new_dims)
 
+    def _evolve_qubits(self, mat, qargs):
+        """Evolve the data of a qubit density matrix in place by a matrix on qubits."""
+        num_qubits = self.num_qubits
+        # The tensor must be a view on the data for the in place update
+        self._data = np.ascontiguousarray(self._data)
+        tensor = np.reshape(self._data, 2 * num_qubits * (2,))
+        # Left multiply by mat on the row axes and right multiply by its
+        # adjoint on the column axes
+        row_axes = [num_qubits - 1 - qubit for qubit in qargs]
+        apply_qubit_matrix(tensor, mat, row_axes)
+        apply_qubit_matrix(tensor, np.conj(mat), [num_qubits + axis for axis in row_axes])
+
     def _append_instruction(self, other, qargs=None):
         """Update the current Statevector by applying an instruction."""
         from qiskit.circuit.reset import Reset
@@ -578,7 +596,10 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         # Try evolving by a matrix operator (unitary-like evolution)
         mat = Operator._instruction_to_matrix(other)
         if mat is not None:
-            self._data = self._evolve_operator(Operator(mat), qargs=qargs).data
+            if qargs is not None and self.num_qubits:
+                self._evolve_qubits(mat, qargs)
+            else:
+                self._data = self._evolve_operator(Operator(mat), qargs=qargs).data
             return
 
         # Special instruction types
@@ -619,7 +640,7 @@ class DensityMatrix(QuantumState, TolerancesMixin):
         """Return a new statevector by applying an instruction."""
         if isinstance(obj, QuantumCircuit):
             obj = obj.to_instruction()
-        vec = DensityMatrix(self.data, dims=self._dims)
+        vec = DensityMatrix(np.array(self._data, dtype=complex), dims=self._dims)
         vec._append_instruction(obj, qargs=qargs)
         return vec
 
@@ -24,6 +24,7 @@ from qiskit.circuit.quantumcircuit import QuantumCircuit
 from qiskit.circuit.instruction import Instruction
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.states.quantum_state import QuantumState
+from qiskit.quantum_info.states._kernels import apply_qubit_matrix
 from qiskit.quantum_info.operators.tolerances import TolerancesMixin
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.predicates import matrix_equal
@@ -232,8 +233,9 @@ class Statevector(QuantumState, TolerancesMixin):
         if qargs is None:
             qargs = getattr(other, 'qargs', None)
 
-        # Get return vector
+        # Get return vector, whose data is then evolved in place
         ret = copy.copy(self)
+        ret._data = np.array(self._data, dtype=complex)
 
         # Evolution by a circuit or instruction
         if isinstance(other, QuantumCircuit):
@@ -610,18 +612,16 @@ class Statevector(QuantumState, TolerancesMixin):
                 statevec._set_dims(oper._output_dims)
             return statevec
 
-        # Calculate contraction dimensions
         if is_qubit:
-            # Qubit contraction
-            new_dim = statevec._dim
-            num_qargs = statevec.num_qubits
-        else:
-            # Qudit contraction
-            new_dims = list(statevec._dims)
-            for i, qubit in enumerate(qargs):
-                new_dims[qubit] = oper._output_dims[i]
-            new_dim = np.product(new_dims)
-            num_qargs = len(new_dims)
+            # Qubit evolution of the state tensor in place
+            return Statevector._evolve_qubits(statevec, oper.data, qargs)
+
+        # Calculate contraction dimensions
+        new_dims = list(statevec._dims)
+        for i, qubit in enumerate(qargs):
+            new_dims[qubit] = oper._output_dims[i]
+        new_dim = np.product(new_dims)
+        num_qargs = len(new_dims)
 
         # Get transpose axes
         indices = [num_qargs - 1 - i for i in reversed(qargs)]
@@ -629,16 +629,11 @@ class Statevector(QuantumState, TolerancesMixin):
         axes_inv = np.argsort(axes).tolist()
 
         # Calculate contraction dimensions
-        if is_qubit:
-            pre_tensor_shape = num_qargs * (2,)
-            post_tensor_shape = pre_tensor_shape
-            contract_shape = (1 << oper.num_qubits, 1 << (num_qargs - oper.num_qubits))
-        else:
-            contract_dim = np.product(oper._input_dims)
-            pre_tensor_shape = statevec._shape
-            contract_shape = (contract_dim, statevec._dim // contract_dim)
-            post_tensor_shape = list(reversed(oper._output_dims)) + [
-                pre_tensor_shape[i] for i in range(num_qargs) if i not in indices]
+        contract_dim = np.product(oper._input_dims)
+        pre_tensor_shape = statevec._shape
+        contract_shape = (contract_dim, statevec._dim // contract_dim)
+        post_tensor_shape = list(reversed(oper._output_dims)) + [
+            pre_tensor_shape[i] for i in range(num_qargs) if i not in indices]
 
         # reshape input for contraction
         statevec._data = np.reshape(np.transpose(
@@ -647,8 +642,17 @@ class Statevector(QuantumState, TolerancesMixin):
         statevec._data = np.reshape(np.transpose(statevec._data, axes_inv), new_dim)
 
         # Update dimension
-        if not is_qubit:
-            statevec._set_dims(new_dims)
+        statevec._set_dims(new_dims)
+        return statevec
+
+    @staticmethod
+    def _evolve_qubits(statevec, mat, qargs):
+        """Evolve the data of a qubit statevector in place by a matrix on qubits."""
+        num_qubits = statevec.num_qubits
+        # The tensor must be a view on the data for the in place update
+        statevec._data = np.ascontiguousarray(statevec._data)
+        tensor = np.reshape(statevec._data, num_qubits * (2,))
+        apply_qubit_matrix(tensor, mat, [num_qubits - 1 - qubit for qubit in qargs])
         return statevec
 
     @staticmethod
@@ -661,7 +665,10 @@ class Statevector(QuantumState, TolerancesMixin):
         if mat is not None:
             # Perform the composition and inplace update the current state
             # of the operator
-            return Statevector._evolve_operator(statevec, Operator(mat), qargs=qargs)
+            if qargs is None:
+                statevec._data = np.dot(mat, statevec._data)
+                return statevec
+            return Statevector._evolve_qubits(statevec, mat, qargs)
 
         # Special instruction types
         if isinstance(obj, Reset):
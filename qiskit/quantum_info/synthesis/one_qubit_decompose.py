@@ -15,14 +15,13 @@
 Decompose a single-qubit unitary via Euler angles.
 """
 
-import math
 import numpy as np
-import scipy.linalg as la
 
 from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.gate_matrix_cache import SessionGateMatrixCache
 from qiskit.circuit.library.standard_gates import (PhaseGate, U3Gate,
                                                    U1Gate, RXGate, RYGate,
-                                                   RZGate, RGate, SXGate)
+                                                   RZGate, RGate, SXGate, UGate)
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators.predicates import is_unitary_matrix
 
@@ -90,7 +89,7 @@ class OneQubitEulerDecomposer:
         Raises:
             QiskitError: If input basis is not recognized.
         """
-        self.basis = basis  # sets: self._basis, self._params, self._circuit
+        self.basis = basis  # sets: self._basis, self._params, self._gates
 
     def __call__(self,
                  unitary,
@@ -118,7 +117,7 @@ class OneQubitEulerDecomposer:
         elif hasattr(unitary, 'to_matrix'):
             # If input is Gate subclass or some other class object that has
             # a to_matrix method this will call that method.
-            unitary = unitary.to_matrix()
+            unitary = SessionGateMatrixCache.matrix(unitary)
         # Convert to numpy array incase not already an array
         unitary = np.asarray(unitary, dtype=complex)
 
@@ -130,9 +129,10 @@ class OneQubitEulerDecomposer:
             raise QiskitError("OneQubitEulerDecomposer: "
                               "input matrix is not unitary.")
         theta, phi, lam, phase = self._params(unitary)
-        circuit = self._circuit(theta, phi, lam, phase,
-                                simplify=simplify,
-                                atol=atol)
+        gates = self._gates(theta, phi, lam, simplify=simplify, atol=atol)
+        circuit = QuantumCircuit(1, global_phase=phase)
+        for gate in gates:
+            circuit._append(gate, [circuit.qubits[0]], [])
         return circuit
 
     @property
@@ -144,20 +144,20 @@ class OneQubitEulerDecomposer:
     def basis(self, basis):
         """Set the decomposition basis."""
         basis_methods = {
-            'U3': (self._params_u3, self._circuit_u3),
-            'U': (self._params_u3, self._circuit_u),
-            'PSX': (self._params_u1x, self._circuit_psx),
-            'ZSX': (self._params_u1x, self._circuit_zsx),
-            'U1X': (self._params_u1x, self._circuit_u1x),
-            'RR': (self._params_zyz, self._circuit_rr),
-            'ZYZ': (self._params_zyz, self._circuit_zyz),
-            'ZXZ': (self._params_zxz, self._circuit_zxz),
-            'XYX': (self._params_xyx, self._circuit_xyx)
+            'U3': (self._params_u3, self._gates_u3),
+            'U': (self._params_u3, self._gates_u),
+            'PSX': (self._params_u1x, self._gates_psx),
+            'ZSX': (self._params_u1x, self._gates_zsx),
+            'U1X': (self._params_u1x, self._gates_u1x),
+            'RR': (self._params_zyz, self._gates_rr),
+            'ZYZ': (self._params_zyz, self._gates_zyz),
+            'ZXZ': (self._params_zxz, self._gates_zxz),
+            'XYX': (self._params_xyx, self._gates_xyx)
         }
         if basis not in basis_methods:
             raise QiskitError("OneQubitEulerDecomposer: unsupported basis {}".format(basis))
         self._basis = basis
-        self._params, self._circuit = basis_methods[self._basis]
+        self._params, self._gates = basis_methods[self._basis]
 
     def angles(self, unitary):
         """Return the Euler angles for input array.
@@ -184,20 +184,24 @@ class OneQubitEulerDecomposer:
 
     @staticmethod
     def _params_zyz(mat):
-        """Return the euler angles and phase for the ZYZ basis."""
+        """Return the euler angles and phase for the ZYZ basis.
+
+        The ``_params`` methods also accept a stack of matrices, of shape
+        ``(k, 2, 2)``, and then return arrays of ``k`` angles and phases.
+        """
         # We rescale the input matrix to be special unitary (det(U) = 1)
         # This ensures that the quaternion representation is real
-        coeff = la.det(mat)**(-0.5)
+        coeff = np.linalg.det(mat)**(-0.5)
         phase = -np.angle(coeff)
-        su_mat = coeff * mat  # U in SU(2)
+        su_mat = np.asarray(coeff)[..., None, None] * mat  # U in SU(2)
         # OpenQASM SU(2) parameterization:
         # U[0, 0] = exp(-i(phi+lambda)/2) * cos(theta/2)
         # U[0, 1] = -exp(-i(phi-lambda)/2) * sin(theta/2)
         # U[1, 0] = exp(i(phi-lambda)/2) * sin(theta/2)
         # U[1, 1] = exp(i(phi+lambda)/2) * cos(theta/2)
-        theta = 2 * math.atan2(abs(su_mat[1, 0]), abs(su_mat[0, 0]))
-        phiplambda = 2 * np.angle(su_mat[1, 1])
-        phimlambda = 2 * np.angle(su_mat[1, 0])
+        theta = 2 * np.arctan2(abs(su_mat[..., 1, 0]), abs(su_mat[..., 0, 0]))
+        phiplambda = 2 * np.angle(su_mat[..., 1, 1])
+        phimlambda = 2 * np.angle(su_mat[..., 1, 0])
         phi = (phiplambda + phimlambda) / 2.0
         lam = (phiplambda - phimlambda) / 2.0
         return theta, phi, lam, phase
@@ -213,16 +217,13 @@ class OneQubitEulerDecomposer:
         """Return the euler angles and phase for the XYX basis."""
         # We use the fact that
         # Rx(a).Ry(b).Rx(c) = H.Rz(a).Ry(-b).Rz(c).H
-        mat_zyz = 0.5 * np.array(
-            [[
-                mat[0, 0] + mat[0, 1] + mat[1, 0] + mat[1, 1],
-                mat[0, 0] - mat[0, 1] + mat[1, 0] - mat[1, 1]
-            ],
-             [
-                 mat[0, 0] + mat[0, 1] - mat[1, 0] - mat[1, 1],
-                 mat[0, 0] - mat[0, 1] - mat[1, 0] + mat[1, 1]
-             ]],
-            dtype=complex)
+        mat = np.asarray(mat, dtype=complex)
+        mat_zyz = np.empty_like(mat)
+        mat_zyz[..., 0, 0] = mat[..., 0, 0] + mat[..., 0, 1] + mat[..., 1, 0] + mat[..., 1, 1]
+        mat_zyz[..., 0, 1] = mat[..., 0, 0] - mat[..., 0, 1] + mat[..., 1, 0] - mat[..., 1, 1]
+        mat_zyz[..., 1, 0] = mat[..., 0, 0] + mat[..., 0, 1] - mat[..., 1, 0] - mat[..., 1, 1]
+        mat_zyz[..., 1, 1] = mat[..., 0, 0] - mat[..., 0, 1] - mat[..., 1, 0] + mat[..., 1, 1]
+        mat_zyz *= 0.5
         theta, phi, lam, phase = OneQubitEulerDecomposer._params_zyz(mat_zyz)
         return -theta, phi, lam, phase
 
@@ -246,168 +247,154 @@ class OneQubitEulerDecomposer:
         return theta, phi, lam, phase - 0.5 * (theta + phi + lam)
 
     @staticmethod
-    def _circuit_zyz(theta,
-                     phi,
-                     lam,
-                     phase,
-                     simplify=True,
-                     atol=DEFAULT_ATOL):
-        circuit = QuantumCircuit(1, global_phase=phase)
+    def _gates_zyz(theta,
+                   phi,
+                   lam,
+                   simplify=True,
+                   atol=DEFAULT_ATOL):
+        gates = []
         if simplify and np.isclose(theta, 0.0, atol=atol):
-            circuit.append(RZGate(phi + lam), [0])
-            return circuit
+            gates.append(RZGate(phi + lam))
+            return gates
         if not simplify or not np.isclose(lam, 0.0, atol=atol):
-            circuit.append(RZGate(lam), [0])
+            gates.append(RZGate(lam))
         if not simplify or not np.isclose(theta, 0.0, atol=atol):
-            circuit.append(RYGate(theta), [0])
+            gates.append(RYGate(theta))
         if not simplify or not np.isclose(phi, 0.0, atol=atol):
-            circuit.append(RZGate(phi), [0])
-        return circuit
+            gates.append(RZGate(phi))
+        return gates
 
     @staticmethod
-    def _circuit_zxz(theta,
-                     phi,
-                     lam,
-                     phase,
-                     simplify=False,
-                     atol=DEFAULT_ATOL):
+    def _gates_zxz(theta,
+                   phi,
+                   lam,
+                   simplify=False,
+                   atol=DEFAULT_ATOL):
         if simplify and np.isclose(theta, 0.0, atol=atol):
-            circuit = QuantumCircuit(1, global_phase=phase)
-            circuit.append(RZGate(phi + lam), [0])
-            return circuit
-        circuit = QuantumCircuit(1, global_phase=phase)
+            return [RZGate(phi + lam)]
+        gates = []
         if not simplify or not np.isclose(lam, 0.0, atol=atol):
-            circuit.append(RZGate(lam), [0])
+            gates.append(RZGate(lam))
         if not simplify or not np.isclose(theta, 0.0, atol=atol):
-            circuit.append(RXGate(theta), [0])
+            gates.append(RXGate(theta))
         if not simplify or not np.isclose(phi, 0.0, atol=atol):
-            circuit.append(RZGate(phi), [0])
-        return circuit
+            gates.append(RZGate(phi))
+        return gates
 
     @staticmethod
-    def _circuit_xyx(theta,
-                     phi,
-                     lam,
-                     phase,
-                     simplify=True,
-                     atol=DEFAULT_ATOL):
-        circuit = QuantumCircuit(1, global_phase=phase)
+    def _gates_xyx(theta,
+                   phi,
+                   lam,
+                   simplify=True,
+                   atol=DEFAULT_ATOL):
+        gates = []
         if simplify and np.isclose(theta, 0.0, atol=atol):
-            circuit.append(RXGate(phi + lam), [0])
-            return circuit
+            gates.append(RXGate(phi + lam))
+            return gates
         if not simplify or not np.isclose(lam, 0.0, atol=atol):
-            circuit.append(RXGate(lam), [0])
+            gates.append(RXGate(lam))
         if not simplify or not np.isclose(theta, 0.0, atol=atol):
-            circuit.append(RYGate(theta), [0])
+            gates.append(RYGate(theta))
         if not simplify or not np.isclose(phi, 0.0, atol=atol):
-            circuit.append(RXGate(phi), [0])
-        return circuit
+            gates.append(RXGate(phi))
+        return gates
 
     @staticmethod
-    def _circuit_u3(theta,
-                    phi,
-                    lam,
-                    phase,
-                    simplify=True,
-                    atol=DEFAULT_ATOL):
+    def _gates_u3(theta,
+                  phi,
+                  lam,
+                  simplify=True,
+                  atol=DEFAULT_ATOL):
         # pylint: disable=unused-argument
-        circuit = QuantumCircuit(1, global_phase=phase)
-        circuit.append(U3Gate(theta, phi, lam), [0])
-        return circuit
+        return [U3Gate(theta, phi, lam)]
+
+    @staticmethod
+    def _gates_u(theta,
+                 phi,
+                 lam,
+                 simplify=True,
+                 atol=DEFAULT_ATOL):
+        # pylint: disable=unused-argument
+        return [UGate(theta, phi, lam)]
 
     @staticmethod
-    def _circuit_u(theta,
+    def _gates_psx(theta,
                    phi,
                    lam,
-                   phase,
                    simplify=True,
                    atol=DEFAULT_ATOL):
-        # pylint: disable=unused-argument
-        circuit = QuantumCircuit(1, global_phase=phase)
-        circuit.u(theta, phi, lam, 0)
-        return circuit
-
-    @staticmethod
-    def _circuit_psx(theta,
-                     phi,
-                     lam,
-                     phase,
-                     simplify=True,
-                     atol=DEFAULT_ATOL):
         # Shift theta and phi so decomposition is
         # Phase(phi+pi).SX.Phase(theta+pi).SX.Phase(lam)
         theta = _mod2pi(theta + np.pi)
         phi = _mod2pi(phi + np.pi)
-        circuit = QuantumCircuit(1, global_phase=phase)
+        gates = []
         # Check for decomposition into minimimal number required SX gates
         if simplify and np.isclose(abs(theta), np.pi, atol=atol):
             if not np.isclose(_mod2pi(abs(lam + phi + theta)),
                               [0., 2*np.pi], atol=atol).any():
-                circuit.append(PhaseGate(_mod2pi(lam + phi + theta)), [0])
+                gates.append(PhaseGate(_mod2pi(lam + phi + theta)))
         elif simplify and np.isclose(abs(theta),
                                      [np.pi/2, 3*np.pi/2], atol=atol).any():
             if not np.isclose(_mod2pi(abs(lam + theta)),
                               [0., 2*np.pi], atol=atol).any():
-                circuit.append(PhaseGate(_mod2pi(lam + theta)), [0])
-            circuit.append(SXGate(), [0])
+                gates.append(PhaseGate(_mod2pi(lam + theta)))
+            gates.append(SXGate())
             if not np.isclose(_mod2pi(abs(phi + theta)),
                               [0., 2*np.pi], atol=atol).any():
-                circuit.append(PhaseGate(_mod2pi(phi + theta)), [0])
+                gates.append(PhaseGate(_mod2pi(phi + theta)))
         else:
             if not np.isclose(abs(lam), [0., 2*np.pi], atol=atol).any():
-                circuit.append(PhaseGate(lam), [0])
-            circuit.append(SXGate(), [0])
+                gates.append(PhaseGate(lam))
+            gates.append(SXGate())
             if not np.isclose(abs(theta), [0., 2*np.pi], atol=atol).any():
-                circuit.append(PhaseGate(theta), [0])
-            circuit.append(SXGate(), [0])
+                gates.append(PhaseGate(theta))
+            gates.append(SXGate())
             if not np.isclose(abs(phi), [0., 2*np.pi], atol=atol).any():
-                circuit.append(PhaseGate(phi), [0])
-        return circuit
+                gates.append(PhaseGate(phi))
+        return gates
 
     @staticmethod
-    def _circuit_zsx(theta,
-                     phi,
-                     lam,
-                     phase,
-                     simplify=True,
-                     atol=DEFAULT_ATOL):
+    def _gates_zsx(theta,
+                   phi,
+                   lam,
+                   simplify=True,
+                   atol=DEFAULT_ATOL):
         # Shift theta and phi so decomposition is
         # RZ(phi+pi).SX.RZ(theta+pi).SX.RZ(lam)
         theta = _mod2pi(theta + np.pi)
         phi = _mod2pi(phi + np.pi)
-        circuit = QuantumCircuit(1, global_phase=phase)
+        gates = []
         # Check for decomposition into minimimal number required SX gates
         if simplify and np.isclose(abs(theta), np.pi, atol=atol):
             if not np.isclose(_mod2pi(abs(lam + phi + theta)),
                               [0., 2*np.pi], atol=atol).any():
-                circuit.append(RZGate(_mod2pi(lam + phi + theta)), [0])
+                gates.append(RZGate(_mod2pi(lam + phi + theta)))
         elif simplify and np.isclose(abs(theta),
                                      [np.pi/2, 3*np.pi/2], atol=atol).any():
             if not np.isclose(_mod2pi(abs(lam + theta)),
                               [0., 2*np.pi], atol=atol).any():
-                circuit.append(RZGate(_mod2pi(lam + theta)), [0])
-            circuit.append(SXGate(), [0])
+                gates.append(RZGate(_mod2pi(lam + theta)))
+            gates.append(SXGate())
             if not np.isclose(_mod2pi(abs(phi + theta)),
                               [0., 2*np.pi], atol=atol).any():
-                circuit.append(RZGate(_mod2pi(phi + theta)), [0])
+                gates.append(RZGate(_mod2pi(phi + theta)))
         else:
             if not np.isclose(abs(lam), [0., 2*np.pi], atol=atol).any():
-                circuit.append(RZGate(lam), [0])
-            circuit.append(SXGate(), [0])
+                gates.append(RZGate(lam))
+            gates.append(SXGate())
             if not np.isclose(abs(theta), [0., 2*np.pi], atol=atol).any():
-                circuit.append(RZGate(theta), [0])
-            circuit.append(SXGate(), [0])
+                gates.append(RZGate(theta))
+            gates.append(SXGate())
             if not np.isclose(abs(phi), [0., 2*np.pi], atol=atol).any():
-                circuit.append(RZGate(phi), [0])
-        return circuit
+                gates.append(RZGate(phi))
+        return gates
 
     @staticmethod
-    def _circuit_u1x(theta,
-                     phi,
-                     lam,
-                     phase,
-                     simplify=True,
-                     atol=DEFAULT_ATOL):
+    def _gates_u1x(theta,
+                   phi,
+                   lam,
+                   simplify=True,
+                   atol=DEFAULT_ATOL):
         # Shift theta and phi so decomposition is
         # U1(phi).X90.U1(theta).X90.U1(lam)
         theta += np.pi
@@ -415,37 +402,30 @@ class OneQubitEulerDecomposer:
         # Check for decomposition into minimimal number required X90 pulses
         if simplify and np.isclose(abs(theta), np.pi, atol=atol):
             # Zero X90 gate decomposition
-            circuit = QuantumCircuit(1, global_phase=phase)
-            circuit.append(U1Gate(lam + phi + theta), [0])
-            return circuit
+            return [U1Gate(lam + phi + theta)]
         if simplify and np.isclose(abs(theta), np.pi/2, atol=atol):
             # Single X90 gate decomposition
-            circuit = QuantumCircuit(1, global_phase=phase)
-            circuit.append(U1Gate(lam + theta), [0])
-            circuit.append(RXGate(np.pi / 2), [0])
-            circuit.append(U1Gate(phi + theta), [0])
-            return circuit
+            return [U1Gate(lam + theta),
+                    RXGate(np.pi / 2),
+                    U1Gate(phi + theta)]
         # General two-X90 gate decomposition
-        circuit = QuantumCircuit(1, global_phase=phase)
-        circuit.append(U1Gate(lam), [0])
-        circuit.append(RXGate(np.pi / 2), [0])
-        circuit.append(U1Gate(theta), [0])
-        circuit.append(RXGate(np.pi / 2), [0])
-        circuit.append(U1Gate(phi), [0])
-        return circuit
+        return [U1Gate(lam),
+                RXGate(np.pi / 2),
+                U1Gate(theta),
+                RXGate(np.pi / 2),
+                U1Gate(phi)]
 
     @staticmethod
-    def _circuit_rr(theta,
-                    phi,
-                    lam,
-                    phase,
-                    simplify=True,
-                    atol=DEFAULT_ATOL):
-        circuit = QuantumCircuit(1, global_phase=phase)
+    def _gates_rr(theta,
+                  phi,
+                  lam,
+                  simplify=True,
+                  atol=DEFAULT_ATOL):
+        gates = []
         if not simplify or not np.isclose(theta, -np.pi, atol=atol):
-            circuit.append(RGate(theta + np.pi, np.pi / 2 - lam), [0])
-        circuit.append(RGate(-np.pi, 0.5 * (phi - lam + np.pi)), [0])
-        return circuit
+            gates.append(RGate(theta + np.pi, np.pi / 2 - lam))
+        gates.append(RGate(-np.pi, 0.5 * (phi - lam + np.pi)))
+        return gates
 
 
 def _mod2pi(angle):
@@ -31,6 +31,7 @@ import scipy.linalg as la
 
 from qiskit.circuit.quantumregister import QuantumRegister
 from qiskit.circuit.quantumcircuit import QuantumCircuit
+from qiskit.circuit.gate_matrix_cache import SessionGateMatrixCache
 from qiskit.circuit.library.standard_gates.x import CXGate
 from qiskit.exceptions import QiskitError
 from qiskit.quantum_info.operators import Operator
@@ -416,7 +417,7 @@ class TwoQubitBasisDecomposer():
         if hasattr(target, 'to_matrix'):
             # If input is Gate subclass or some other class object that has
             # a to_matrix method this will call that method.
-            target = target.to_matrix()
+            target = SessionGateMatrixCache.matrix(target)
         # Convert to numpy array incase not already an array
         target = np.asarray(target, dtype=complex)
         # Check input is a 2-qubit unitary
@@ -451,7 +452,7 @@ class TwoQubitBasisDecomposer():
         if hasattr(unitary, 'to_operator'):
             unitary = unitary.to_operator().data
         if hasattr(unitary, 'to_matrix'):
-            unitary = unitary.to_matrix()
+            unitary = SessionGateMatrixCache.matrix(unitary)
         unitary = np.asarray(unitary, dtype=complex)
         a, b, c = weyl_coordinates(unitary)[:]
         traces = [4*(np.cos(a)*np.cos(b)*np.cos(c)+1j*np.sin(a)*np.sin(b)*np.sin(c)),
@@ -46,10 +46,22 @@
 """
 Routines for running Python functions in parallel using process pools
 from the multiprocessing library.
+
+The processes are held in a single module level pool that is started on the
+first parallel call and then reused, so that repeated calls to
+:func:`parallel_map` (e.g. from ``transpile`` inside an optimization loop) do
+not pay the cost of spawning and importing Qiskit in fresh workers every time.
+The ``num_processes`` of a call limits how many of its tasks run at once on
+the pool, it does not change the size of the pool. The lifetime and size of
+the pool can be controlled explicitly with :func:`start_pool`,
+:func:`resize_pool` and :func:`shutdown_pool`.
 """
 
 import os
-from concurrent.futures import ProcessPoolExecutor
+import atexit
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
 from qiskit.exceptions import QiskitError
 from qiskit.utils.multiprocessing import local_hardware_info
 from qiskit.tools.events.pubsub import Publisher
@@ -68,14 +80,152 @@ elif 'num_processes' in CONFIG:
 else:
     CPU_COUNT = local_hardware_info()['cpus']
 
+# The shared worker pool, its size and the pid of the process that owns it.
+_POOL = None
+_POOL_SIZE = 0
+_POOL_PID = None
+_POOL_LOCK = threading.RLock()
+
+# Estimated cost (roughly the number of circuit instructions) worth of tasks
+# that is bundled into a single chunk sent to a worker.
+_CHUNK_COST = 2000
+# Minimum number of chunks per worker, to keep the load balanced.
+_CHUNKS_PER_WORKER = 4
+
+
+def _chunk_task_wrapper(param):
+    (task, chunk, task_args, task_kwargs) = param
+    return [task(value, *task_args, **task_kwargs) for value in chunk]
+
+
+def _estimate_cost(value):
+    """Rough estimate of the cost of running a task on ``value``.
+
+    Sized values are weighted by their length, which is the number of
+    instructions for circuits and schedules. For tuples the first element is
+    used, which covers the ``(circuit, args)`` pairs built by ``transpile``.
+    """
+    if isinstance(value, tuple) and value:
+        value = value[0]
+    try:
+        return max(1, len(value))
+    except TypeError:
+        return 1
+
+
+def _default_chunksize(values, num_processes):
+    """Pick the number of values sent to a worker at once.
+
+    Cheap tasks are bundled until a chunk holds about ``_CHUNK_COST`` worth of
+    work, so the IPC overhead is amortized, while every worker still gets at
+    least ``_CHUNKS_PER_WORKER`` chunks. Expensive tasks are sent one by one.
+    """
+    num_values = len(values)
+    max_chunksize = -(-num_values // (num_processes * _CHUNKS_PER_WORKER))
+    sample = [values[idx] for idx in range(0, num_values, max(1, num_values // 16))]
+    mean_cost = sum(_estimate_cost(value) for value in sample) / len(sample)
+    return max(1, min(max_chunksize, int(_CHUNK_COST // mean_cost)))
+
+
+def _pool_initializer():
+    """Prepare a freshly started worker of the shared pool."""
+    # Workers must never try to start a nested pool of their own. The flag is
+    # only set in the workers, the process calling parallel_map can still run
+    # other parallel calls, e.g. between the results of parallel_imap.
+    os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+    # Pay the import cost of the heavy subsystems once, when the worker is
+    # started, instead of in the first task that happens to need them.
+    # pylint: disable=unused-import,cyclic-import
+    import qiskit.compiler
+    import qiskit.transpiler.passes
+    import qiskit.assembler
+
+
+def _warmup_task(_):
+    return os.getpid()
+
+
+def _release_pool(wait=True):
+    """Drop the reference to the shared pool, shutting it down if owned."""
+    global _POOL, _POOL_SIZE, _POOL_PID  # pylint: disable=global-statement
+    pool, owner = _POOL, _POOL_PID
+    _POOL, _POOL_SIZE, _POOL_PID = None, 0, None
+    # A pool inherited through ``fork`` belongs to the parent process and
+    # must not be touched by the child.
+    if pool is not None and owner == os.getpid():
+        pool.shutdown(wait=wait)
+
+
+def start_pool(num_processes=CPU_COUNT):
+    """Start the shared worker pool used by :func:`parallel_map`.
+
+    The workers are spawned and warmed up (the transpiler, compiler and
+    assembler are imported) before this function returns, so the first call
+    to :func:`parallel_map` does not pay for it. If a pool with the same
+    number of processes is already running this is a no-op, otherwise the
+    running pool is replaced.
+
+    Args:
+        num_processes (int): Number of worker processes in the pool.
+
+    Raises:
+        QiskitError: If ``num_processes`` is not a positive integer.
+    """
+    global _POOL, _POOL_SIZE, _POOL_PID  # pylint: disable=global-statement
+    if num_processes < 1:
+        raise QiskitError('The number of processes must be a positive integer, '
+                          'not %s.' % num_processes)
+    with _POOL_LOCK:
+        if _POOL is not None and _POOL_PID == os.getpid() and _POOL_SIZE == num_processes:
+            return
+        _release_pool()
+        pool = ProcessPoolExecutor(max_workers=num_processes,
+                                   initializer=_pool_initializer)
+        list(pool.map(_warmup_task, range(num_processes)))
+        _POOL, _POOL_SIZE, _POOL_PID = pool, num_processes, os.getpid()
+
+
+def resize_pool(num_processes):
+    """Change the number of workers in the shared pool.
+
+    The running workers are shut down once they have finished their current
+    tasks and a new pool of ``num_processes`` workers is started.
+
+    Args:
+        num_processes (int): New number of worker processes in the pool.
+    """
+    start_pool(num_processes)
+
 
-def _task_wrapper(param):
-    (task, value, task_args, task_kwargs) = param
-    return task(value, *task_args, **task_kwargs)
+def shutdown_pool(wait=True):
+    """Shut down the shared worker pool.
+
+    The pool is started again by the next parallel call to
+    :func:`parallel_map`. This is called automatically when the interpreter
+    exits.
+
+    Args:
+        wait (bool): Block until all the workers have exited.
+    """
+    with _POOL_LOCK:
+        _release_pool(wait=wait)
+
+
+def _get_pool(num_processes):
+    """Return the shared pool, starting it with ``num_processes`` workers if
+    it is not running. A running pool is reused whatever its size."""
+    with _POOL_LOCK:
+        if _POOL is None or _POOL_PID != os.getpid():
+            start_pool(num_processes)
+        return _POOL
+
+
+atexit.register(shutdown_pool)
 
 
 def parallel_map(  # pylint: disable=dangerous-default-value
-        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT):
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        chunksize=None):
     """
     Parallel execution of a mapping of `values` to the function `task`. This
     is functionally equivalent to::
@@ -85,13 +235,22 @@ def parallel_map(  # pylint: disable=dangerous-default-value
     On Windows this function defaults to a serial implementation to avoid the
     overhead from spawning processes in Windows.
 
+    The tasks are run on the shared worker pool (see :func:`start_pool`),
+    which is started on first use with ``num_processes`` workers and kept
+    alive between calls. At most ``num_processes`` chunks of tasks of a call
+    run at once, whatever the size of the running pool, which only changes
+    with :func:`resize_pool`.
+
     Args:
         task (func): Function that is to be called for each value in ``values``.
         values (array_like): List or array of values for which the ``task``
                             function is to be evaluated.
         task_args (list): Optional additional arguments to the ``task`` function.
         task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
-        num_processes (int): Number of processes to spawn.
+        num_processes (int): Maximum number of processes running the tasks.
+        chunksize (int): Number of values sent to a worker at once. If ``None``
+            it is chosen from the number of values and their estimated cost
+            (e.g. the size of the circuits).
 
     Returns:
         result: The result list contains the value of
@@ -110,46 +269,117 @@ def parallel_map(  # pylint: disable=dangerous-default-value
         return []
     if len(values) == 1:
         return [task(values[0], *task_args, **task_kwargs)]
+    return list(parallel_imap(task, values, task_args, task_kwargs,
+                              num_processes=num_processes, chunksize=chunksize))
 
-    Publisher().publish("terra.parallel.start", len(values))
-    nfinished = [0]
 
-    def _callback(_):
-        nfinished[0] += 1
-        Publisher().publish("terra.parallel.done", nfinished[0])
+def parallel_imap(  # pylint: disable=dangerous-default-value
+        task, values, task_args=tuple(), task_kwargs={}, num_processes=CPU_COUNT,
+        chunksize=None, ordered=True):
+    """
+    Lazy version of :func:`parallel_map` that yields the results as soon as
+    they are available, instead of building the full list first. This allows
+    processing the first results, e.g. assembling and submitting transpiled
+    circuits, while the remaining tasks are still running::
+
+        for circuit in parallel_imap(transpile, circuits,
+                                     task_kwargs={'backend': backend}):
+            job = backend.run(circuit)
+
+    Args:
+        task (func): Function that is to be called for each value in ``values``.
+        values (array_like): List or array of values for which the ``task``
+                            function is to be evaluated.
+        task_args (list): Optional additional arguments to the ``task`` function.
+        task_kwargs (dict): Optional additional keyword argument to the ``task`` function.
+        num_processes (int): Maximum number of processes running the tasks.
+        chunksize (int): Number of values sent to a worker at once. If ``None``
+            it is chosen from the number of values and their estimated cost.
+        ordered (bool): If ``True`` the results are yielded in the order of
+            ``values``. Otherwise ``(index, result)`` pairs are yielded in the
+            order the tasks finish.
+
+    Yields:
+        The value of ``task(value, *task_args, **task_kwargs)`` for each value
+        in ``values``, or ``(index, result)`` pairs if ``ordered`` is ``False``.
+
+    Raises:
+        QiskitError: If user interrupts via keyboard.
+
+    Events:
+        terra.parallel.start: The collection of parallel tasks are about to start.
+        terra.parallel.done: Some of the parallel tasks have finished.
+        terra.parallel.finish: All the parallel tasks have finished.
+    """
+    if len(values) == 0:
+        return
+
+    Publisher().publish("terra.parallel.start", len(values))
 
     # Run in parallel if not Win and not in parallel already
-    if num_processes > 1 and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE' \
+    if num_processes > 1 and len(values) > 1 and os.getenv('QISKIT_IN_PARALLEL') == 'FALSE' \
             and CONFIG.get('parallel_enabled', user_config.PARALLEL_DEFAULT):
-        os.environ['QISKIT_IN_PARALLEL'] = 'TRUE'
+        futures = {}
         try:
-            results = []
-            with ProcessPoolExecutor(max_workers=num_processes) as executor:
-                param = map(lambda value: (task, value, task_args, task_kwargs), values)
-                future = executor.map(_task_wrapper, param)
+            executor = _get_pool(num_processes)
+            if chunksize is None:
+                chunksize = _default_chunksize(values, num_processes)
+            starts = iter(range(0, len(values), chunksize))
+
+            def submit_chunks():
+                # Keep at most num_processes chunks of this call in the pool
+                for start in starts:
+                    chunk = [values[idx]
+                             for idx in range(start, min(start + chunksize, len(values)))]
+                    param = (task, chunk, task_args, task_kwargs)
+                    futures[executor.submit(_chunk_task_wrapper, param)] = start
+                    if len(futures) >= num_processes:
+                        break
 
-            results = list(future)
-            Publisher().publish("terra.parallel.done", len(results))
+            # Results of the chunks finished ahead of the next one to yield
+            finished = {}
+            next_start = 0
+            nfinished = 0
+            submit_chunks()
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                results = []
+                for future in done:
+                    start = futures.pop(future)
+                    chunk_results = future.result()
+                    nfinished += len(chunk_results)
+                    if ordered:
+                        finished[start] = chunk_results
+                    else:
+                        results.extend(enumerate(chunk_results, start))
+                Publisher().publish("terra.parallel.done", nfinished)
+                submit_chunks()
+                while next_start in finished:
+                    chunk_results = finished.pop(next_start)
+                    results.extend(chunk_results)
+                    next_start += len(chunk_results)
+                yield from results
 
-        except (KeyboardInterrupt, Exception) as error:
+        except (KeyboardInterrupt, BrokenProcessPool) as error:
+            # The workers may still be busy with (or have died in) the
+            # interrupted tasks, so start from a clean pool next time.
+            shutdown_pool(wait=False)
             if isinstance(error, KeyboardInterrupt):
-                Publisher().publish("terra.parallel.finish")
-                os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
                 raise QiskitError('Keyboard interrupt in parallel_map.')
-            # Otherwise just reset parallel flag and error
-            os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
             raise error
 
-        Publisher().publish("terra.parallel.finish")
-        os.environ['QISKIT_IN_PARALLEL'] = 'FALSE'
-        return results
+        finally:
+            # Drop the tasks that are not needed anymore if the consumer
+            # stopped early or one of the tasks failed.
+            for future in futures:
+                future.cancel()
+            Publisher().publish("terra.parallel.finish")
+        return
 
     # Cannot do parallel on Windows , if another parallel_map is running in parallel,
     # or len(values) == 1.
-    results = []
-    for _, value in enumerate(values):
+    for index, value in enumerate(values):
         result = task(value, *task_args, **task_kwargs)
-        results.append(result)
-        _callback(0)
+        Publisher().publish("terra.parallel.done", index + 1)
+        yield result if ordered else (index, result)
     Publisher().publish("terra.parallel.finish")
-    return results
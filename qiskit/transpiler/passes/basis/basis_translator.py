@@ -14,11 +14,12 @@
 
 import time
 import logging
+import threading
 
 from heapq import heappush, heappop
 from itertools import zip_longest
 from itertools import count as iter_count
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
 import numpy as np
 
@@ -30,6 +31,11 @@ from qiskit.transpiler.exceptions import TranspilerError
 
 logger = logging.getLogger(__name__)
 
+# Cache of the instruction substitution rules, see _translation_plan.
+_PLAN_CACHE = OrderedDict()
+_PLAN_CACHE_SIZE = 256
+_PLAN_CACHE_LOCK = threading.Lock()
+
 
 class BasisTranslator(TransformationPass):
     """Translates gates to a target basis by searching for a set of translations
@@ -94,29 +100,7 @@ class BasisTranslator(TransformationPass):
         logger.info('Begin BasisTranslator from source basis %s to target '
                     'basis %s.', source_basis, target_basis)
 
-        # Search for a path from source to target basis.
-
-        search_start_time = time.time()
-        basis_transforms = _basis_search(self._equiv_lib, source_basis,
-                                         target_basis, _basis_heuristic)
-        search_end_time = time.time()
-        logger.info('Basis translation path search completed in %.3fs.',
-                    search_end_time - search_start_time)
-
-        if basis_transforms is None:
-            raise TranspilerError(
-                'Unable to map source basis {} to target basis {} '
-                'over library {}.'.format(
-                    source_basis, target_basis, self._equiv_lib))
-
-        # Compose found path into a set of instruction substitution rules.
-
-        compose_start_time = time.time()
-        instr_map = _compose_transforms(basis_transforms, source_basis, dag)
-
-        compose_end_time = time.time()
-        logger.info('Basis translation paths composed in %.3fs.',
-                    compose_end_time - compose_start_time)
+        instr_map = _translation_plan(self._equiv_lib, source_basis, target_basis, dag)
 
         # Replace source instructions with target translations.
 
@@ -169,6 +153,70 @@ class BasisTranslator(TransformationPass):
         return dag
 
 
+def _translation_plan(equiv_lib, source_basis, target_basis, dag):
+    """Return the instruction substitution rules from source_basis to target_basis.
+
+    The rules are cached, keyed by the source and target bases and the version
+    of the equivalence library, so circuits with the same gates are translated
+    with the rules found for the first one. The cache is held at the module
+    level, shared by all the pass instances of a process (e.g. of a worker of
+    the parallel transpilation pool), and bounded to the last
+    ``_PLAN_CACHE_SIZE`` plans. Mutating the library changes its version, which
+    invalidates its cached plans.
+
+    Raises:
+        TranspilerError: if the target basis cannot be reached
+    """
+    # The rules also depend on the number of parameters of the source gates.
+    num_params = {(node.op.name, node.op.num_qubits): len(node.op.params)
+                  for node in dag.op_nodes()}
+    key = (equiv_lib._version_key(), frozenset(target_basis),
+           frozenset((name, num_qubits, num_params[name, num_qubits])
+                     for name, num_qubits in source_basis))
+    with _PLAN_CACHE_LOCK:
+        if key in _PLAN_CACHE:
+            _PLAN_CACHE.move_to_end(key)
+            instr_map = _PLAN_CACHE[key]
+            logger.info('Basis translation plan found in cache.')
+            if instr_map is None:
+                raise TranspilerError(
+                    'Unable to map source basis {} to target basis {} '
+                    'over library {}.'.format(source_basis, target_basis, equiv_lib))
+            return instr_map
+
+    # Search for a path from source to target basis.
+
+    search_start_time = time.time()
+    basis_transforms = _basis_search(equiv_lib, source_basis,
+                                     target_basis, _basis_heuristic)
+    search_end_time = time.time()
+    logger.info('Basis translation path search completed in %.3fs.',
+                search_end_time - search_start_time)
+
+    if basis_transforms is None:
+        instr_map = None
+    else:
+        # Compose found path into a set of instruction substitution rules.
+
+        compose_start_time = time.time()
+        instr_map = _compose_transforms(basis_transforms, source_basis, dag)
+
+        compose_end_time = time.time()
+        logger.info('Basis translation paths composed in %.3fs.',
+                    compose_end_time - compose_start_time)
+
+    with _PLAN_CACHE_LOCK:
+        _PLAN_CACHE[key] = instr_map
+        if len(_PLAN_CACHE) > _PLAN_CACHE_SIZE:
+            _PLAN_CACHE.popitem(last=False)
+
+    if instr_map is None:
+        raise TranspilerError(
+            'Unable to map source basis {} to target basis {} '
+            'over library {}.'.format(source_basis, target_basis, equiv_lib))
+    return instr_map
+
+
 def _basis_heuristic(basis, target):
     """Simple metric to gauge distance between two bases as the number of
     elements in the symmetric difference of the circuit basis and the device
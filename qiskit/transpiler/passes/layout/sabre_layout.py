@@ -22,10 +22,12 @@ from qiskit.transpiler.passes.layout.full_ancilla_allocation import FullAncillaA
 from qiskit.transpiler.passes.layout.enlarge_with_ancilla import EnlargeWithAncilla
 from qiskit.transpiler.passes.layout.apply_layout import ApplyLayout
 from qiskit.transpiler.passes.routing import SabreSwap
+from qiskit.transpiler.passes.routing.sabre_swap import _trial_seeds
 from qiskit.transpiler.passmanager import PassManager
 from qiskit.transpiler.layout import Layout
 from qiskit.transpiler.basepasses import AnalysisPass
 from qiskit.transpiler.exceptions import TranspilerError
+from qiskit.tools.parallel import parallel_map
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +52,7 @@ class SabreLayout(AnalysisPass):
     """
 
     def __init__(self, coupling_map, routing_pass=None, seed=None,
-                 max_iterations=3):
+                 max_iterations=3, trials=1):
         """SabreLayout initializer.
 
         Args:
@@ -58,12 +60,18 @@ class SabreLayout(AnalysisPass):
             routing_pass (BasePass): the routing pass to use while iterating.
             seed (int): seed for setting a random first trial layout.
             max_iterations (int): number of forward-backward iterations.
+            trials (int): number of independently seeded layout searches, run
+                in parallel. The layout of the search whose final forward
+                routing has the fewest swaps, and then the lowest depth, is
+                kept. The first trial uses ``seed`` and the seeds of the other
+                ones are drawn from it.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.routing_pass = routing_pass
         self.seed = seed
         self.max_iterations = max_iterations
+        self.trials = trials
 
     def run(self, dag):
         """Run the SabreLayout pass on `dag`.
@@ -77,10 +85,22 @@ class SabreLayout(AnalysisPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
-        # Choose a random initial_layout.
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
-        rng = np.random.default_rng(self.seed)
+
+        if self.trials > 1:
+            results = parallel_map(_layout_trial, _trial_seeds(self.seed, self.trials),
+                                   task_args=(self, dag))
+            self.property_set['layout'] = min(results, key=lambda result: result[1])[0]
+        else:
+            self.property_set['layout'] = self._search_layout(dag, self.seed)
+
+    def _search_layout(self, dag, seed):
+        """Return the layout found by forward-backward iterations from a
+        random initial layout chosen with ``seed``.
+        """
+        # Choose a random initial_layout.
+        rng = np.random.default_rng(seed)
 
         physical_qubits = rng.choice(self.coupling_map.size(),
                                      len(dag.qubits), replace=False)
@@ -88,14 +108,15 @@ class SabreLayout(AnalysisPass):
         initial_layout = Layout({q: dag.qubits[i]
                                  for i, q in enumerate(physical_qubits)})
 
-        if self.routing_pass is None:
-            self.routing_pass = SabreSwap(self.coupling_map, 'decay', seed=self.seed)
+        routing_pass = self.routing_pass
+        if routing_pass is None:
+            routing_pass = SabreSwap(self.coupling_map, 'decay', seed=seed)
 
         # Do forward-backward iterations.
         circ = dag_to_circuit(dag)
         for i in range(self.max_iterations):
             for _ in ('forward', 'backward'):
-                pm = self._layout_and_route_passmanager(initial_layout)
+                pm = self._layout_and_route_passmanager(initial_layout, routing_pass)
                 new_circ = pm.run(circ)
 
                 # Update initial layout and reverse the unmapped circuit.
@@ -112,9 +133,9 @@ class SabreLayout(AnalysisPass):
             logger.info('new initial layout')
             logger.info(initial_layout)
 
-        self.property_set['layout'] = initial_layout
+        return initial_layout
 
-    def _layout_and_route_passmanager(self, initial_layout):
+    def _layout_and_route_passmanager(self, initial_layout, routing_pass):
         """Return a passmanager for a full layout and routing.
 
         We use a factory to remove potential statefulness of passes.
@@ -123,7 +144,7 @@ class SabreLayout(AnalysisPass):
                             FullAncillaAllocation(self.coupling_map),
                             EnlargeWithAncilla(),
                             ApplyLayout(),
-                            self.routing_pass]
+                            routing_pass]
         pm = PassManager(layout_and_route)
         return pm
 
@@ -143,3 +164,19 @@ class SabreLayout(AnalysisPass):
         final_layout = {v: pass_final_layout[qubit_map[v]]
                         for v, _ in initial_layout.get_virtual_bits().items()}
         return Layout(final_layout)
+
+
+def _layout_trial(seed, layout_pass, dag):
+    """Search a layout of ``dag`` with a single SabreLayout trial seeded with ``seed``.
+
+    Returns:
+        tuple: the layout and the cost of the forward routing of ``dag`` with
+        it, its number of swaps and then its depth.
+    """
+    layout = layout_pass._search_layout(dag, seed)
+    routing_pass = layout_pass.routing_pass
+    if routing_pass is None:
+        routing_pass = SabreSwap(layout_pass.coupling_map, 'decay', seed=seed)
+    circuit = layout_pass._layout_and_route_passmanager(layout, routing_pass).run(
+        dag_to_circuit(dag))
+    return layout, (circuit.count_ops().get('swap', 0), circuit.depth())
@@ -12,11 +12,11 @@
 
 """Analysis pass to find commutation relations between DAG nodes."""
 
+import warnings
 from collections import defaultdict
-import numpy as np
+from qiskit.circuit.commutation_library import SessionCommutationLibrary
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.basepasses import AnalysisPass
-from qiskit.quantum_info.operators import Operator
 
 _CUTOFF_PRECISION = 1E-10
 
@@ -28,13 +28,37 @@ class CommutationAnalysis(AnalysisPass):
     the commutation relations on a given wire, all the gates on a wire
     are grouped into a set of gates that commute.
 
-    TODO: the current pass determines commutativity through matrix multiplication.
-    A rule-based analysis would be potentially faster, but more limited.
+    The commutation relations are decided by a
+    :class:`~qiskit.circuit.CommutationLibrary`, by default the process-wide
+    ``SessionCommutationLibrary`` whose cache is shared with the other users.
     """
 
-    def __init__(self):
+    def __init__(self, commutation_library=None):
+        """CommutationAnalysis initializer.
+
+        Args:
+            commutation_library (CommutationLibrary): the library deciding
+                whether two gates commute. Defaults to the
+                ``SessionCommutationLibrary``.
+        """
         super().__init__()
-        self.cache = {}
+        if commutation_library is None:
+            commutation_library = SessionCommutationLibrary
+        self.commutation_library = commutation_library
+
+    @property
+    def cache(self):
+        """The cache of the commutation library of the pass (deprecated).
+
+        Use the :meth:`~qiskit.circuit.CommutationLibrary.cache_info` and
+        :meth:`~qiskit.circuit.CommutationLibrary.clear_cache` methods of the
+        ``commutation_library`` instead.
+        """
+        warnings.warn('The cache attribute of CommutationAnalysis is deprecated as of '
+                      '0.17.0, and will be removed no earlier than 3 months after that '
+                      'release date. The commutation relations are now cached by the '
+                      'commutation_library of the pass.', DeprecationWarning, stacklevel=2)
+        return self.commutation_library._cache
 
     def run(self, dag):
         """Run the CommutationAnalysis pass on `dag`.
@@ -77,7 +101,8 @@ class CommutationAnalysis(AnalysisPass):
                     prev_gate = current_comm_set[-1][-1]
                     does_commute = False
                     try:
-                        does_commute = _commute(current_gate, prev_gate, self.cache)
+                        does_commute = _commute(current_gate, prev_gate,
+                                                self.commutation_library)
                     except TranspilerError:
                         pass
                     if does_commute:
@@ -90,7 +115,7 @@ class CommutationAnalysis(AnalysisPass):
                 self.property_set['commutation_set'][(current_gate, wire_name)] = temp_len - 1
 
 
-def _commute(node1, node2, cache):
+def _commute(node1, node2, commutation_library):
 
     if node1.type != "op" or node2.type != "op":
         return False
@@ -105,27 +130,4 @@ def _commute(node1, node2, cache):
     if node1.op.is_parameterized() or node2.op.is_parameterized():
         return False
 
-    qarg = list(set(node1.qargs + node2.qargs))
-    qbit_num = len(qarg)
-
-    qarg1 = [qarg.index(q) for q in node1.qargs]
-    qarg2 = [qarg.index(q) for q in node2.qargs]
-
-    id_op = Operator(np.eye(2 ** qbit_num))
-
-    node1_key = (node1.op.name, str(node1.op.params), str(qarg1))
-    node2_key = (node2.op.name, str(node2.op.params), str(qarg2))
-    if (node1_key, node2_key) in cache:
-        op12 = cache[(node1_key, node2_key)]
-    else:
-        op12 = id_op.compose(node1.op, qargs=qarg1).compose(node2.op, qargs=qarg2)
-        cache[(node1_key, node2_key)] = op12
-    if (node2_key, node1_key) in cache:
-        op21 = cache[(node2_key, node1_key)]
-    else:
-        op21 = id_op.compose(node2.op, qargs=qarg2).compose(node1.op, qargs=qarg1)
-        cache[(node2_key, node1_key)] = op21
-
-    if_commute = (op12 == op21)
-
-    return if_commute
+    return commutation_library.commute(node1.op, node1.qargs, node2.op, node2.qargs)
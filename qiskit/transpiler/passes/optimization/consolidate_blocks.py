@@ -15,11 +15,13 @@
 """Replace each block of consecutive gates by a single Unitary node."""
 
 
-from qiskit.circuit import QuantumRegister, ClassicalRegister, QuantumCircuit
+import numpy as np
+
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.synthesis import TwoQubitBasisDecomposer
 from qiskit.extensions import UnitaryGate
 from qiskit.circuit.library.standard_gates import CXGate
+from qiskit.circuit.gate_matrix_cache import _matrix_key
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.synthesis import unitary_synthesis
@@ -110,6 +112,10 @@ class ConsolidateBlocks(TransformationPass):
 
         # create the dag from the updated list of blocks
         basis_gate_name = self.decomposer.gate.name
+        # matrices of the gates without parameters, on the wires of a block,
+        # and number of basis gates of the block unitaries
+        matrix_cache = {}
+        num_basis_gates_cache = {}
         for block in blocks:
             if len(block) == 1 and (block[0].name != basis_gate_name
                                     or block[0].op.is_parameterized()):
@@ -119,39 +125,29 @@ class ConsolidateBlocks(TransformationPass):
             else:
                 # find the qubits involved in this block
                 block_qargs = set()
-                block_cargs = set()
                 for nd in block:
                     block_qargs |= set(nd.qargs)
-                    if nd.condition:
-                        block_cargs |= set(nd.condition[0])
-                # convert block to a sub-circuit, then simulate unitary and add
-                q = QuantumRegister(len(block_qargs))
-                # if condition in node, add clbits to circuit
-                if len(block_cargs) > 0:
-                    c = ClassicalRegister(len(block_cargs))
-                    subcirc = QuantumCircuit(q, c)
-                else:
-                    subcirc = QuantumCircuit(q)
                 block_index_map = self._block_qargs_to_indices(block_qargs,
                                                                global_index_map)
                 basis_count = 0
                 for nd in block:
                     if nd.op.name == basis_gate_name:
                         basis_count += 1
-                    subcirc.append(nd.op, [q[block_index_map[i]] for i in nd.qargs])
-                unitary = UnitaryGate(Operator(subcirc))  # simulates the circuit
+                # simulate the unitary of the block
+                matrix = _block_unitary(block, block_index_map, len(block_qargs),
+                                        matrix_cache)
 
                 max_2q_depth = 20  # If depth > 20, there will be 1q gates to consolidate.
                 if (  # pylint: disable=too-many-boolean-expressions
                         self.force_consolidate
-                        or unitary.num_qubits > 2
-                        or self.decomposer.num_basis_gates(unitary) < basis_count
-                        or len(subcirc) > max_2q_depth
+                        or len(block_qargs) > 2
+                        or self._num_basis_gates(matrix, num_basis_gates_cache) < basis_count
+                        or len(block) > max_2q_depth
                         or (self.basis_gates is not None
-                            and not set(subcirc.count_ops()).issubset(self.basis_gates))
+                            and not {nd.op.name for nd in block}.issubset(self.basis_gates))
                 ):
                     new_dag.apply_operation_back(
-                        UnitaryGate(unitary),
+                        UnitaryGate(matrix),
                         sorted(block_qargs, key=lambda x: block_index_map[x]))
                 else:
                     for nd in block:
@@ -159,6 +155,19 @@ class ConsolidateBlocks(TransformationPass):
 
         return new_dag
 
+    def _num_basis_gates(self, matrix, cache):
+        """Return the number of basis gates needed to decompose a 2-qubit unitary.
+
+        The result is memoized in ``cache``, keyed on the rounded matrix, so
+        the Weyl decomposition of blocks repeated in a circuit is computed once.
+        """
+        if matrix.shape != (4, 4):
+            return self.decomposer.num_basis_gates(matrix)
+        key = np.round(matrix, 13).tobytes()
+        if key not in cache:
+            cache[key] = self.decomposer.num_basis_gates(matrix)
+        return cache[key]
+
     def _block_qargs_to_indices(self, block_qargs, global_index_map):
         """Map each qubit in block_qargs to its wire position among the block's wires.
 
@@ -175,3 +184,51 @@ class ConsolidateBlocks(TransformationPass):
         block_positions = {q: ordered_block_indices.index(global_index_map[q])
                            for q in block_qargs}
         return block_positions
+
+
+def _block_unitary(block, block_index_map, num_qubits, matrix_cache):
+    """Return the unitary matrix of a block of gates on num_qubits wires.
+
+    The matrices of the gates are expanded to the wires of the block and
+    multiplied in place, in the order of the block. The expanded matrices of
+    the standard gates without parameters are cached in ``matrix_cache``.
+    """
+    dim = 2 ** num_qubits
+    unitary = np.eye(dim, dtype=complex)
+    product = np.empty_like(unitary)
+    for nd in block:
+        qargs = tuple(block_index_map[q] for q in nd.qargs)
+        key = None
+        if not nd.op.params:
+            # The key tells apart the control states of the controlled gates
+            gate_key = _matrix_key(nd.op)
+            key = None if gate_key is None else (gate_key, qargs)
+        if key is not None:
+            matrix = matrix_cache.get(key)
+            if matrix is not None:
+                np.dot(matrix, unitary, out=product)
+                unitary, product = product, unitary
+                continue
+        matrix = Operator._instruction_to_matrix(nd.op)
+        if matrix is None:
+            matrix = Operator(nd.op).data
+        matrix = _expand_matrix(np.asarray(matrix, dtype=complex), qargs, num_qubits)
+        if key is not None:
+            matrix_cache[key] = matrix
+        np.dot(matrix, unitary, out=product)
+        unitary, product = product, unitary
+    return unitary
+
+
+def _expand_matrix(matrix, qargs, num_qubits):
+    """Expand the matrix of a gate on qargs to a matrix on num_qubits wires."""
+    if len(qargs) == num_qubits and qargs == tuple(range(num_qubits)):
+        return matrix
+    if num_qubits == 2 and len(qargs) == 1:
+        if qargs[0] == 0:
+            return np.kron(_IDENTITY, matrix)
+        return np.kron(matrix, _IDENTITY)
+    return Operator(np.eye(2 ** num_qubits)).compose(matrix, qargs=list(qargs)).data
+
+
+_IDENTITY = np.eye(2, dtype=complex)
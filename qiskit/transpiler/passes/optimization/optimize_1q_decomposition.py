@@ -16,11 +16,11 @@ import logging
 
 import numpy as np
 
-from qiskit.circuit import QuantumCircuit, QuantumRegister
-from qiskit.quantum_info import Operator
+from qiskit.circuit import QuantumRegister
+from qiskit.circuit.gate_matrix_cache import SessionGateMatrixCache
+from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.quantum_info import OneQubitEulerDecomposer
-from qiskit.converters import circuit_to_dag
 
 LOG = logging.getLogger(__name__)
 
@@ -68,31 +68,48 @@ class Optimize1qGatesDecomposition(TransformationPass):
         if not self.basis:
             LOG.info("Skipping pass because no basis is set")
             return dag
-        runs = dag.collect_1q_runs()
-        for run in runs:
+        runs = []
+        for run in dag.collect_1q_runs():
             # Don't try to optimize a single 1q gate
             if len(run) <= 1:
                 params = run[0].op.params
                 # Remove single identity gates
-                if len(params) > 0 and np.array_equal(run[0].op.to_matrix(),
-                                                      np.eye(2)):
+                if len(params) > 0 and np.array_equal(
+                        SessionGateMatrixCache.matrix(run[0].op), np.eye(2)):
                     dag.remove_op_node(run[0])
                 continue
+            runs.append(run)
+        if not runs:
+            return dag
+
+        # Compute the Euler angles of all the runs at once for each basis
+        operators = np.array([_run_matrix(run) for run in runs])
+        basis_params = [decomposer._params(operators) for decomposer in self.basis]
 
-            new_circs = []
-            q = QuantumRegister(1, "q")
-            qc = QuantumCircuit(1)
-            for gate in run:
-                qc._append(gate.op, [q[0]], [])
-            operator = Operator(qc)
-            for decomposer in self.basis:
-                new_circs.append(decomposer(operator))
-            if new_circs:
-                new_circ = min(new_circs, key=lambda circ: circ.depth())
-                if qc.depth() > new_circ.depth():
-                    new_dag = circuit_to_dag(new_circ)
-                    dag.substitute_node_with_dag(run[0], new_dag)
-                    # Delete the other nodes in the run
-                    for current_node in run[1:]:
-                        dag.remove_op_node(current_node)
+        qubit = QuantumRegister(1, 'q')[0]
+        for index, run in enumerate(runs):
+            new_gates = None
+            for decomposer, (theta, phi, lam, phase) in zip(self.basis, basis_params):
+                gates = decomposer._gates(theta[index], phi[index], lam[index], simplify=True)
+                if new_gates is None or len(gates) < len(new_gates):
+                    new_gates, new_phase = gates, phase[index]
+            # Keep the runs which are no longer than their resynthesis
+            if len(run) > len(new_gates):
+                new_dag = DAGCircuit()
+                new_dag.add_qreg(qubit.register)
+                new_dag.global_phase = new_phase
+                for gate in new_gates:
+                    new_dag.apply_operation_back(gate, [qubit], [])
+                dag.substitute_node_with_dag(run[0], new_dag)
+                # Delete the other nodes in the run
+                for current_node in run[1:]:
+                    dag.remove_op_node(current_node)
         return dag
+
+
+def _run_matrix(run):
+    """Return the matrix of a run of single-qubit gates."""
+    operator = SessionGateMatrixCache.matrix(run[0].op)
+    for gate in run[1:]:
+        operator = SessionGateMatrixCache.matrix(gate.op).dot(operator)
+    return operator
@@ -14,7 +14,6 @@
 
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
-from qiskit.dagcircuit import DAGCircuit
 from qiskit.transpiler.layout import Layout
 from qiskit.circuit.library.standard_gates import SwapGate
 
@@ -62,15 +61,16 @@ class BasicSwap(TransformationPass):
         current_layout = trivial_layout.copy()
 
         for layer in dag.serial_layers():
-            subdag = layer['graph']
-
-            for gate in subdag.two_qubit_ops():
+            for gate in layer.op_nodes:
+                if len(gate.qargs) != 2 or gate.name in ['snapshot', 'barrier']:
+                    continue
                 physical_q0 = current_layout[gate.qargs[0]]
                 physical_q1 = current_layout[gate.qargs[1]]
                 if self.coupling_map.distance(physical_q0, physical_q1) != 1:
-                    # Insert a new layer with the SWAP(s).
-                    swap_layer = DAGCircuit()
-                    swap_layer.add_qreg(canonical_register)
+                    # Insert the SWAP(s).
+                    order = current_layout.reorder_bits(new_dag.qubits)
+                    qubit_map = {qubit: new_dag.qubits[idx]
+                                 for qubit, idx in zip(dag.qubits, order)}
 
                     path = self.coupling_map.shortest_undirected_path(physical_q0, physical_q1)
                     for swap in range(len(path) - 2):
@@ -81,19 +81,22 @@ class BasicSwap(TransformationPass):
                         qubit_2 = current_layout[connected_wire_2]
 
                         # create the swap operation
-                        swap_layer.apply_operation_back(SwapGate(),
-                                                        qargs=[qubit_1, qubit_2],
-                                                        cargs=[])
-
-                    # layer insertion
-                    order = current_layout.reorder_bits(new_dag.qubits)
-                    new_dag.compose(swap_layer, qubits=order)
+                        new_dag.apply_operation_back(SwapGate(),
+                                                     qargs=[qubit_map[qubit_1],
+                                                            qubit_map[qubit_2]],
+                                                     cargs=[])
 
                     # update current_layout
                     for swap in range(len(path) - 2):
                         current_layout.swap(path[swap], path[swap + 1])
 
             order = current_layout.reorder_bits(new_dag.qubits)
-            new_dag.compose(subdag, qubits=order)
+            qubit_map = {qubit: new_dag.qubits[idx] for qubit, idx in zip(dag.qubits, order)}
+            for node in layer.op_nodes:
+                new_dag.apply_operation_back(node.op.copy(),
+                                             qargs=[qubit_map[q] for q in node.qargs],
+                                             cargs=node.cargs)
+
+        self.property_set['final_layout'] = current_layout
 
         return new_dag
@@ -15,14 +15,16 @@
 # that they have been altered from the originals.
 
 cimport cython
-from libcpp.unordered_set cimport unordered_set as cset
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+import numpy as np
 from .utils cimport NLayout, EdgeCollection
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
 cdef double compute_cost(const double[:, ::1] dist,
                          unsigned int * logic_to_phys,
-                         int[::1] gates, unsigned int num_gates) nogil:
+                         const int[::1] gates, unsigned int num_gates) nogil:
     """ Computes the cost (distance) of a logical to physical mapping.
     
     Args:
@@ -45,15 +47,15 @@ cdef double compute_cost(const double[:, ::1] dist,
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef compute_random_scaling(double[:, ::1] scale, const double[:, ::1] cdist2,
-                            double * rand, unsigned int num_qubits):
+cdef void compute_random_scaling(double[:, ::1] scale, const double[:, ::1] cdist2,
+                                 const double[::1] rand, unsigned int num_qubits) nogil:
     """ Computes the symmetric random scaling (perturbation) matrix, 
     and places the values in the 'scale' array.
 
     Args:
         scale (ndarray): An array of doubles where the values are to be stored.
         cdist2 (ndarray): Array representing the coupling map distance squared.
-        rand (double *): Array of rands of length num_qubits*(num_qubits+1)//2.
+        rand (ndarray): Array of rands of length num_qubits*(num_qubits+1)//2.
         num_qubits (int): Number of physical qubits.
     """
     cdef size_t ii, jj, idx=0
@@ -64,72 +66,75 @@ cdef compute_random_scaling(double[:, ::1] scale, const double[:, ::1] cdist2,
             idx += 1
 
 
+cdef inline void swap_layout(unsigned int * logic_to_phys, unsigned int * phys_to_logic,
+                             unsigned int idx1, unsigned int idx2) nogil:
+    """ Swaps two physical indices of a numeric layout, like NLayout.swap.
+
+    Args:
+        logic_to_phys (int *): Pointer to logical to physical array.
+        phys_to_logic (int *): Pointer to physical to logical array.
+        idx1 (int): Index 1.
+        idx2 (int): Index 2.
+    """
+    cdef unsigned int temp1, temp2
+    temp1 = phys_to_logic[idx1]
+    temp2 = phys_to_logic[idx2]
+    phys_to_logic[idx1] = temp2
+    phys_to_logic[idx2] = temp1
+    logic_to_phys[phys_to_logic[idx1]] = idx1
+    logic_to_phys[phys_to_logic[idx2]] = idx2
+
+
 @cython.nonecheck(False)
 @cython.boundscheck(False)
 @cython.wraparound(False)
-def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
-               int[::1] gates, const double[:, ::1] cdist2,
-               const double[:, ::1] cdist, 
-               int[::1] edges, double[:, ::1] scale, object rng):
-    """ A single iteration of the tchastic swap mapping routine.
+cdef unsigned int trial_kernel(unsigned int num_qubits,
+                               unsigned int l2p_len, unsigned int p2l_len,
+                               unsigned int * trial_l2p, unsigned int * trial_p2l,
+                               unsigned int * work, char * input_qubit_set,
+                               char * qubit_set, unsigned int * opt_edges,
+                               unsigned int * num_opt_edges,
+                               const int[::1] gates, const double[:, ::1] cdist,
+                               const int[::1] edges, const double[:, ::1] scale) nogil:
+    """ Runs the swap trial on raw arrays, without the GIL.
 
-    Args:
-        num_qubits (int): The number of physical qubits.
-        int_layout (NLayout): The numeric (integer) representation of 
-                              the initial_layout.
-        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
-        gates (ndarray): Int array with integers giving qubits on which
-                         two-qubits gates act on.
-        cdist2 (ndarray): Array of doubles that gives the square of the 
-                          distance graph.
-        cdist (ndarray): Array of doubles that gives the distance graph.
-        edges (ndarray): Int array of edges in coupling map.
-        scale (ndarray): A double array that holds the perturbed cdist2 array.
-        rng (default_rng): An instance of the NumPy default_rng.
+    The layout found is written in place of the trial layout, and the swaps
+    in ``opt_edges``. ``work`` holds ``2*(l2p_len+p2l_len)`` ints, for the
+    candidate and optimal layouts.
 
     Returns:
-        double: Best distance achieved in this trial.
-        EdgeCollection: Collection of optimal edges found.
-        NLayout: The optimal layout found.
         int: The number of depth steps required in mapping.
     """
-    cdef EdgeCollection opt_edges = EdgeCollection()
-    cdef NLayout optimal_layout, new_layout, trial_layout = int_layout.copy()
-    
+    cdef unsigned int * new_l2p = work
+    cdef unsigned int * new_p2l = work + l2p_len
+    cdef unsigned int * opt_l2p = work + l2p_len + p2l_len
+    cdef unsigned int * opt_p2l = work + 2*l2p_len + p2l_len
+
     cdef unsigned int num_gates = gates.shape[0]//2
     cdef unsigned int num_edges = edges.shape[0]//2
-    
-    cdef unsigned int need_copy, cost_reduced
+
+    cdef unsigned int need_copy, cost_reduced, set_size, input_set_size = 0
     cdef unsigned int depth_step = 1
     cdef unsigned int depth_max = 2 * num_qubits + 1
     cdef double min_cost, new_cost, dist
-    
+
     cdef unsigned int start_edge, end_edge, start_qubit, end_qubit
-    cdef unsigned int optimal_start, optimal_end, optimal_start_qubit, optimal_end_qubit
-    
+    cdef unsigned int optimal_start = 0, optimal_end = 0
+    cdef unsigned int optimal_start_qubit = 0, optimal_end_qubit = 0
+
     cdef size_t idx
-    
-    # Compute randomized distance
-    cdef double[::1] rand = 1.0 + rng.normal(0.0, 1.0/num_qubits,
-                                             size=num_qubits*(num_qubits+1)//2)
-    
-    compute_random_scaling(scale, cdist2, &rand[0], num_qubits)
-    
-    # Convert int qubit array to c++ set
-    cdef cset[unsigned int] qubit_set
-    cdef cset[unsigned int] input_qubit_set
-    
-    for idx in range(<unsigned int>int_qubit_subset.shape[0]):
-        input_qubit_set.insert(int_qubit_subset[idx])
-    
+
+    for idx in range(l2p_len):
+        input_set_size += input_qubit_set[idx]
+
     # Loop over depths from 1 up to a maximum depth
     while depth_step < depth_max:
-        qubit_set = input_qubit_set
+        memcpy(qubit_set, input_qubit_set, l2p_len * sizeof(char))
+        set_size = input_set_size
         # While there are still qubits available
-        while not qubit_set.empty():
+        while set_size:
             # Compute the objective function
-            min_cost = compute_cost(scale, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+            min_cost = compute_cost(scale, trial_l2p, gates, num_gates)
             # Try to decrease objective function
             cost_reduced = 0
 
@@ -138,38 +143,46 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
             for idx in range(num_edges):
                 start_edge = edges[2*idx]
                 end_edge = edges[2*idx+1]
-                start_qubit = trial_layout.phys_to_logic[start_edge]
-                end_qubit =  trial_layout.phys_to_logic[end_edge]
+                start_qubit = trial_p2l[start_edge]
+                end_qubit = trial_p2l[end_edge]
                 # Are the qubits available?
-                if  qubit_set.count(start_qubit) and qubit_set.count(end_qubit):
+                if qubit_set[start_qubit] and qubit_set[end_qubit]:
                     # Try this edge to reduce the cost
                     if need_copy:
-                        new_layout = trial_layout.copy()
+                        memcpy(new_l2p, trial_l2p, l2p_len * sizeof(unsigned int))
+                        memcpy(new_p2l, trial_p2l, p2l_len * sizeof(unsigned int))
                         need_copy = 0
-                    new_layout.swap(start_edge, end_edge)
+                    swap_layout(new_l2p, new_p2l, start_edge, end_edge)
                     # Compute the objective function
-                    new_cost = compute_cost(scale, new_layout.logic_to_phys,
-                                   gates, num_gates)
+                    new_cost = compute_cost(scale, new_l2p, gates, num_gates)
                     # Record progress if we succeed
                     if new_cost < min_cost:
-                        cost_reduced = True
+                        cost_reduced = 1
                         min_cost = new_cost
-                        optimal_layout = new_layout
+                        memcpy(opt_l2p, new_l2p, l2p_len * sizeof(unsigned int))
+                        memcpy(opt_p2l, new_p2l, p2l_len * sizeof(unsigned int))
                         optimal_start = start_edge
                         optimal_end = end_edge
                         optimal_start_qubit = start_qubit
                         optimal_end_qubit = end_qubit
                         need_copy = 1
                     else:
-                        new_layout.swap(start_edge, end_edge)
+                        swap_layout(new_l2p, new_p2l, start_edge, end_edge)
 
             # After going over all edges
             # Were there any good swap choices?
             if cost_reduced:
-                qubit_set.erase(optimal_start_qubit)
-                qubit_set.erase(optimal_end_qubit)
-                trial_layout = optimal_layout
-                opt_edges.add(optimal_start, optimal_end)
+                if qubit_set[optimal_start_qubit]:
+                    qubit_set[optimal_start_qubit] = 0
+                    set_size -= 1
+                if qubit_set[optimal_end_qubit]:
+                    qubit_set[optimal_end_qubit] = 0
+                    set_size -= 1
+                memcpy(trial_l2p, opt_l2p, l2p_len * sizeof(unsigned int))
+                memcpy(trial_p2l, opt_p2l, p2l_len * sizeof(unsigned int))
+                opt_edges[num_opt_edges[0]] = optimal_start
+                opt_edges[num_opt_edges[0]+1] = optimal_end
+                num_opt_edges[0] += 2
             else:
                 break
 
@@ -177,8 +190,7 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # failed to improve the cost.
 
         # Compute the coupling graph distance
-        dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
+        dist = compute_cost(cdist, trial_l2p, gates, num_gates)
         # If all gates can be applied now, we are finished.
         # Otherwise we need to consider a deeper swap circuit
         if dist == num_gates:
@@ -187,8 +199,85 @@ def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
         # Increment the depth
         depth_step += 1
 
-    # Either we have succeeded at some depth d < dmax or failed
-    dist = compute_cost(cdist, trial_layout.logic_to_phys,
-                                   gates, num_gates)
-    
+    return depth_step
+
+
+@cython.nonecheck(False)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def swap_trial(int num_qubits, NLayout int_layout, int[::1] int_qubit_subset,
+               const int[::1] gates, const double[:, ::1] cdist2,
+               const double[:, ::1] cdist,
+               const int[::1] edges, const double[::1] rand):
+    """ A single iteration of the stochastic swap mapping routine.
+
+    The trial runs without the GIL, so that trials can be spread over threads.
+    The arrays ``cdist2``, ``cdist``, ``edges`` and ``gates`` are only read,
+    and can be shared by the trials.
+
+    Args:
+        num_qubits (int): The number of physical qubits.
+        int_layout (NLayout): The numeric (integer) representation of 
+                              the initial_layout.
+        int_qubit_subset (ndarray): Int ndarray listing qubits in set.
+        gates (ndarray): Int array with integers giving qubits on which
+                         two-qubits gates act on.
+        cdist2 (ndarray): Array of doubles that gives the square of the 
+                          distance graph.
+        cdist (ndarray): Array of doubles that gives the distance graph.
+        edges (ndarray): Int array of edges in coupling map.
+        rand (ndarray): Array of num_qubits*(num_qubits+1)//2 random doubles,
+                        around 1, perturbing the cdist2 array.
+
+    Returns:
+        double: Best distance achieved in this trial.
+        EdgeCollection: Collection of optimal edges found.
+        NLayout: The optimal layout found.
+        int: The number of depth steps required in mapping.
+    """
+    cdef EdgeCollection opt_edges = EdgeCollection()
+    cdef NLayout trial_layout = int_layout.copy()
+    cdef unsigned int l2p_len = trial_layout.l2p_len
+    cdef unsigned int p2l_len = trial_layout.p2l_len
+    cdef unsigned int num_gates = gates.shape[0]//2
+    # Each depth step adds at most one swap per available qubit
+    cdef size_t max_edges = 2 * (2 * num_qubits + 1) * (l2p_len + 1)
+    cdef unsigned int num_opt_edges = 0
+    cdef unsigned int depth_step
+    cdef double dist
+    cdef size_t idx
+
+    cdef double[:, ::1] scale = np.zeros((num_qubits, num_qubits))
+    cdef unsigned int * work = <unsigned int *>malloc(
+        2 * (l2p_len + p2l_len) * sizeof(unsigned int))
+    cdef unsigned int * edge_buffer = <unsigned int *>malloc(max_edges * sizeof(unsigned int))
+    cdef char * qubit_sets = <char *>malloc(2 * l2p_len * sizeof(char) + 1)
+    try:
+        if work is NULL or edge_buffer is NULL or qubit_sets is NULL:
+            raise MemoryError()
+        for idx in range(2 * l2p_len):
+            qubit_sets[idx] = 0
+        for idx in range(<unsigned int>int_qubit_subset.shape[0]):
+            qubit_sets[int_qubit_subset[idx]] = 1
+
+        with nogil:
+            # Compute randomized distance
+            compute_random_scaling(scale, cdist2, rand, num_qubits)
+            depth_step = trial_kernel(num_qubits, l2p_len, p2l_len,
+                                      trial_layout.logic_to_phys,
+                                      trial_layout.phys_to_logic,
+                                      work, qubit_sets, qubit_sets + l2p_len,
+                                      edge_buffer, &num_opt_edges,
+                                      gates, cdist, edges, scale)
+            # Either we have succeeded at some depth d < dmax or failed
+            dist = compute_cost(cdist, trial_layout.logic_to_phys,
+                                gates, num_gates)
+
+        for idx in range(0, num_opt_edges, 2):
+            opt_edges.add(edge_buffer[idx], edge_buffer[idx+1])
+    finally:
+        free(work)
+        free(edge_buffer)
+        free(qubit_sets)
+
     return dist, opt_edges, trial_layout, depth_step
@@ -130,6 +130,8 @@ class LookaheadSwap(TransformationPass):
         for node in mapped_gates:
             mapped_dag.apply_operation_back(op=node.op, qargs=node.qargs, cargs=node.cargs)
 
+        self.property_set['final_layout'] = current_layout
+
         return mapped_dag
 
 
@@ -246,7 +248,7 @@ def _map_free_gates(layout, gates, coupling_map):
         # Gates without a partition (barrier, snapshot, save, load, noise) may
         # still have associated qubits. Look for them in the qargs.
         if not gate['partition']:
-            qubits = [n for n in gate['graph'].nodes() if n.type == 'op'][0].qargs
+            qubits = gate.op_nodes[0].qargs
 
             if not qubits:
                 continue
@@ -298,7 +300,7 @@ def _score_step(step):
 
 def _transform_gate_for_layout(gate, layout):
     """Return op implementing a virtual gate on given layout."""
-    mapped_op_node = deepcopy([n for n in gate['graph'].nodes() if n.type == 'op'][0])
+    mapped_op_node = deepcopy(gate.op_nodes[0])
 
     device_qreg = QuantumRegister(len(layout.get_physical_bits()), 'q')
     mapped_qargs = [device_qreg[layout[a]] for a in mapped_op_node.qargs]
@@ -13,15 +13,15 @@
 """Routing via SWAP insertion using the SABRE method from Li et al."""
 
 import logging
-from copy import copy
+from collections import deque
 from itertools import cycle
 import numpy as np
 
 from qiskit.circuit.library.standard_gates import SwapGate
+from qiskit.tools.parallel import parallel_map
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.layout import Layout
-from qiskit.dagcircuit import DAGNode
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +64,7 @@ class SabreSwap(TransformationPass):
     `arXiv:1809.02573 <https://arxiv.org/pdf/1809.02573.pdf>`_
     """
 
-    def __init__(self, coupling_map, heuristic='basic', seed=None):
+    def __init__(self, coupling_map, heuristic='basic', seed=None, trials=1):
         r"""SabreSwap initializer.
 
         Args:
@@ -72,6 +72,10 @@ class SabreSwap(TransformationPass):
             heuristic (str): The type of heuristic to use when deciding best
                 swap strategy ('basic' or 'lookahead' or 'decay').
             seed (int): random seed used to tie-break among candidate swaps.
+            trials (int): number of independently seeded routings, run in
+                parallel. The routing with the fewest swaps, and then the
+                lowest depth, is kept. The first trial uses ``seed`` and the
+                seeds of the other ones are drawn from it.
 
         Additional Information:
 
@@ -121,8 +125,15 @@ class SabreSwap(TransformationPass):
         self.coupling_map = coupling_map
         self.heuristic = heuristic
         self.seed = seed
-        self.applied_gates = None
+        self.trials = trials
         self.qubits_decay = None
+        # Tables of the op nodes of the DAG being routed, indexed by position
+        self._nodes = None
+        self._qargs = None
+        self._successors = None
+        self._num_predecessors = None
+        self._bfs_children = None
+        self._bfs_two_qubit_children = None
 
     def run(self, dag):
         """Run the SabreSwap pass on `dag`.
@@ -141,6 +152,17 @@ class SabreSwap(TransformationPass):
         if len(dag.qubits) > self.coupling_map.size():
             raise TranspilerError('More virtual qubits exist than physical.')
 
+        if self.trials > 1:
+            seed = self.seed
+            if seed is None:
+                seed = np.random.randint(0, np.iinfo(np.int32).max)
+            results = parallel_map(_route_trial, _trial_seeds(seed, self.trials),
+                                   task_args=(dag, self.coupling_map, self.heuristic))
+            mapped_dag, final_layout = min(
+                results, key=lambda result: _routing_cost(result[0]))
+            self.property_set['final_layout'] = final_layout
+            return mapped_dag
+
         rng = np.random.default_rng(self.seed)
 
         # Preserve input DAG's name, regs, wire_map, etc. but replace the graph.
@@ -148,143 +170,192 @@ class SabreSwap(TransformationPass):
 
         # Assume bidirectional couplings, fixing gate direction is easy later.
         self.coupling_map.make_symmetric()
+        distance = self.coupling_map.distance_matrix.astype(int).tolist()
+        neighbors = [self.coupling_map.neighbors(physical)
+                     for physical in range(len(distance))]
 
+        # The layout is stored as integer arrays: the physical qubit of every
+        # virtual qubit and the virtual qubit of every physical qubit, both
+        # identified by their index in the canonical register.
         canonical_register = dag.qregs['q']
-        current_layout = Layout.generate_trivial_layout(canonical_register)
+        num_qubits = len(canonical_register)
+        v2p = list(range(num_qubits))
+        p2v = list(range(num_qubits))
 
         # A decay factor for each qubit used to heuristically penalize recently
         # used qubits (to encourage parallelism).
-        self.qubits_decay = {qubit: 1 for qubit in dag.qubits}
+        self.qubits_decay = [1] * num_qubits
+
+        self._build_tables(dag)
+        num_predecessors = self._num_predecessors
 
         # Start algorithm from the front layer and iterate until all gates done.
         num_search_steps = 0
-        front_layer = dag.front_layer()
-        self.applied_gates = set()
+        positions = {node._node_id: idx for idx, node in enumerate(self._nodes)}
+        front_layer = [positions[node._node_id] for node in dag.front_layer()]
         while front_layer:
             execute_gate_list = []
 
             # Remove as many immediately applicable gates as possible
             for node in front_layer:
-                if len(node.qargs) == 2:
-                    v0, v1 = node.qargs
-                    if self.coupling_map.graph.has_edge(current_layout[v0],
-                                                        current_layout[v1]):
+                qargs = self._qargs[node]
+                if len(qargs) == 2:
+                    if distance[v2p[qargs[0]]][v2p[qargs[1]]] == 1:
                         execute_gate_list.append(node)
                 else:  # Single-qubit gates as well as barriers are free
                     execute_gate_list.append(node)
 
             if execute_gate_list:
+                reset_decay = False
                 for node in execute_gate_list:
-                    new_node = _transform_gate_for_layout(node, current_layout)
-                    mapped_dag.apply_operation_back(new_node.op,
-                                                    new_node.qargs,
-                                                    new_node.cargs,
-                                                    new_node.condition)
+                    dag_node = self._nodes[node]
+                    mapped_dag.apply_operation_back(
+                        dag_node.op,
+                        [canonical_register[v2p[qubit]] for qubit in self._qargs[node]],
+                        dag_node.cargs,
+                        dag_node.condition)
                     front_layer.remove(node)
-                    self.applied_gates.add(node)
-                    for successor in dag.quantum_successors(node):
-                        if successor.type != 'op':
-                            continue
-                        if self._is_resolved(successor, dag):
+                    for successor in self._successors[node]:
+                        num_predecessors[successor] -= 1
+                        if not num_predecessors[successor]:
                             front_layer.append(successor)
-
-                    if node.qargs:
-                        self._reset_qubits_decay()
+                    reset_decay = reset_decay or bool(self._qargs[node])
+                if reset_decay:
+                    self._reset_qubits_decay()
 
                 # Diagnostics
                 logger.debug('free! %s',
-                             [(n.name, n.qargs) for n in execute_gate_list])
+                             [(self._nodes[n].name, self._qargs[n]) for n in execute_gate_list])
                 logger.debug('front_layer: %s',
-                             [(n.name, n.qargs) for n in front_layer])
+                             [(self._nodes[n].name, self._qargs[n]) for n in front_layer])
 
                 continue
 
             # After all free gates are exhausted, heuristically find
             # the best swap and insert it. When two or more swaps tie
             # for best score, pick one randomly.
-            extended_set = self._obtain_extended_set(dag, front_layer)
-            swap_candidates = self._obtain_swaps(front_layer, current_layout)
-            swap_scores = dict.fromkeys(swap_candidates, 0)
-            for swap_qubits in swap_scores:
-                trial_layout = current_layout.copy()
-                trial_layout.swap(*swap_qubits)
-                score = self._score_heuristic(self.heuristic,
-                                              front_layer,
-                                              extended_set,
-                                              trial_layout,
-                                              swap_qubits)
-                swap_scores[swap_qubits] = score
+            if self.heuristic == 'basic':
+                extended_set = set()
+            else:
+                extended_set = self._obtain_extended_set(front_layer)
+            swap_candidates = self._obtain_swaps(front_layer, v2p, p2v, neighbors)
+            swap_scores = self._score_swaps(self.heuristic, front_layer, extended_set,
+                                            swap_candidates, v2p, distance)
             min_score = min(swap_scores.values())
             best_swaps = [k for k, v in swap_scores.items() if v == min_score]
-            best_swaps.sort(key=lambda x: (x[0].index, x[1].index))
-            best_swap = rng.choice(best_swaps)
-            swap_node = DAGNode(op=SwapGate(), qargs=best_swap, type='op')
-            swap_node = _transform_gate_for_layout(swap_node, current_layout)
-            mapped_dag.apply_operation_back(swap_node.op, swap_node.qargs)
-            current_layout.swap(*best_swap)
+            best_swaps.sort()
+            best_swap = tuple(int(qubit) for qubit in rng.choice(best_swaps))
+            mapped_dag.apply_operation_back(
+                SwapGate(), [canonical_register[v2p[qubit]] for qubit in best_swap])
+            virtual0, virtual1 = best_swap
+            physical0, physical1 = v2p[virtual0], v2p[virtual1]
+            v2p[virtual0], v2p[virtual1] = physical1, physical0
+            p2v[physical0], p2v[physical1] = virtual1, virtual0
 
             num_search_steps += 1
             if num_search_steps % DECAY_RESET_INTERVAL == 0:
                 self._reset_qubits_decay()
             else:
-                self.qubits_decay[best_swap[0]] += DECAY_RATE
-                self.qubits_decay[best_swap[1]] += DECAY_RATE
+                self.qubits_decay[virtual0] += DECAY_RATE
+                self.qubits_decay[virtual1] += DECAY_RATE
 
             # Diagnostics
             logger.debug('SWAP Selection...')
             logger.debug('extended_set: %s',
-                         [(n.name, n.qargs) for n in extended_set])
+                         [(self._nodes[n].name, self._qargs[n]) for n in extended_set])
             logger.debug('swap scores: %s', swap_scores)
             logger.debug('best swap: %s', best_swap)
             logger.debug('qubits decay: %s', self.qubits_decay)
 
-        self.property_set['final_layout'] = current_layout
+        self.property_set['final_layout'] = Layout(
+            {canonical_register[virtual]: physical for virtual, physical in enumerate(v2p)})
 
+        self._nodes = self._qargs = self._successors = self._num_predecessors = None
+        self._bfs_children = self._bfs_two_qubit_children = None
         return mapped_dag
 
+    def _build_tables(self, dag):
+        """Precompute the tables of the op nodes of ``dag`` used by the routing.
+
+        The op nodes are identified by their position in ``self._nodes``. The
+        tables hold, for every op node, its virtual qubits, its op successors
+        on quantum wires, its number of op predecessors on quantum wires and
+        its op successors in the order :func:`retworkx.bfs_successors` visits
+        them, in total and restricted to two-qubit gates.
+        """
+        self._nodes = list(dag.op_nodes())
+        positions = {node._node_id: idx for idx, node in enumerate(self._nodes)}
+        graph = dag._multi_graph
+        self._qargs = [tuple(qubit.index for qubit in node.qargs) for node in self._nodes]
+        self._successors = []
+        self._num_predecessors = [0] * len(self._nodes)
+        self._bfs_children = []
+        for node in self._nodes:
+            successors = [positions[successor._node_id]
+                          for successor in dag.quantum_successors(node)
+                          if successor.type == 'op']
+            for successor in successors:
+                self._num_predecessors[successor] += 1
+            self._successors.append(successors)
+            children = {}
+            for _, child, _ in graph.out_edges(node._node_id):
+                if child in positions:
+                    children.setdefault(positions[child])
+            self._bfs_children.append(list(children))
+        self._bfs_two_qubit_children = [
+            [child for child in children if len(self._qargs[child]) == 2]
+            for children in self._bfs_children]
+
     def _reset_qubits_decay(self):
         """Reset all qubit decay factors to 1 upon request (to forget about
         past penalizations).
         """
-        self.qubits_decay = {k: 1 for k in self.qubits_decay.keys()}
+        self.qubits_decay = [1] * len(self.qubits_decay)
 
-    def _is_resolved(self, node, dag):
-        """Return True if all of a node's predecessors in dag are applied.
+    def _bfs_two_qubit_successors(self, node):
+        """Yield the two-qubit gate successors of every node visited by a
+        breadth-first search of the DAG from ``node``, like
+        :func:`retworkx.bfs_successors` but lazily.
         """
-        predecessors = dag.quantum_predecessors(node)
-        predecessors = filter(lambda x: x.type == 'op', predecessors)
-        return all([n in self.applied_gates for n in predecessors])
-
-    def _obtain_extended_set(self, dag, front_layer):
+        queue = deque([node])
+        visited = {node}
+        while queue:
+            node = queue.popleft()
+            yield self._bfs_two_qubit_children[node]
+            for child in self._bfs_children[node]:
+                if child not in visited:
+                    visited.add(child)
+                    queue.append(child)
+
+    def _obtain_extended_set(self, front_layer):
         """Populate extended_set by looking ahead a fixed number of gates.
         For each existing element add a successor until reaching limit.
         """
         # TODO: use layers instead of bfs_successors so long range successors aren't included.
         extended_set = set()
-        bfs_successors_pernode = [dag.bfs_successors(n) for n in front_layer]
+        bfs_successors_pernode = [self._bfs_two_qubit_successors(n) for n in front_layer]
+        num_exhausted = 0
         node_lookahead_exhausted = [False] * len(front_layer)
         for i, node_successor_generator in cycle(enumerate(bfs_successors_pernode)):
-            if all(node_lookahead_exhausted) or len(extended_set) >= EXTENDED_SET_SIZE:
+            if num_exhausted == len(front_layer) or len(extended_set) >= EXTENDED_SET_SIZE:
                 break
 
             try:
-                _, successors = next(node_successor_generator)
-                successors = list(filter(lambda x: x.type == 'op' and len(x.qargs) == 2,
-                                         successors))
+                successors = next(node_successor_generator)
             except StopIteration:
-                node_lookahead_exhausted[i] = True
+                if not node_lookahead_exhausted[i]:
+                    node_lookahead_exhausted[i] = True
+                    num_exhausted += 1
                 continue
 
-            successors = iter(successors)
-            while len(extended_set) < EXTENDED_SET_SIZE:
-                try:
-                    extended_set.add(next(successors))
-                except StopIteration:
+            for successor in successors:
+                if len(extended_set) >= EXTENDED_SET_SIZE:
                     break
+                extended_set.add(successor)
 
         return extended_set
 
-    def _obtain_swaps(self, front_layer, current_layout):
+    def _obtain_swaps(self, front_layer, v2p, p2v, neighbors):
         """Return a set of candidate swaps that affect qubits in front_layer.
 
         For each virtual qubit in front_layer, find its current location
@@ -296,58 +367,101 @@ class SabreSwap(TransformationPass):
         """
         candidate_swaps = set()
         for node in front_layer:
-            for virtual in node.qargs:
-                physical = current_layout[virtual]
-                for neighbor in self.coupling_map.neighbors(physical):
-                    virtual_neighbor = current_layout[neighbor]
-                    swap = sorted([virtual, virtual_neighbor],
-                                  key=lambda q: (q.register.name, q.index))
-                    candidate_swaps.add(tuple(swap))
+            for virtual in self._qargs[node]:
+                for neighbor in neighbors[v2p[virtual]]:
+                    virtual_neighbor = p2v[neighbor]
+                    if virtual < virtual_neighbor:
+                        candidate_swaps.add((virtual, virtual_neighbor))
+                    else:
+                        candidate_swaps.add((virtual_neighbor, virtual))
 
         return candidate_swaps
 
-    def _score_heuristic(self, heuristic, front_layer, extended_set, layout, swap_qubits=None):
-        """Return a heuristic score for a trial layout.
+    def _score_swaps(self, heuristic, front_layer, extended_set, swap_candidates, v2p,
+                     distance):
+        """Return the heuristic score of the trial layout of every candidate swap.
 
         Assuming a trial layout has resulted from a SWAP, we now assign a cost
         to it. The goodness of a layout is evaluated based on how viable it makes
         the remaining virtual gates that must be applied.
-        """
-        if heuristic == 'basic':
-            if len(front_layer) > 1:
-                return self.coupling_map.distance_matrix[
-                    tuple(zip(*[[
-                        layout[q] for q in node.qargs] for node in front_layer]))].sum()
-            elif len(front_layer) == 1:
-                return self.coupling_map.distance(
-                    *[layout[q] for q in list(front_layer)[0].qargs])
-            else:
-                return 0
 
-        elif heuristic == 'lookahead':
-            first_cost = self._score_heuristic('basic', front_layer, [], layout)
-            first_cost /= len(front_layer)
+        The sums of distances of the gates of the front layer and the extended
+        set are computed once for the current layout, and the score of every
+        swap only updates the terms of the gates on the two swapped qubits.
+        """
+        if heuristic not in ('basic', 'lookahead', 'decay'):
+            raise TranspilerError('Heuristic %s not recognized.' % heuristic)
 
-            second_cost = self._score_heuristic('basic', extended_set, [], layout)
-            second_cost = 0.0 if not extended_set else second_cost / len(extended_set)
+        front_sum, front_by_qubit = self._distance_terms(front_layer, v2p, distance)
+        extended_sum, extended_by_qubit = self._distance_terms(extended_set, v2p, distance)
+
+        swap_scores = {}
+        for swap_qubits in swap_candidates:
+            virtual0, virtual1 = swap_qubits
+            trial = {virtual0: v2p[virtual1], virtual1: v2p[virtual0]}
+            trial_front_sum = front_sum + self._distance_delta(
+                front_by_qubit, swap_qubits, trial, v2p, distance)
+            if heuristic == 'basic':
+                swap_scores[swap_qubits] = trial_front_sum
+                continue
+            trial_extended_sum = extended_sum + self._distance_delta(
+                extended_by_qubit, swap_qubits, trial, v2p, distance)
+            score = trial_front_sum / len(front_layer)
+            score += EXTENDED_SET_WEIGHT * (
+                trial_extended_sum / len(extended_set) if extended_set else 0.0)
+            if heuristic == 'decay':
+                score *= max(self.qubits_decay[virtual0], self.qubits_decay[virtual1])
+            swap_scores[swap_qubits] = score
+        return swap_scores
+
+    def _distance_terms(self, nodes, v2p, distance):
+        """Return the sum of distances of the two-qubit gates ``nodes`` on the
+        layout ``v2p``, and the gates on every virtual qubit.
+        """
+        total = 0
+        by_qubit = {}
+        for node in nodes:
+            virtual0, virtual1 = self._qargs[node]
+            total += distance[v2p[virtual0]][v2p[virtual1]]
+            by_qubit.setdefault(virtual0, []).append(node)
+            by_qubit.setdefault(virtual1, []).append(node)
+        return total, by_qubit
+
+    def _distance_delta(self, by_qubit, swap_qubits, trial, v2p, distance):
+        """Return the change of the sum of distances of the gates on the swapped
+        qubits from the layout ``v2p`` to the trial layout after the swap.
+        """
+        delta = 0
+        seen = set()
+        for swapped in swap_qubits:
+            for node in by_qubit.get(swapped, ()):
+                if node in seen:
+                    continue
+                seen.add(node)
+                virtual0, virtual1 = self._qargs[node]
+                delta += distance[trial.get(virtual0, v2p[virtual0])][
+                    trial.get(virtual1, v2p[virtual1])]
+                delta -= distance[v2p[virtual0]][v2p[virtual1]]
+        return delta
 
-            return first_cost + EXTENDED_SET_WEIGHT * second_cost
 
-        elif heuristic == 'decay':
-            return max(self.qubits_decay[swap_qubits[0]], self.qubits_decay[swap_qubits[1]]) * \
-                   self._score_heuristic('lookahead', front_layer, extended_set, layout)
+def _trial_seeds(seed, trials):
+    """Return the seeds of ``trials`` trials, starting with ``seed``."""
+    rng = np.random.default_rng(seed)
+    return [seed] + rng.integers(np.iinfo(np.int32).max, size=trials - 1).tolist()
 
-        else:
-            raise TranspilerError('Heuristic %s not recognized.' % heuristic)
 
+def _routing_cost(mapped_dag):
+    """Return the cost of a routed DAG, its number of swaps and then its depth."""
+    return mapped_dag.count_ops().get('swap', 0), mapped_dag.depth()
 
-def _transform_gate_for_layout(op_node, layout):
-    """Return node implementing a virtual op on given layout."""
-    mapped_op_node = copy(op_node)
 
-    device_qreg = op_node.qargs[0].register
-    premap_qargs = op_node.qargs
-    mapped_qargs = map(lambda x: device_qreg[layout[x]], premap_qargs)
-    mapped_op_node.qargs = mapped_op_node.op.qargs = list(mapped_qargs)
+def _route_trial(seed, dag, coupling_map, heuristic):
+    """Route ``dag`` with a single SabreSwap trial seeded with ``seed``.
 
-    return mapped_op_node
+    Returns:
+        tuple: the routed DAG and its final layout.
+    """
+    routing_pass = SabreSwap(coupling_map, heuristic, seed=seed)
+    mapped_dag = routing_pass.run(dag)
+    return mapped_dag, routing_pass.property_set['final_layout']
@@ -12,9 +12,12 @@
 
 """Map a DAGCircuit onto a `coupling_map` adding swap gates."""
 
+import os
+import threading
 from logging import getLogger
 from math import inf
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 from qiskit.circuit.quantumregister import QuantumRegister
@@ -23,6 +26,7 @@ from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.dagcircuit import DAGCircuit
 from qiskit.circuit.library.standard_gates import SwapGate
 from qiskit.transpiler.layout import Layout
+from qiskit.tools.parallel import CPU_COUNT
 # pylint: disable=no-name-in-module
 from .cython.stochastic_swap.utils import nlayout_from_layout
 # pylint: disable=no-name-in-module
@@ -31,12 +35,22 @@ from .cython.stochastic_swap.swap_trial import swap_trial
 
 logger = getLogger(__name__)
 
+_TRIAL_POOL = None
+_TRIAL_POOL_SIZE = 0
+_TRIAL_POOL_LOCK = threading.Lock()
+
 
 class StochasticSwap(TransformationPass):
     """Map a DAGCircuit onto a `coupling_map` adding swap gates.
 
     Uses a randomized algorithm.
 
+    The trials of each layer run without the GIL, and are spread over a pool
+    of up to ``num_threads`` threads sharing the distance matrices of the
+    coupling map. The random numbers of the trials are drawn in trial order,
+    so the swaps found for a given ``seed`` do not depend on the number of
+    threads.
+
     Notes:
         1. Measurements may occur and be followed by swaps that result in repeated
            measurement of the same qubit. Near-term experiments cannot implement
@@ -47,7 +61,7 @@ class StochasticSwap(TransformationPass):
            the circuit.
     """
 
-    def __init__(self, coupling_map, trials=20, seed=None):
+    def __init__(self, coupling_map, trials=20, seed=None, num_threads=None):
         """StochasticSwap initializer.
 
         The coupling map is a connected graph
@@ -59,14 +73,22 @@ class StochasticSwap(TransformationPass):
                 map.
             trials (int): maximum number of iterations to attempt
             seed (int): seed for random number generator
+            num_threads (int): maximum number of threads running trials in
+                parallel. Defaults to the number of processes of
+                :func:`~qiskit.tools.parallel_map`, and to one thread inside
+                a ``parallel_map`` worker.
         """
         super().__init__()
         self.coupling_map = coupling_map
         self.trials = trials
         self.seed = seed
+        self.num_threads = num_threads
         self.qregs = None
         self.rng = None
         self.trivial_layout = None
+        self._cdist = None
+        self._cdist2 = None
+        self._edges = None
 
     def run(self, dag):
         """Run the StochasticSwap pass on `dag`.
@@ -95,6 +117,7 @@ class StochasticSwap(TransformationPass):
         if self.seed is None:
             self.seed = np.random.randint(0, np.iinfo(np.int32).max)
         self.rng = np.random.default_rng(self.seed)
+        self._cdist = None
         logger.debug("StochasticSwap default_rng seeded with seed=%s", self.seed)
 
         new_dag = self._mapper(dag, self.coupling_map, trials=self.trials)
@@ -172,9 +195,11 @@ class StochasticSwap(TransformationPass):
         best_circuit = None  # initialize best swap circuit
         best_layout = None  # initialize best final layout
 
-        cdist2 = coupling._dist_matrix**2
-        # Scaling matrix
-        scale = np.zeros((num_qubits, num_qubits))
+        # The distance matrices and edges are shared by all layers and trials
+        if self._cdist is None:
+            self._cdist = np.ascontiguousarray(coupling.distance_matrix, dtype=float)
+            self._cdist2 = self._cdist**2
+            self._edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
 
         int_qubit_subset = _regtuple_to_numeric(qubit_subset, qregs)
         int_gates = _gates_to_idx(gates, qregs)
@@ -185,29 +210,44 @@ class StochasticSwap(TransformationPass):
             if qubit.register not in trial_circuit.qregs.values():
                 trial_circuit.add_qreg(qubit.register)
 
-        edges = np.asarray(coupling.get_edges(), dtype=np.int32).ravel()
-        cdist = coupling._dist_matrix
-        for trial in range(trials):
-            logger.debug("layer_permutation: trial %s", trial)
-            # This is one Trial --------------------------------------
-            dist, optim_edges, trial_layout, depth_step = swap_trial(num_qubits, int_layout,
-                                                                     int_qubit_subset,
-                                                                     int_gates, cdist2,
-                                                                     cdist, edges, scale,
-                                                                     self.rng)
-
-            logger.debug("layer_permutation: final distance for this trial = %s", dist)
-            if dist == len(gates) and depth_step < best_depth:
-                logger.debug("layer_permutation: got circuit with improved depth %s",
-                             depth_step)
-                best_edges = optim_edges
-                best_layout = trial_layout
-                best_depth = min(best_depth, depth_step)
-
-            # Break out of trial loop if we found a depth 1 circuit
-            # since we can't improve it further
-            if best_depth == 1:
-                break
+        def run_trial(rand):
+            return swap_trial(num_qubits, int_layout, int_qubit_subset, int_gates,
+                              self._cdist2, self._cdist, self._edges, rand)
+
+        num_threads = min(self._num_threads(), trials)
+        num_rand = num_qubits * (num_qubits + 1) // 2
+        trial = 0
+        while trial < trials and best_depth != 1:
+            # The trials are run in batches of one trial per thread
+            batch_size = min(num_threads, trials - trial)
+            rng_state = self.rng.bit_generator.state if batch_size > 1 else None
+            rands = 1.0 + self.rng.normal(0.0, 1.0 / num_qubits, size=(batch_size, num_rand))
+            if batch_size == 1:
+                results = [run_trial(rands[0])]
+            else:
+                results = _trial_pool(num_threads).map(run_trial, rands)
+            used = 0
+            for dist, optim_edges, trial_layout, depth_step in results:
+                logger.debug("layer_permutation: trial %s", trial + used)
+                logger.debug("layer_permutation: final distance for this trial = %s", dist)
+                used += 1
+                if dist == len(gates) and depth_step < best_depth:
+                    logger.debug("layer_permutation: got circuit with improved depth %s",
+                                 depth_step)
+                    best_edges = optim_edges
+                    best_layout = trial_layout
+                    best_depth = min(best_depth, depth_step)
+
+                # Break out of trial loop if we found a depth 1 circuit
+                # since we can't improve it further
+                if best_depth == 1:
+                    break
+            trial += used
+            if used < batch_size:
+                # Rewind the generator past the random numbers of the trials
+                # actually used, as if the trials had run one by one.
+                self.rng.bit_generator.state = rng_state
+                self.rng.normal(size=used * num_rand)
 
         # If we have no best circuit for this layer, all of the
         # trials have failed
@@ -227,6 +267,14 @@ class StochasticSwap(TransformationPass):
         best_lay = best_layout.to_layout(qregs)
         return True, best_circuit, best_depth, best_lay
 
+    def _num_threads(self):
+        """Return the number of threads to run the trials on."""
+        if self.num_threads is not None:
+            return max(self.num_threads, 1)
+        if os.getenv('QISKIT_IN_PARALLEL') == 'TRUE':
+            return 1
+        return CPU_COUNT
+
     def _layer_update(self, i, best_layout, best_depth,
                       best_circuit, layer_list):
         """Provide a DAGCircuit for a new mapped layer.
@@ -236,7 +284,7 @@ class StochasticSwap(TransformationPass):
             best_layout (Layout): layout returned from _layer_permutation
             best_depth (int): depth returned from _layer_permutation
             best_circuit (DAGCircuit): swap circuit returned from _layer_permutation
-            layer_list (list): list of DAGCircuit objects for each layer,
+            layer_list (list): list of DAGLayer objects for each layer,
                 output of DAGCircuit layers() method
 
         Returns:
@@ -259,12 +307,17 @@ class StochasticSwap(TransformationPass):
         else:
             logger.debug("layer_update: there are no swaps in this layer")
         # Output this layer
-        layer_circuit = layer_list[i]["graph"]
-        for creg in layer_circuit.cregs.values():
+        layer = layer_list[i]
+        for creg in layer.dag.cregs.values():
             dagcircuit_output.add_creg(creg)
 
         order = layout.reorder_bits(dagcircuit_output.qubits)
-        dagcircuit_output.compose(layer_circuit, qubits=order)
+        qubit_map = {qubit: dagcircuit_output.qubits[idx]
+                     for qubit, idx in zip(layer.dag.qubits, order)}
+        for node in layer.op_nodes:
+            dagcircuit_output.apply_operation_back(node.op.copy(),
+                                                   [qubit_map[q] for q in node.qargs],
+                                                   node.cargs)
 
         return dagcircuit_output
 
@@ -319,7 +372,7 @@ class StochasticSwap(TransformationPass):
             if not success_flag:
                 logger.debug("mapper: failed, layer %d, "
                              "retrying sequentially", i)
-                serial_layerlist = list(layer["graph"].serial_layers())
+                serial_layerlist = list(layer.graph.serial_layers())
 
                 # Go through each gate in the layer
                 for j, serial_layer in enumerate(serial_layerlist):
@@ -366,10 +419,25 @@ class StochasticSwap(TransformationPass):
         # any measurements that needed to be removed earlier.
         logger.debug("mapper: self.trivial_layout = %s", self.trivial_layout)
         logger.debug("mapper: layout = %s", layout)
+        self.property_set['final_layout'] = layout
 
         return dagcircuit_output
 
 
+def _trial_pool(num_threads):
+    """Return the thread pool running the trials, with at least ``num_threads`` threads."""
+    global _TRIAL_POOL, _TRIAL_POOL_SIZE  # pylint: disable=global-statement
+    with _TRIAL_POOL_LOCK:
+        if _TRIAL_POOL_SIZE < num_threads:
+            # The smaller pool is not shut down, as concurrent runs of the
+            # pass may still be using it. Its threads exit when it is garbage
+            # collected, after running the trials submitted to it.
+            _TRIAL_POOL = ThreadPoolExecutor(max_workers=num_threads,
+                                             thread_name_prefix='StochasticSwap')
+            _TRIAL_POOL_SIZE = num_threads
+        return _TRIAL_POOL
+
+
 def _regtuple_to_numeric(items, qregs):
     """Takes Qubit instances and converts them into an integer array.
 
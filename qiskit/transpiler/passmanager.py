@@ -12,17 +12,23 @@
 
 """Manager for a set of Passes and their scheduling during transpilation."""
 
+from collections import OrderedDict
 from typing import Union, List, Callable, Dict, Any
 
 import dill
 
-from qiskit.visualization import pass_manager_drawer
 from qiskit.tools.parallel import parallel_map
 from qiskit.circuit import QuantumCircuit
 from .basepasses import BasePass
 from .exceptions import TranspilerError
 from .runningpassmanager import RunningPassManager
 
+# Pass managers deserialized in this process by ``PassManager._in_parallel``,
+# keyed by their serialized form. Worker processes are kept alive between
+# tasks, so each of them only pays for ``dill.loads`` once per pass manager.
+_DESERIALIZED_PMS = OrderedDict()
+_DESERIALIZED_PMS_SIZE = 4
+
 
 class PassManager:
     """Manager for a set of Passes and their scheduling during transpilation."""
@@ -221,10 +227,23 @@ class PassManager:
     @staticmethod
     def _in_parallel(circuit, pm_dill=None) -> QuantumCircuit:
         """Task used by the parallel map tools from ``_run_several_circuits``."""
-        running_passmanager = dill.loads(pm_dill)._create_running_passmanager()
+        running_passmanager = PassManager._deserialize(pm_dill)._create_running_passmanager()
         result = running_passmanager.run(circuit)
         return result
 
+    @staticmethod
+    def _deserialize(pm_dill: bytes) -> 'PassManager':
+        """Load a pass manager serialized with ``dill``, reusing it if already loaded."""
+        passmanager = _DESERIALIZED_PMS.get(pm_dill)
+        if passmanager is None:
+            passmanager = dill.loads(pm_dill)
+            _DESERIALIZED_PMS[pm_dill] = passmanager
+            if len(_DESERIALIZED_PMS) > _DESERIALIZED_PMS_SIZE:
+                _DESERIALIZED_PMS.popitem(last=False)
+        else:
+            _DESERIALIZED_PMS.move_to_end(pm_dill)
+        return passmanager
+
     def _run_several_circuits(
             self,
             circuits: List[QuantumCircuit],
@@ -293,6 +312,9 @@ class PassManager:
         Raises:
             ImportError: when nxpd or pydot not installed.
         """
+        # pylint: disable=cyclic-import
+        from qiskit.visualization import pass_manager_drawer
+
         return pass_manager_drawer(self, filename=filename, style=style, raw=raw)
 
     def passes(self) -> List[Dict[str, BasePass]]:
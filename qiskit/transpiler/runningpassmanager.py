@@ -118,6 +118,7 @@ class RunningPassManager:
         else:
             circuit.name = name
         circuit._layout = self.property_set['layout']
+        circuit._final_layout = self.property_set['final_layout']
 
         return circuit
 
@@ -56,7 +56,9 @@ backend etc.
 
 """
 
-from .quantum_instance import QuantumInstance
+import importlib
+import sys
+
 from .deprecation import _filter_deprecation_warnings
 from .deprecation import deprecate_arguments
 from .deprecation import deprecate_function
@@ -70,6 +72,23 @@ from .backend_utils import has_ibmq, has_aer
 from .name_unnamed_args import name_args
 from .aqua_globals import aqua_globals
 
+# QuantumInstance imports the compiler and the providers, so it is only
+# imported on first access to keep importing the circuit module fast.
+_LAZY_ATTRIBUTES = {'QuantumInstance': 'qiskit.utils.quantum_instance'}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module 'qiskit.utils' has no attribute '{}'".format(name))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ needs Python 3.7
+    from .quantum_instance import QuantumInstance
+
 
 __all__ = [
     'QuantumInstance',
@@ -0,0 +1,153 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Validators of the Qiskit schemas compiled with fastjsonschema.
+
+Compiling a schema with fastjsonschema generates the Python source of its
+validator, which is the slow part of the compilation (about a quarter of a
+second for the qobj schema). The generated source of each validator is
+therefore cached on disk, along with its bytecode, so that later processes
+only load the validators. The cache directory is keyed by the versions of
+Qiskit and fastjsonschema, and the cached files by a hash of the schemas.
+It defaults to ``~/.qiskit/schema_cache`` and can be set with the
+``QISKIT_SCHEMA_CACHE_DIR`` environment variable, an empty value of which
+disables the disk cache.
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import py_compile
+import re
+import tempfile
+import threading
+
+import fastjsonschema
+
+from qiskit.version import __version__
+
+logger = logging.getLogger(__name__)
+
+_SCHEMAS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__)))), 'schemas')
+_DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.qiskit', 'schema_cache')
+
+# Part of the keys of the cached validators, to be changed with the way they
+# are generated
+_CACHE_KEY = b'use_default=False,use_formats=False'
+
+_VALIDATORS = {}
+_LOCK = threading.Lock()
+
+
+def compiled_validator(name):
+    """Return the compiled validator of one of the Qiskit schemas.
+
+    The validator is compiled on the first call for a schema, or loaded from
+    the disk cache, and kept for the following calls.
+
+    Args:
+        name (str): the name of the schema, e.g. ``qobj`` for the
+            ``qiskit/schemas/qobj_schema.json`` schema.
+
+    Returns:
+        callable: a function validating a dictionary against the schema, which
+        returns the dictionary and raises a
+        ``fastjsonschema.JsonSchemaException`` if it does not conform to the
+        schema. The default values of the schema are not filled in.
+    """
+    validator = _VALIDATORS.get(name)
+    if validator is None:
+        with _LOCK:
+            validator = _VALIDATORS.get(name)
+            if validator is None:
+                validator = _VALIDATORS[name] = _load_validator(name)
+    return validator
+
+
+def schema_cache_dir():
+    """Return the directory of the cached validators of this version of Qiskit.
+
+    Returns:
+        str or None: the directory, or ``None`` if the disk cache is disabled.
+    """
+    cache_dir = os.getenv('QISKIT_SCHEMA_CACHE_DIR', _DEFAULT_CACHE_DIR)
+    if not cache_dir:
+        return None
+    version = 'qiskit-terra-%s-fastjsonschema-%s' % (__version__, fastjsonschema.VERSION)
+    return os.path.join(os.path.expanduser(cache_dir), re.sub(r'[^\w.-]', '_', version))
+
+
+def _load_validator(name):
+    """Load the validator of a schema from the disk cache, or compile it."""
+    with open(os.path.join(_SCHEMAS_DIR, '%s_schema.json' % name), 'rb') as schema_file:
+        schema_bytes = schema_file.read()
+    cache_dir = schema_cache_dir()
+    if cache_dir is None:
+        return fastjsonschema.compile(_load_schema(schema_bytes), use_default=False)
+
+    digest = hashlib.sha256(_CACHE_KEY + schema_bytes).hexdigest()[:16]
+    source_path = os.path.join(cache_dir, '%s_%s.py' % (name, digest))
+    if not os.path.exists(source_path):
+        source = fastjsonschema.compile_to_code(_load_schema(schema_bytes), use_default=False)
+        # The validator of the schema is the first function of the source
+        func_name = re.search(r'^def (\w+)\(', source, re.MULTILINE).group(1)
+        source += '\n\nvalidate = %s\n' % func_name
+        try:
+            _write_source(source_path, source)
+        except OSError as err:
+            logger.debug('Cannot cache the validator of the %s schema in %s: %s',
+                         name, cache_dir, err)
+            namespace = {}
+            exec(compile(source, source_path, 'exec'), namespace)  # pylint: disable=exec-used
+            return namespace['validate']
+
+    spec = importlib.util.spec_from_file_location('_qiskit_schema_%s' % name, source_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+
+def _load_schema(schema_bytes):
+    """Load a schema, without its ``format`` keywords which are not validated by
+    the ``jsonschema`` validators of ``schema_validation`` either."""
+    return _without_formats(json.loads(schema_bytes.decode('utf-8')))
+
+
+def _without_formats(schema):
+    if isinstance(schema, dict):
+        return {key: _without_formats(value) for key, value in schema.items()
+                if not (key == 'format' and isinstance(value, str))}
+    if isinstance(schema, list):
+        return [_without_formats(value) for value in schema]
+    return schema
+
+
+def _write_source(path, source):
+    """Atomically write the source of a validator and its bytecode."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'w') as tmp_file:
+            tmp_file.write(source)
+        os.replace(tmp_path, path)
+    except OSError:
+        os.unlink(tmp_path)
+        raise
+    # Written even if the interpreter does not write bytecode, the bytecode is
+    # most of the cost saved by the cache
+    try:
+        py_compile.compile(path, cfile=importlib.util.cache_from_source(path), doraise=True)
+    except (OSError, py_compile.PyCompileError) as err:
+        logger.debug('Cannot write the bytecode of %s: %s', path, err)
@@ -17,8 +17,9 @@ import os
 import logging
 import warnings
 
-import jsonschema
+from fastjsonschema import JsonSchemaException
 
+from .compiled_validators import compiled_validator
 from .exceptions import SchemaValidationError, _SummaryValidationError
 
 logger = logging.getLogger(__name__)
@@ -80,7 +81,11 @@ def _get_validator(name, schema=None, check_schema=True,
     Raises:
         SchemaValidationError: Raised if validation fails.
     """
+    import jsonschema
+
     if schema is None:
+        if name in _DEFAULT_SCHEMA_PATHS and name not in _SCHEMAS:
+            _load_schemas_and_validators()
         try:
             schema = _SCHEMAS[name]
         except KeyError:
@@ -102,17 +107,13 @@ def _get_validator(name, schema=None, check_schema=True,
 
 
 def _load_schemas_and_validators():
-    """Load all default schemas into `_SCHEMAS`."""
+    """Load all default schemas into `_SCHEMAS`, on first use."""
     schema_base_path = os.path.join(os.path.dirname(__file__), '../..')
     for name, path in _DEFAULT_SCHEMA_PATHS.items():
         _load_schema(os.path.join(schema_base_path, path), name)
         _get_validator(name)
 
 
-# Load all schemas on import
-_load_schemas_and_validators()
-
-
 def validate_json_against_schema(json_dict, schema,
                                  err_msg=None):
     """Validates JSON dict against a schema.
@@ -124,7 +125,9 @@ def validate_json_against_schema(json_dict, schema,
             standard schemas is: ``backend_configuration``,
             ``backend_properties``, ``backend_status``,
             ``default_pulse_configuration``, ``job_status``, ``qobj``,
-            ``result``.
+            ``result``. The standard schemas are validated with their
+            compiled validators, see
+            ``qiskit.validation.jsonschema.compiled_validators``.
         err_msg (str): Optional error message.
 
     Raises:
@@ -136,6 +139,17 @@ def validate_json_against_schema(json_dict, schema,
                   "pull the schemas from the Qiskit/ibmq-schemas and directly "
                   "validate your payloads with that", DeprecationWarning,
                   stacklevel=2)
+    if isinstance(schema, str) and schema in _DEFAULT_SCHEMA_PATHS:
+        try:
+            compiled_validator(schema)(json_dict)
+        except JsonSchemaException as err:
+            # The path of fastjsonschema errors starts with the name of the root
+            raise SchemaValidationError(
+                _validation_error_message(list(getattr(err, 'path', []))[1:], err.message))
+        return
+
+    import jsonschema
+
     if isinstance(schema, str):
         schema_name = schema
         schema = _SCHEMAS[schema_name]
@@ -146,19 +160,8 @@ def validate_json_against_schema(json_dict, schema,
             failure_path = list(best_match_error.absolute_path)
             if len(failure_path) > 1:
                 failure_path = failure_path[:-1]
-            error_path = ""
-            for component in failure_path:
-                if isinstance(component, int):
-                    error_path += "[%s]" % component
-                else:
-                    error_path += "['%s']" % component
-            if failure_path:
-                err_message = "Validation failed. Possibly at %s" % error_path
-                err_message += " because of %s" % best_match_error.message
-            else:
-                err_message = "Validation failed. "
-                err_message += "Possibly because %s" % best_match_error.message
-            raise SchemaValidationError(err_message)
+            raise SchemaValidationError(
+                _validation_error_message(failure_path, best_match_error.message))
     else:
         try:
             jsonschema.validate(json_dict, schema)
@@ -171,6 +174,19 @@ def validate_json_against_schema(json_dict, schema,
         raise newerr
 
 
+def _validation_error_message(failure_path, message):
+    """Return the message of a validation error at a path of a JSON dict."""
+    error_path = ""
+    for component in failure_path:
+        if isinstance(component, int):
+            error_path += "[%s]" % component
+        else:
+            error_path += "['%s']" % component
+    if failure_path:
+        return "Validation failed. Possibly at %s because of %s" % (error_path, message)
+    return "Validation failed. Possibly because %s" % message
+
+
 def _format_causes(err, level=0):
     """Return a cascading explanation of the validation error.
 
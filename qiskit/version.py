@@ -16,7 +16,7 @@
 
 import os
 import subprocess
-import pkg_resources
+import sys
 
 ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
 
@@ -105,6 +105,7 @@ def _get_qiskit_versions():
     except Exception:
         out_dict['qiskit-aqua'] = None
     try:
+        import pkg_resources
         out_dict['qiskit'] = pkg_resources.get_distribution('qiskit').version
     except Exception:
         out_dict['qiskit'] = None
@@ -112,4 +113,15 @@ def _get_qiskit_versions():
     return out_dict
 
 
-__qiskit_version__ = _get_qiskit_versions()
+def __getattr__(name):
+    # The versions of the other packages are only looked up on first access,
+    # as it imports them.
+    if name == '__qiskit_version__':
+        globals()[name] = _get_qiskit_versions()
+        return globals()[name]
+    raise AttributeError("module 'qiskit.version' has no attribute '{}'".format(name))
+
+
+if sys.version_info < (3, 7):
+    # Module __getattr__ needs Python 3.7
+    __qiskit_version__ = _get_qiskit_versions()
@@ -0,0 +1,119 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the gate kernels of the BasicAer simulators."""
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit import QuantumCircuit
+from qiskit.circuit.library import QuantumVolume
+from qiskit.compiler import assemble, transpile
+from qiskit.providers.basicaer.basicaertools import (GateKernel, compile_gate_kernels,
+                                                     einsum_vecmul_index)
+from qiskit.quantum_info import Operator, random_unitary
+from qiskit.test import QiskitTestCase
+
+
+@ddt
+class TestGateKernel(QiskitTestCase):
+    """Test GateKernel against einsum matrix multiplication."""
+
+    def assertKernelMatches(self, gate, qubits, num_qubits=4):
+        """Assert the kernel of gate on qubits applies the gate like einsum."""
+        rng = np.random.default_rng(1234)
+        state = rng.normal(size=2 ** num_qubits) + 1j * rng.normal(size=2 ** num_qubits)
+        state = np.reshape(state, num_qubits * [2])
+        expected = np.einsum(einsum_vecmul_index(qubits, num_qubits),
+                             np.reshape(gate, 2 * len(qubits) * [2]), state)
+        kernel = GateKernel(gate, [num_qubits - 1 - qubit for qubit in qubits], num_qubits)
+        np.testing.assert_allclose(kernel(state.copy()), expected, atol=1e-12)
+
+    @data([0], [3], [2, 0], [1, 3], [0, 2, 3])
+    def test_dense(self, qubits):
+        """Test a dense gate on qubits {qubits}."""
+        gate = random_unitary(2 ** len(qubits), seed=42).data
+        self.assertKernelMatches(gate, qubits)
+
+    @data([0], [1, 3], [3, 1], [2, 0, 1])
+    def test_diagonal(self, qubits):
+        """Test a diagonal gate on qubits {qubits}."""
+        gate = np.diag(np.exp(1j * np.arange(2 ** len(qubits))))
+        self.assertKernelMatches(gate, qubits)
+
+    @data([0, 1], [3, 0], [1, 2])
+    def test_permutation(self, qubits):
+        """Test permutation gates with phases on qubits {qubits}."""
+        cx_gate = np.array([[1, 0, 0, 0], [0, 0, 0, 1], [0, 0, 1, 0], [0, 1, 0, 0]])
+        self.assertKernelMatches(cx_gate, qubits)
+        phased = np.array([[0, 0, 1j, 0], [0, 0, 0, 1], [-1, 0, 0, 0], [0, 1, 0, 0]])
+        self.assertKernelMatches(phased, qubits)
+
+    def test_fused_single_qubit_runs(self):
+        """Test runs of single-qubit gates are fused into one kernel."""
+        circuit = QuantumCircuit(2, 1)
+        circuit.u3(0.1, 0.2, 0.3, 0)
+        circuit.u1(0.4, 0)
+        circuit.u2(0.5, 0.6, 1)
+        circuit.barrier()
+        circuit.u1(0.7, 0)
+        circuit.cx(0, 1)
+        circuit.u1(0.8, 1)
+        circuit.measure(1, 0)
+        circuit.u1(0.9, 1).c_if(circuit.cregs[0], 1)
+        experiment = assemble(circuit).experiments[0]
+        compiled, fused_gates = compile_gate_kernels(experiment.instructions, 2, 0, 2)
+        self.assertEqual(fused_gates, 3)
+        names = [None if instruction is None else instruction.name
+                 for instruction, _ in compiled]
+        # The three u on qubit 0 are fused and the one on qubit 1 kept.
+        self.assertEqual(names, [None, 'u2', 'cx', 'u1', 'measure', 'bfunc', 'u1'])
+        self.assertEqual([kernel is None for _, kernel in compiled],
+                         [False, False, False, False, True, True, False])
+
+    def test_fused_blocks(self):
+        """Test adjacent gates are fused into blocks of up to max_fused_qubits qubits."""
+        circuit = QuantumCircuit(3, 1)
+        circuit.u3(0.1, 0.2, 0.3, 0)
+        circuit.cx(0, 1)
+        circuit.u1(0.4, 1)
+        circuit.u2(0.5, 0.6, 2)
+        circuit.cx(1, 2)
+        circuit.measure(2, 0)
+        circuit.cx(0, 2)
+        experiment = assemble(circuit).experiments[0]
+        compiled, fused_gates = compile_gate_kernels(experiment.instructions, 3, 0, 3, 2)
+        names = [None if instruction is None else instruction.name
+                 for instruction, _ in compiled]
+        self.assertEqual(names, [None, None, 'measure', 'cx'])
+        self.assertEqual(fused_gates, 5)
+        compiled, fused_gates = compile_gate_kernels(experiment.instructions, 3, 0, 3, 3)
+        names = [None if instruction is None else instruction.name
+                 for instruction, _ in compiled]
+        self.assertEqual(names, [None, 'measure', 'cx'])
+        self.assertEqual(fused_gates, 5)
+        compiled, fused_gates = compile_gate_kernels(experiment.instructions, 3, 0, 3, 0)
+        self.assertEqual(len(compiled), len(experiment.instructions))
+        self.assertEqual(fused_gates, 0)
+
+    @data(0, 1, 2, 3, 4)
+    def test_fused_unitary(self, max_fused_qubits):
+        """Test the fused kernels apply the circuit unitary with max {max_fused_qubits} qubits."""
+        circuit = transpile(QuantumVolume(4, seed=3), basis_gates=['u1', 'u2', 'u3', 'cx'],
+                            optimization_level=0)
+        experiment = assemble(circuit).experiments[0]
+        compiled, _ = compile_gate_kernels(experiment.instructions, 4, 0, 8, max_fused_qubits)
+        unitary = np.reshape(np.eye(16, dtype=complex), 8 * [2])
+        for _, kernel in compiled:
+            unitary = kernel(unitary)
+        expected = Operator(circuit).data / np.exp(1j * circuit.global_phase)
+        np.testing.assert_allclose(np.reshape(unitary, (16, 16)), expected, atol=1e-10)
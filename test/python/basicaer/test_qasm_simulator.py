@@ -288,6 +288,98 @@ class TestBasicAerQasmSimulator(providers.BackendTestCase):
             counts = result.get_counts(0)
             self.assertEqual(counts, target_counts)
 
+    def test_shots_in_batches(self):
+        """Test the shots without measure sampling are simulated in batches."""
+        shots = 1000
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.reset(qr[0])
+        circuit.h(qr[2])
+        circuit.measure(qr, cr)
+        qobj = assemble(transpile(circuit, self.backend), shots=shots,
+                        seed_simulator=self.seed, memory=True)
+
+        result = self.backend.run(qobj).result()
+        backend = QasmSimulatorPy()
+        # Statevectors of at most 3 shots per batch
+        backend.MAX_BATCH_AMPLITUDES = 3 * 2 ** 3
+        batched = backend.run(qobj).result()
+
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'000', '010', '100', '110'})
+        self.assertDictAlmostEqual(counts, {key: shots / 4 for key in counts},
+                                   0.1 * shots)
+        # The shots get the same outcomes whatever the batch size
+        self.assertEqual(batched.get_memory(), result.get_memory())
+
+    def test_gate_fusion(self):
+        """Test fusing gates into blocks gives the same outcomes."""
+        qr = QuantumRegister(3, 'qr')
+        cr = ClassicalRegister(3, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.t(qr[1])
+        circuit.measure(qr[1], cr[1])
+        circuit.h(qr[1])
+        circuit.cx(qr[1], qr[2])
+        circuit.rx(0.3, qr[2]).c_if(cr, 2)
+        circuit.cx(qr[2], qr[0])
+        circuit.measure(qr, cr)
+        qobj = assemble(transpile(circuit, self.backend), shots=200,
+                        seed_simulator=self.seed, memory=True)
+
+        result = self.backend.run(qobj).result()
+        self.assertEqual(result.results[0].metadata, {'fused_gates': 0})
+        for max_fused_qubits in [0, 2, 3]:
+            with self.subTest(max_fused_qubits=max_fused_qubits):
+                fused = self.backend.run(
+                    qobj, backend_options={'fusion_max_qubits': max_fused_qubits}).result()
+                self.assertEqual(fused.get_memory(), result.get_memory())
+        self.assertEqual(fused.results[0].metadata, {'fused_gates': 5})
+
+    def test_wide_classical_register(self):
+        """Test conditionals on a register of more than 64 bits."""
+        shots = 100
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(70, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[69])
+        circuit.x(qr[1]).c_if(cr, 2 ** 69)
+        circuit.measure(qr[1], cr[0])
+        result = execute(circuit, self.backend, shots=shots,
+                         seed_simulator=self.seed).result()
+        counts = result.get_counts()
+        self.assertEqual(set(counts), {'0' * 70, '1' + '0' * 68 + '1'})
+        self.assertEqual(sum(counts.values()), shots)
+
+    def test_columnar_experiments(self):
+        """Test columnar experiments give the same outcomes."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.h(qr[0])
+        circuit.measure(qr[0], cr[0])
+        circuit.x(qr[1]).c_if(cr, 1)
+        circuit.measure(qr, cr)
+        # Without conditionals, the measurements are sampled
+        bell = QuantumCircuit(qr, cr)
+        bell.h(qr[0])
+        bell.cx(qr[0], qr[1])
+        bell.measure(qr, cr)
+        circuits = transpile([circuit, bell], self.backend)
+        result = self.backend.run(assemble(circuits, shots=100, seed_simulator=self.seed,
+                                           memory=True)).result()
+        columnar = self.backend.run(assemble(circuits, shots=100, seed_simulator=self.seed,
+                                             memory=True, columnar=True)).result()
+        for circuit in circuits:
+            self.assertEqual(columnar.get_memory(circuit), result.get_memory(circuit))
+
 
 if __name__ == '__main__':
     unittest.main()
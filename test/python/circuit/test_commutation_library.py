@@ -0,0 +1,115 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the commutation library."""
+
+import inspect
+import itertools
+
+from ddt import ddt, data
+
+from qiskit.circuit import CommutationLibrary
+from qiskit.circuit.commutation_library import _build_pauli_rules, _commute_dense
+from qiskit.circuit.library import (CXGate, CZGate, HGate, RXGate, RZGate, SwapGate, U3Gate,
+                                    XGate, YGate, ZGate)
+from qiskit.extensions import UnitaryGate
+from qiskit.quantum_info import Operator, random_unitary
+from qiskit.quantum_info.operators import Pauli
+from qiskit.test import QiskitTestCase
+
+
+@ddt
+class TestCommutationLibrary(QiskitTestCase):
+    """Tests for CommutationLibrary."""
+
+    def test_pauli_rules(self):
+        """Test the gates of the rule table commute with the Paulis of their rules."""
+        for gate_class, rules in _build_pauli_rules().items():
+            gate = _standard_gate(gate_class)
+            matrix = Operator(gate)
+            for qubit, paulis in enumerate(rules):
+                for label in paulis:
+                    pauli = ['I'] * gate.num_qubits
+                    pauli[gate.num_qubits - 1 - qubit] = label
+                    pauli = Operator(Pauli(''.join(pauli)))
+                    with self.subTest(gate=gate.name, qubit=qubit, pauli=label):
+                        self.assertEqual(matrix.compose(pauli), pauli.compose(matrix))
+
+    @data(
+        (XGate(), [0], XGate(), [0], True),
+        (XGate(), [0], ZGate(), [0], False),
+        (XGate(), [0], YGate(), [1], True),
+        (CXGate(), [0, 1], CXGate(), [0, 2], True),
+        (CXGate(), [0, 1], CXGate(), [1, 2], False),
+        (CXGate(), [0, 1], RZGate(0.3), [0], True),
+        (CXGate(), [0, 1], RXGate(0.3), [1], True),
+        (CXGate(), [0, 1], CZGate(), [0, 1], False),
+        (HGate(), [0], HGate(), [0], True),
+        (HGate(), [0], XGate(), [0], False),
+        (SwapGate(), [0, 1], SwapGate(), [1, 0], True),
+        (U3Gate(0.1, 0.2, 0.3), [1], CXGate(), [0, 1], False),
+    )
+    def test_commute(self, case):
+        """Test the commutation of {case}."""
+        op1, qargs1, op2, qargs2, expected = case
+        library = CommutationLibrary()
+        self.assertEqual(library.commute(op1, qargs1, op2, qargs2), expected)
+        self.assertEqual(library.commute(op2, qargs2, op1, qargs1), expected)
+        num_qubits = len(set(qargs1 + qargs2))
+        self.assertEqual(_commute_dense(op1, qargs1, op2, qargs2, num_qubits), expected)
+
+    def test_random_standard_gates(self):
+        """Test the library agrees with the dense check on standard gate pairs."""
+        library = CommutationLibrary()
+        gates = [_standard_gate(gate_class) for gate_class in _build_pauli_rules()]
+        for gate1, gate2 in itertools.combinations(gates, 2):
+            qargs1 = list(range(gate1.num_qubits))
+            for qargs2 in itertools.permutations(range(3), gate2.num_qubits):
+                qargs2 = list(qargs2)
+                qubits = sorted(set(qargs1 + qargs2))
+                expected = _commute_dense(gate1, [qubits.index(q) for q in qargs1],
+                                          gate2, [qubits.index(q) for q in qargs2], len(qubits))
+                with self.subTest(gate1=gate1.name, gate2=gate2.name, qargs2=qargs2):
+                    self.assertEqual(library.commute(gate1, qargs1, gate2, qargs2), expected)
+
+    def test_cache_is_keyed_on_relative_placement(self):
+        """Test pairs of gates with the same relative placement share a cache entry."""
+        library = CommutationLibrary()
+        self.assertFalse(library.commute(HGate(), [3], XGate(), [3]))
+        self.assertFalse(library.commute(HGate(), [5], XGate(), [5]))
+        self.assertEqual(library.cache_info()['misses'], 1)
+        self.assertEqual(library.cache_info()['hits'], 1)
+        library.clear_cache()
+        self.assertEqual(library.cache_info()['currsize'], 0)
+
+    def test_cache_is_bounded(self):
+        """Test the cache drops the least recently used entries."""
+        library = CommutationLibrary(maxsize=2)
+        for angle in [0.1, 0.2, 0.3]:
+            library.commute(U3Gate(angle, 0, 0), [0], HGate(), [0])
+        self.assertEqual(library.cache_info()['currsize'], 2)
+
+    def test_unhashable_parameters(self):
+        """Test gates with unhashable parameters are checked without caching."""
+        library = CommutationLibrary()
+        unitary = UnitaryGate(random_unitary(2, seed=1))
+        self.assertFalse(library.commute(unitary, [0], XGate(), [0]))
+        self.assertTrue(library.commute(UnitaryGate(Operator(ZGate())), [0], ZGate(), [0]))
+        self.assertEqual(library.cache_info()['currsize'], 0)
+
+
+def _standard_gate(gate_class):
+    """Return an instance of a standard gate class, with arbitrary angles."""
+    parameters = inspect.signature(gate_class).parameters.values()
+    angles = [0.3 * (idx + 1) for idx, parameter in enumerate(parameters)
+              if parameter.default is inspect.Parameter.empty]
+    return gate_class(*angles)
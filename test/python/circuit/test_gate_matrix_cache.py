@@ -0,0 +1,79 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the gate matrix cache."""
+
+import numpy as np
+from ddt import ddt, data
+
+from qiskit.circuit import GateMatrixCache, Parameter
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import (C3XGate, C4XGate, CCXGate, CU3Gate, CXGate, HGate, RZGate,
+                                    U3Gate, XGate)
+from qiskit.extensions import UnitaryGate
+from qiskit.quantum_info import random_unitary
+from qiskit.test import QiskitTestCase
+
+
+@ddt
+class TestGateMatrixCache(QiskitTestCase):
+    """Tests for GateMatrixCache."""
+
+    @data(HGate(), CXGate(), CXGate(ctrl_state=0), CCXGate(ctrl_state=1), C4XGate(),
+          RZGate(0.3), CU3Gate(0.1, 0.2, 0.3))
+    def test_matrix(self, gate):
+        """Test the cached matrix of {gate} is its read-only matrix."""
+        cache = GateMatrixCache()
+        matrix = cache.matrix(gate)
+        np.testing.assert_array_equal(matrix, gate.to_matrix())
+        self.assertFalse(matrix.flags.writeable)
+        self.assertIs(cache.matrix(gate.copy()), matrix)
+        self.assertEqual(cache.cache_info()['hits'], 1)
+
+    def test_constants(self):
+        """Test the matrices of gates without parameters are kept apart."""
+        cache = GateMatrixCache(maxsize=1)
+        matrix = cache.matrix(CXGate())
+        self.assertIsNot(cache.matrix(CXGate(ctrl_state=0)), matrix)
+        cache.matrix(RZGate(0.1))
+        cache.matrix(RZGate(0.2))
+        self.assertIs(cache.matrix(CXGate()), matrix)
+        info = cache.cache_info()
+        self.assertEqual(info['constants'], 2)
+        self.assertEqual(info['currsize'], 1)
+        cache.clear_cache()
+        self.assertEqual(cache.cache_info()['constants'], 0)
+
+    def test_cache_is_bounded(self):
+        """Test the cache drops the least recently used matrices."""
+        cache = GateMatrixCache(maxsize=2)
+        matrix = cache.matrix(U3Gate(0.1, 0, 0))
+        cache.matrix(U3Gate(0.2, 0, 0))
+        self.assertIs(cache.matrix(U3Gate(0.1, 0, 0)), matrix)
+        cache.matrix(U3Gate(0.3, 0, 0))
+        self.assertIs(cache.matrix(U3Gate(0.1, 0, 0)), matrix)
+        self.assertEqual(cache.cache_info()['currsize'], 2)
+        self.assertEqual(cache.cache_info()['misses'], 3)
+
+    def test_uncached_gates(self):
+        """Test the matrices of other gates are computed without caching."""
+        cache = GateMatrixCache()
+        unitary = UnitaryGate(random_unitary(2, seed=1))
+        np.testing.assert_array_equal(cache.matrix(unitary), unitary.to_matrix())
+        np.testing.assert_array_equal(cache.matrix(XGate().power(0.5)),
+                                      XGate().power(0.5).to_matrix())
+        with self.assertRaises(CircuitError):
+            cache.matrix(C3XGate())
+        with self.assertRaises(TypeError):
+            cache.matrix(RZGate(Parameter('a')))
+        self.assertEqual(cache.cache_info()['constants'], 0)
+        self.assertEqual(cache.cache_info()['currsize'], 0)
@@ -0,0 +1,92 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test ParameterBindingPlan."""
+
+import numpy as np
+
+from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter, ParameterVector, ParameterBindingPlan
+from qiskit.circuit.exceptions import CircuitError
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.test import QiskitTestCase
+
+
+class TestParameterBindingPlan(QiskitTestCase):
+    """Test binding many values with a ParameterBindingPlan."""
+
+    def setUp(self):
+        super().setUp()
+        self.theta = Parameter('theta')
+        self.phi = Parameter('phi')
+        sub = QuantumCircuit(2, name='sub')
+        sub.rzz(self.phi, 0, 1)
+        circuit = QuantumCircuit(2, global_phase=self.theta / 2)
+        circuit.rx(self.theta, 0)
+        circuit.ry(2 * self.phi + self.theta, 1)
+        circuit.cx(0, 1)
+        circuit.u(self.theta, self.phi, 0.5, 0)
+        circuit.append(sub.to_gate(), [0, 1])
+        self.circuit = circuit
+
+    def test_bind_many_matches_bind_parameters(self):
+        """Test bind_many gives the same circuits as bind_parameters."""
+        plan = ParameterBindingPlan(self.circuit)
+        self.assertEqual(plan.parameters, [self.phi, self.theta])
+        values = np.random.RandomState(12).uniform(-np.pi, np.pi, size=(5, 2))
+        bound_circuits = plan.bind_many(values)
+        self.assertEqual(len(bound_circuits), 5)
+        for row, bound in zip(values, bound_circuits):
+            expected = self.circuit.bind_parameters({self.phi: row[0], self.theta: row[1]})
+            self.assertEqual(bound, expected)
+            self.assertEqual(bound.parameters, set())
+            self.assertAlmostEqual(float(bound.global_phase), float(expected.global_phase))
+
+    def test_original_not_modified(self):
+        """Test binding does not modify the original circuit."""
+        original = self.circuit.copy()
+        ParameterBindingPlan(self.circuit).bind_many([[0.1, 0.2], [0.3, 0.4]])
+        self.assertEqual(self.circuit, original)
+        self.assertEqual(self.circuit.parameters, {self.theta, self.phi})
+
+    def test_parameter_order(self):
+        """Test the values follow the given parameter order, including vectors."""
+        params = ParameterVector('p', 3)
+        circuit = QuantumCircuit(1)
+        for param in params:
+            circuit.rz(param, 0)
+        plan = ParameterBindingPlan(circuit, [params])
+        bound = plan.bind_many(np.array([[1.0, 2.0, 3.0]]))[0]
+        self.assertEqual([instr.params[0] for instr, _, _ in bound.data], [1.0, 2.0, 3.0])
+
+    def test_transpiled_ansatz(self):
+        """Test binding a transpiled ansatz."""
+        ansatz = RealAmplitudes(3, reps=2)
+        transpiled = transpile(ansatz, basis_gates=['u3', 'cx'], optimization_level=1)
+        plan = ParameterBindingPlan(transpiled, ansatz.ordered_parameters)
+        values = np.random.RandomState(7).random((3, ansatz.num_parameters))
+        for row, bound in zip(values, plan.bind_many(values)):
+            expected = transpiled.bind_parameters(dict(zip(ansatz.ordered_parameters, row)))
+            self.assertEqual(bound, expected)
+
+    def test_wrong_parameters_raises(self):
+        """Test a plan with parameters not matching the circuit raises."""
+        with self.assertRaises(CircuitError):
+            ParameterBindingPlan(self.circuit, [self.theta])
+
+    def test_wrong_shape_raises(self):
+        """Test values of the wrong shape raise."""
+        plan = ParameterBindingPlan(self.circuit)
+        with self.assertRaises(CircuitError):
+            plan.bind_many([0.1, 0.2])
+        with self.assertRaises(CircuitError):
+            plan.bind_many([[0.1, 0.2, 0.3]])
@@ -1492,6 +1492,42 @@ class TestParameterExpressions(QiskitTestCase):
             self.assertEqual(expr.gradient(x), 2 * x)
             self.assertEqual(expr.gradient(x).gradient(x), 2)
 
+    def test_evaluate(self):
+        """Verify numeric evaluation agrees with binding."""
+        x = Parameter('x')
+        y = Parameter('y')
+        expr = (2 * x + y).sin() * x
+        values = {x: 0.3, y: -1.2}
+        # the first evaluations are symbolic, the later ones compiled
+        for _ in range(10):
+            self.assertAlmostEqual(expr.evaluate(values), float(expr.bind(values)))
+        self.assertIsInstance(expr.evaluate(values), float)
+        self.assertEqual((x * 1j).evaluate({x: 2}), 2j)
+
+    def test_evaluate_vectorized(self):
+        """Verify numeric evaluation over arrays of values."""
+        x = Parameter('x')
+        y = Parameter('y')
+        expr = x.cos() + 2 * y
+        xs = numpy.linspace(0, 1, 5)
+        result = expr.evaluate({x: xs, y: 0.5})
+        numpy.testing.assert_allclose(result, numpy.cos(xs) + 1)
+        numpy.testing.assert_allclose((x * 0 + y).evaluate({x: xs, y: 1.0}), numpy.ones(5))
+
+    def test_evaluate_raises(self):
+        """Verify numeric evaluation raises on unbound parameters or division by zero."""
+        x = Parameter('x')
+        y = Parameter('y')
+        with self.assertRaises(CircuitError):
+            (x + y).evaluate({x: 1})
+        with self.assertRaises(CircuitError):
+            x.evaluate({x: 1, y: 1})
+        for _ in range(10):
+            with self.assertRaises(ZeroDivisionError):
+                (1 / x).evaluate({x: 0})
+        with self.assertRaises(ZeroDivisionError):
+            (1 / x).evaluate({x: numpy.array([0.0, 1.0])})
+
 
 class TestParameterEquality(QiskitTestCase):
     """Test equality of Parameters and ParameterExpressions."""
@@ -211,6 +211,24 @@ class TestQuantumCircuitDisassembler(QiskitTestCase):
         self.assertEqual(circuits[0], qc)
         self.assertEqual({}, header)
 
+    def test_disassemble_columnar(self):
+        """Test disassembling columnar experiments."""
+        qr = QuantumRegister(2, name='q')
+        cr = ClassicalRegister(2, name='c')
+        qc = QuantumCircuit(qr, cr, name='circ')
+        qc.initialize([1, 0], qr[0])
+        qc.h(qr[0])
+        qc.rz(0.3, qr[1]).c_if(cr, 1)
+        qc.cx(qr[0], qr[1])
+        qc.measure(qr, cr)
+        qobj = assemble(qc, shots=100, columnar=True)
+        circuits, run_config_out, header = disassemble(qobj)
+        run_config_out = RunConfig(**run_config_out)
+        self.assertEqual(run_config_out.shots, 100)
+        self.assertEqual(len(circuits), 1)
+        self.assertEqual(circuits[0], qc)
+        self.assertEqual({}, header)
+
 
 class TestPulseScheduleDisassembler(QiskitTestCase):
     """Tests for disassembling pulse schedules to qobj."""
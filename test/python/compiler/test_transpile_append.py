@@ -0,0 +1,143 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for appending circuits to transpiled circuits."""
+
+from ddt import ddt, data
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit.library import QuantumVolume
+from qiskit.compiler import transpile
+from qiskit.compiler.transpile import _final_virtual_layout
+from qiskit.quantum_info import Statevector
+from qiskit.test import QiskitTestCase
+from qiskit.transpiler import CouplingMap
+from qiskit.transpiler.exceptions import TranspilerError
+
+
+@ddt
+class TestTranspileAppend(QiskitTestCase):
+    """Tests for transpile with append_to."""
+
+    def setUp(self):
+        super().setUp()
+        self.options = {'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                        'coupling_map': CouplingMap.from_line(5),
+                        'seed_transpiler': 42}
+
+    def assertSameProbabilities(self, transpiled, circuit):
+        """Assert the transpiled circuit measures the virtual qubits like circuit."""
+        num_qubits = transpiled.num_qubits
+        if transpiled._layout is None:
+            qargs = [transpiled.qubits.index(qubit) for qubit in circuit.qubits]
+        else:
+            positions = _final_virtual_layout(transpiled)
+            qargs = [positions[qubit] for qubit in circuit.qubits]
+        probabilities = Statevector.from_int(0, 2 ** num_qubits).evolve(
+            transpiled).probabilities().reshape([2] * num_qubits)
+        # Axis i of the tensor is the qubit num_qubits - 1 - i.
+        probabilities = np.moveaxis(probabilities,
+                                    [num_qubits - 1 - qarg for qarg in reversed(qargs)],
+                                    range(len(qargs)))
+        probabilities = probabilities.sum(axis=tuple(range(len(qargs), num_qubits))).ravel()
+        expected = Statevector.from_int(0, 2 ** circuit.num_qubits).evolve(
+            circuit).probabilities()
+        self.assertTrue(abs(probabilities - expected).max() < 1e-8)
+
+    @data('basic', 'lookahead', 'stochastic', 'sabre')
+    def test_append_segments(self, routing_method):
+        """Test appending segments routed with {routing_method} swap."""
+        first = QuantumVolume(4, seed=1).decompose()
+        second = QuantumVolume(4, seed=2).decompose()
+
+        transpiled = transpile(first, routing_method=routing_method, **self.options)
+        transpiled = transpile(second, routing_method=routing_method, append_to=transpiled,
+                               **self.options)
+        self.assertSameProbabilities(transpiled, first.compose(second))
+
+        transpiled = transpile(first, routing_method=routing_method, append_to=transpiled,
+                               **self.options)
+        self.assertSameProbabilities(transpiled, first.compose(second).compose(first))
+
+    def test_routing_records_final_layout(self):
+        """Test the transpiled circuits record the permutation done by routing."""
+        circuit = QuantumCircuit(3)
+        circuit.cx(0, 2)
+        for routing_method in ['basic', 'lookahead', 'stochastic', 'sabre']:
+            transpiled = transpile(circuit, routing_method=routing_method,
+                                   initial_layout=[0, 1, 2], **self.options)
+            self.assertIsNotNone(transpiled._final_layout)
+            self.assertSameProbabilities(transpiled, circuit)
+
+    def test_append_list(self):
+        """Test appending to a list of transpiled circuits."""
+        qr = QuantumRegister(3, 'qr')
+        first = QuantumCircuit(qr)
+        first.h(qr[0])
+        first.cx(qr[0], qr[2])
+        second = QuantumCircuit(qr)
+        second.x(qr[1])
+        prefixes = transpile([first, second], **self.options)
+        results = transpile([second, first], append_to=prefixes, **self.options)
+        self.assertSameProbabilities(results[0], first.compose(second))
+        self.assertSameProbabilities(results[1], second.compose(first))
+
+    def test_reset_of_appended_circuit_kept(self):
+        """Test a reset at the start of an appended circuit is not removed."""
+        first = QuantumCircuit(2)
+        first.x(0)
+        second = QuantumCircuit(2)
+        second.reset(0)
+        second.cx(0, 1)
+        transpiled = transpile(first, **self.options)
+        transpiled = transpile(second, append_to=transpiled, **self.options)
+        self.assertIn('reset', transpiled.count_ops())
+        self.assertSameProbabilities(transpiled, first.compose(second))
+
+    def test_append_new_classical_register(self):
+        """Test the classical registers of the appended circuit are added."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(2, 'cr')
+        first = QuantumCircuit(qr)
+        first.h(qr[0])
+        second = QuantumCircuit(qr, cr)
+        second.cx(qr[0], qr[1])
+        second.measure(qr, cr)
+        transpiled = transpile(first, **self.options)
+        transpiled = transpile(second, append_to=transpiled, **self.options)
+        self.assertEqual(transpiled.cregs, [cr])
+        self.assertEqual(transpiled.count_ops()['measure'], 2)
+
+    def test_append_without_coupling_map(self):
+        """Test appending to a circuit transpiled without coupling map."""
+        first = QuantumCircuit(2)
+        first.h(0)
+        second = QuantumCircuit(2)
+        second.cx(0, 1)
+        transpiled = transpile(first, basis_gates=['u3', 'cx'])
+        transpiled = transpile(second, basis_gates=['u3', 'cx'], append_to=transpiled)
+        self.assertSameProbabilities(transpiled, first.compose(second))
+
+    def test_unknown_qubits_raise(self):
+        """Test appending a circuit on other qubits raises."""
+        transpiled = transpile(QuantumCircuit(QuantumRegister(2, 'a')), **self.options)
+        with self.assertRaises(TranspilerError):
+            transpile(QuantumCircuit(QuantumRegister(2, 'b')), append_to=transpiled,
+                      **self.options)
+
+    def test_initial_layout_conflicts(self):
+        """Test append_to conflicts with initial_layout."""
+        transpiled = transpile(QuantumCircuit(2), **self.options)
+        with self.assertRaises(TranspilerError):
+            transpile(QuantumCircuit(2), append_to=transpiled, initial_layout=[0, 1],
+                      **self.options)
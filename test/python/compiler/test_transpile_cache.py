@@ -0,0 +1,178 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Tests for the transpile cache."""
+
+import os
+import tempfile
+import threading
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.compiler import transpile, TranspileCache
+from qiskit.test import QiskitTestCase
+from qiskit.test.mock import FakeVigo
+
+
+def _ghz(name=None):
+    qr = QuantumRegister(3, 'qr')
+    cr = ClassicalRegister(3, 'cr')
+    circuit = QuantumCircuit(qr, cr, name=name)
+    circuit.h(qr[0])
+    circuit.cx(qr[0], qr[1])
+    circuit.cx(qr[1], qr[2])
+    circuit.measure(qr, cr)
+    return circuit
+
+
+class TestTranspileCache(QiskitTestCase):
+    """Tests for TranspileCache."""
+
+    def setUp(self):
+        super().setUp()
+        self.options = {'basis_gates': ['u1', 'u2', 'u3', 'cx'],
+                        'coupling_map': [[0, 1], [1, 2]],
+                        'seed_transpiler': 42}
+
+    def test_hit_returns_same_circuit(self):
+        """Test a repeated transpilation is served from the cache."""
+        cache = TranspileCache()
+        first = transpile(_ghz(), cache=cache, **self.options)
+        second = transpile(_ghz(), cache=cache, **self.options)
+        self.assertEqual(first, second)
+        self.assertEqual(cache.stats, {'hits': 1, 'disk_hits': 0, 'misses': 1, 'size': 1})
+
+    def test_hit_keeps_name_and_metadata(self):
+        """Test a cache hit gets the name and metadata of the new circuit."""
+        cache = TranspileCache()
+        transpile(_ghz('first'), cache=cache, **self.options)
+        circuit = _ghz('second')
+        circuit.metadata = {'experiment': 2}
+        result = transpile(circuit, cache=cache, **self.options)
+        self.assertEqual(cache.stats['hits'], 1)
+        self.assertEqual(result.name, 'second')
+        self.assertEqual(result.metadata, {'experiment': 2})
+
+    def test_hit_is_a_copy(self):
+        """Test modifying a returned circuit does not modify the cache."""
+        cache = TranspileCache()
+        first = transpile(_ghz(), cache=cache, **self.options)
+        first.x(0)
+        second = transpile(_ghz(), cache=cache, **self.options)
+        self.assertNotEqual(first, second)
+
+    def test_miss_on_different_target(self):
+        """Test a different target or circuit is not served from the cache."""
+        cache = TranspileCache()
+        transpile(_ghz(), cache=cache, **self.options)
+        transpile(_ghz(), cache=cache, optimization_level=3, **self.options)
+        circuit = _ghz()
+        circuit.x(0)
+        transpile(circuit, cache=cache, **self.options)
+        self.assertEqual(cache.stats['hits'], 0)
+        self.assertEqual(cache.stats['misses'], 3)
+
+    def test_miss_on_different_parameters(self):
+        """Test circuits with different parameter objects are not shared."""
+        cache = TranspileCache()
+        circuits = []
+        for _ in range(2):
+            circuit = QuantumCircuit(1)
+            circuit.rx(Parameter('theta'), 0)
+            circuits.append(circuit)
+        results = transpile(circuits, cache=cache, **self.options)
+        transpile(circuits[0], cache=cache, **self.options)
+        self.assertEqual(cache.stats['hits'], 1)
+        for circuit, result in zip(circuits, results):
+            self.assertEqual(circuit.parameters, result.parameters)
+
+    def test_lru_eviction(self):
+        """Test the least recently used circuits are evicted."""
+        cache = TranspileCache(max_size=2)
+        circuits = []
+        for num_gates in range(3):
+            circuit = QuantumCircuit(1)
+            for _ in range(num_gates):
+                circuit.h(0)
+            circuits.append(circuit)
+        transpile(circuits, cache=cache, **self.options)
+        self.assertEqual(len(cache), 2)
+        transpile(circuits[0], cache=cache, **self.options)
+        self.assertEqual(cache.stats['hits'], 0)
+
+    def test_disk_tier(self):
+        """Test transpiled circuits are shared through the cache directory."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            first = transpile(_ghz(), cache=TranspileCache(cache_dir=cache_dir),
+                              **self.options)
+            cache = TranspileCache(cache_dir=cache_dir)
+            second = transpile(_ghz(), cache=cache, **self.options)
+            self.assertEqual(first, second)
+            self.assertEqual(cache.stats['disk_hits'], 1)
+
+            cache.clear()
+            transpile(_ghz(), cache=cache, **self.options)
+            self.assertEqual(cache.stats['misses'], 1)
+
+    def test_invalidate_backend(self):
+        """Test invalidating the entries of a backend."""
+        backend = FakeVigo()
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TranspileCache(cache_dir=cache_dir)
+            transpile(_ghz(), backend, cache=cache, seed_transpiler=42)
+            transpile(_ghz(), cache=cache, **self.options)
+            cache.invalidate(backend.properties().backend_name)
+            self.assertEqual(len(cache), 1)
+            transpile(_ghz(), backend, cache=cache, seed_transpiler=42)
+            transpile(_ghz(), cache=cache, **self.options)
+            self.assertEqual(cache.stats['hits'], 1)
+            self.assertEqual(cache.stats['misses'], 3)
+
+    def test_invalidate_backend_name_prefix(self):
+        """Test invalidating a backend keeps the entries of backends sharing its prefix."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TranspileCache(cache_dir=cache_dir)
+            cache.put('fake-' + 64 * 'a', _ghz())
+            cache.put('fake-backend-' + 64 * 'b', _ghz())
+            cache.invalidate('fake')
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(os.listdir(cache_dir), ['fake-backend-' + 64 * 'b' + '.pickle'])
+            self.assertIsNotNone(TranspileCache(cache_dir=cache_dir).get(
+                'fake-backend-' + 64 * 'b'))
+
+    def test_unpicklable_circuit(self):
+        """Test a circuit that can not be stored on disk is only cached in memory."""
+        circuit = QuantumCircuit(2)
+        circuit.h(0)
+        circuit.cx(0, 1)
+        circuit.metadata = {'lock': threading.Lock()}
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = TranspileCache(cache_dir=cache_dir)
+            transpile(circuit, FakeVigo(), cache=cache, seed_transpiler=42)
+            self.assertEqual(len(cache), 1)
+            self.assertEqual(os.listdir(cache_dir), [])
+            transpile(circuit, FakeVigo(), cache=cache, seed_transpiler=42)
+            self.assertEqual(cache.stats['hits'], 1)
+
+    def test_callback_not_cached(self):
+        """Test transpilations with a callback are not cached."""
+        cache = TranspileCache()
+        calls = []
+
+        def callback(**kwargs):
+            calls.append(kwargs['pass_'])
+
+        transpile(_ghz(), cache=cache, callback=callback, **self.options)
+        transpile(_ghz(), cache=cache, callback=callback, **self.options)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats['hits'], 0)
+        self.assertGreater(len(calls), 0)
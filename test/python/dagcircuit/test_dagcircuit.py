@@ -208,6 +208,25 @@ class TestDagApplyOperation(QiskitTestCase):
         self.assertEqual(len(list(self.dag.nodes())), 16)
         self.assertEqual(len(list(self.dag.edges())), 17)
 
+    def test_apply_operation_back_missing_bit(self):
+        """Test apply_operation_back() raises on a bit which is not in the dag."""
+        other = QuantumRegister(1, 'other')
+        with self.assertRaises(DAGCircuitError):
+            self.dag.apply_operation_back(CXGate(), [self.qubit0, other[0]], [])
+        self.assertEqual(len(self.dag.op_nodes()), 0)
+
+    def test_lazy_sort_key(self):
+        """Test the sort keys of the nodes are computed on demand and shared."""
+        node1 = self.dag.apply_operation_back(HGate(), [self.qubit0], [])
+        node2 = self.dag.apply_operation_back(XGate(), [self.qubit0], [])
+        self.assertIsNone(node1._sort_key)
+        self.assertEqual(node1.sort_key, str([self.qubit0]))
+        self.assertIs(node1.sort_key, node2.sort_key)
+
+        node2.qargs = (self.qubit1,)
+        self.assertIsNone(node2._sort_key)
+        self.assertEqual(node2.sort_key, str((self.qubit1,)))
+
     def test_edges(self):
         """Test that DAGCircuit.edges() behaves as expected with ops."""
         x_gate = XGate()
@@ -887,6 +906,52 @@ class TestDagLayers(QiskitTestCase):
             comp = [(nd.type, nd.name, nd._node_id) for nd in dag1.topological_nodes()]
             self.assertEqual(comp, truth)
 
+    def test_layers_view(self):
+        """Test the layers refer to the nodes of the dag and build their graph on demand."""
+        qreg = QuantumRegister(3, 'qr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        h_node = dag.apply_operation_back(HGate(), [qreg[2]], [])
+        cx_node = dag.apply_operation_back(CXGate(), [qreg[0], qreg[1]], [])
+        barrier_node = dag.apply_operation_back(Barrier(3), list(qreg), [])
+
+        layers = list(dag.layers())
+        self.assertEqual(len(layers), 2)
+        self.assertEqual(layers[0].op_nodes, [h_node, cx_node])
+        self.assertEqual(layers[0].node_ids, [h_node._node_id, cx_node._node_id])
+        self.assertEqual(layers[0]['partition'], [[qreg[2]], [qreg[0], qreg[1]]])
+        self.assertEqual(layers[1].op_nodes, [barrier_node])
+        self.assertEqual(layers[1]['partition'], [])
+        self.assertIsNone(layers[0]._graph)
+
+        expected = DAGCircuit()
+        expected.add_qreg(qreg)
+        expected.apply_operation_back(HGate(), [qreg[2]], [])
+        expected.apply_operation_back(CXGate(), [qreg[0], qreg[1]], [])
+        self.assertEqual(layers[0]['graph'], expected)
+        self.assertIs(layers[0].graph, layers[0]['graph'])
+        self.assertEqual(set(layers[0]), {'graph', 'partition'})
+
+    def test_serial_layers(self):
+        """Test the serial layers hold one node each and copies of the operations."""
+        qreg = QuantumRegister(2, 'qr')
+        creg = ClassicalRegister(1, 'cr')
+        dag = DAGCircuit()
+        dag.add_qreg(qreg)
+        dag.add_creg(creg)
+        dag.apply_operation_back(HGate(), [qreg[0]], [])
+        dag.apply_operation_back(Measure(), [qreg[1]], [creg[0]])
+        dag.apply_operation_back(Barrier(2), list(qreg), [])
+
+        layers = list(dag.serial_layers())
+        self.assertEqual([layer.op_nodes for layer in layers],
+                         [[node] for node in dag.topological_op_nodes()])
+        self.assertEqual([layer['partition'] for layer in layers],
+                         [[[qreg[0]]], [[qreg[1]]], []])
+        graph_node = layers[0]['graph'].op_nodes()[0]
+        self.assertEqual(graph_node.op, layers[0].op_nodes[0].op)
+        self.assertIsNot(graph_node.op, layers[0].op_nodes[0].op)
+
 
 class TestCircuitProperties(QiskitTestCase):
     """DAGCircuit properties test."""
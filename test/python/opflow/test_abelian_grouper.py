@@ -91,6 +91,41 @@ class TestAbelianGrouper(QiskitOpflowTestCase):
                 for op_1, op_2 in combinations(group, 2):
                     self.assertTrue(op_1.commutes(op_2))
 
+    @data('coloring', 'sorted_insertion')
+    def test_grouping_methods(self, grouping):
+        """Abelian grouper test with the {grouping} method on Paulis of more than 64 qubits"""
+        random.seed(1234)
+        paulis = []
+        for idx in range(50):
+            pauliop = 1
+            for eachop in random.choices([I] * 20 + [X, Y, Z], k=70):
+                pauliop ^= eachop
+            paulis.append((idx + 1) * pauliop)
+        grouped_sum = AbelianGrouper(grouping=grouping).convert(sum(paulis))
+        self.assertEqual(sum(len(group) for group in grouped_sum), len(paulis))
+        for group in grouped_sum:
+            for op_1, op_2 in combinations(group, 2):
+                self.assertTrue(all(
+                    pauli_1 == pauli_2 or 'I' in (pauli_1, pauli_2)
+                    for pauli_1, pauli_2 in zip(str(op_1.primitive), str(op_2.primitive))))
+
+    def test_commutation_graph(self):
+        """Test the commutation graph links the Paulis which do not commute qubit-wise"""
+        paulis = (I ^ X ^ Z) + (X ^ X ^ I) + (Y ^ I ^ Z) + (Z ^ X ^ Z)
+        edges = AbelianGrouper._commutation_graph(paulis.to_pauli_op())
+        self.assertListEqual(edges, [(1, 2), (1, 3), (2, 3)])
+
+    def test_sorted_insertion(self):
+        """Test the sorted insertion adds the Paulis by decreasing coefficients"""
+        # IX commutes with ZI, but ZZ is inserted first
+        paulis = (I ^ X) + (2 * Z ^ I) + (3 * Z ^ Z)
+        grouped_sum = AbelianGrouper.group_subops(paulis, grouping='sorted_insertion')
+        self.assertEqual(len(grouped_sum), 2)
+        self.assertListEqual([str(op.primitive) for op in grouped_sum[0]], ['IX'])
+        self.assertListEqual([str(op.primitive) for op in grouped_sum[1]], ['ZI', 'ZZ'])
+        with self.assertRaises(OpflowError):
+            AbelianGrouper.group_subops(paulis, grouping='unknown')
+
 
 if __name__ == '__main__':
     unittest.main()
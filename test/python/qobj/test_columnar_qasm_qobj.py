@@ -0,0 +1,117 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Columnar QASM Qobj experiment tests."""
+
+import numpy as np
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.circuit import Parameter
+from qiskit.circuit.library import XGate
+from qiskit.compiler import assemble
+from qiskit.qobj import (ColumnarQasmQobjExperiment, QasmQobjExperiment, QasmQobjInstruction,
+                         validate_qobj_against_schema)
+from qiskit.test import QiskitTestCase
+
+
+class TestColumnarQasmQobjExperiment(QiskitTestCase):
+    """Tests for ColumnarQasmQobjExperiment."""
+
+    def setUp(self):
+        super().setUp()
+        qr = QuantumRegister(2, name='q')
+        cr = ClassicalRegister(2, name='c')
+        cr2 = ClassicalRegister(1, name='d')
+        circuit = QuantumCircuit(qr, cr, cr2, name='circ')
+        circuit.initialize([1 / np.sqrt(2), 1j / np.sqrt(2)], qr[0])
+        circuit.h(qr[0]).c_if(cr, 2)
+        circuit.append(XGate(label='x_label'), [qr[1]])
+        circuit.rz(0.5, qr[1])
+        circuit.snapshot('snap', snapshot_type='statevector')
+        circuit.barrier()
+        circuit.measure(qr, cr)
+        circuit.reset(qr[0])
+        circuit.measure(qr[0], cr2[0])
+        circuit.x(qr[0]).c_if(cr2, 1)
+        self.circuit = circuit
+
+    def test_assemble(self):
+        """Test assembling columnar experiments gives the same qobj."""
+        qobj = assemble(self.circuit, shots=100)
+        columnar_qobj = assemble(self.circuit, shots=100, columnar=True)
+        experiment = columnar_qobj.experiments[0]
+        self.assertIsInstance(experiment, ColumnarQasmQobjExperiment)
+        self.assertEqual(experiment.to_dict(), qobj.experiments[0].to_dict())
+        self.assertEqual(experiment.instructions, qobj.experiments[0].instructions)
+        self.assertEqual(experiment.instruction_names(),
+                         qobj.experiments[0].instruction_names())
+        validate_qobj_against_schema(columnar_qobj)
+
+    def test_columns(self):
+        """Test the columns of the instructions."""
+        experiment = ColumnarQasmQobjExperiment.from_experiment(QasmQobjExperiment(
+            instructions=[
+                QasmQobjInstruction(name='u1', qubits=[1], params=[0.4]),
+                QasmQobjInstruction(name='cx', qubits=[0, 1]),
+                QasmQobjInstruction(name='bfunc', mask='0x1', relation='==', val='0x1',
+                                    register=2),
+                QasmQobjInstruction(name='u1', qubits=[0], params=[0.2], conditional=2),
+                QasmQobjInstruction(name='measure', qubits=[0], memory=[1])]))
+        self.assertEqual(experiment.names, ['u1', 'cx', 'bfunc', 'measure'])
+        np.testing.assert_array_equal(experiment.opcodes, [0, 1, 2, 0, 3])
+        np.testing.assert_array_equal(experiment.qubits, [1, 0, 1, 0, 0])
+        np.testing.assert_array_equal(experiment.qubit_offsets, [0, 1, 3, 3, 4, 5])
+        np.testing.assert_array_equal(experiment.memory, [1])
+        np.testing.assert_array_equal(experiment.memory_offsets, [0, 0, 0, 0, 0, 1])
+        np.testing.assert_array_equal(experiment.params, [0.4, 0.2])
+        np.testing.assert_array_equal(experiment.param_offsets, [0, 1, 1, 1, 2, 2])
+        np.testing.assert_array_equal(experiment.conditional, [-1, -1, -1, 2, -1])
+        self.assertEqual(experiment.extras,
+                         {2: {'mask': '0x1', 'relation': '==', 'val': '0x1', 'register': 2}})
+
+    def test_from_experiment(self):
+        """Test converting an experiment to columns and back."""
+        qobj = assemble(self.circuit)
+        experiment = ColumnarQasmQobjExperiment.from_experiment(qobj.experiments[0])
+        self.assertEqual(experiment.to_dict(), qobj.experiments[0].to_dict())
+        experiment = ColumnarQasmQobjExperiment.from_dict(qobj.experiments[0].to_dict())
+        self.assertEqual(experiment.to_dict(), qobj.experiments[0].to_dict())
+
+    def test_to_bytes(self):
+        """Test serializing an experiment to bytes and back."""
+        experiment = assemble(self.circuit, columnar=True).experiments[0]
+        data = experiment.to_bytes()
+        self.assertIsInstance(data, bytes)
+        deserialized = ColumnarQasmQobjExperiment.from_bytes(data)
+        self.assertEqual(deserialized.to_dict(), experiment.to_dict())
+        self.assertEqual(deserialized.instructions[0].params,
+                         [1 / np.sqrt(2), 1j / np.sqrt(2)])
+
+    def test_bound_parameters(self):
+        """Test the bound parameters of the instructions are stored in the columns."""
+        theta = Parameter('theta')
+        circuit = QuantumCircuit(1)
+        circuit.rz(theta, 0)
+        qobj = assemble(circuit, parameter_binds=[{theta: 0.5}])
+        experiment = assemble(circuit, parameter_binds=[{theta: 0.5}],
+                              columnar=True).experiments[0]
+        np.testing.assert_array_equal(experiment.params, [0.5])
+        self.assertEqual(experiment.extras, {})
+        self.assertEqual(experiment.to_dict(), qobj.experiments[0].to_dict())
+
+    def test_empty_experiment(self):
+        """Test an experiment without instructions."""
+        experiment = assemble(QuantumCircuit(1), columnar=True).experiments[0]
+        self.assertEqual(experiment.instructions, [])
+        self.assertEqual(experiment.to_dict()['instructions'], [])
+        deserialized = ColumnarQasmQobjExperiment.from_bytes(experiment.to_bytes())
+        self.assertEqual(deserialized.to_dict(), experiment.to_dict())
@@ -14,17 +14,21 @@
 
 """Tests for DensityMatrix quantum state class."""
 
+import itertools
 import unittest
 import logging
+from unittest.mock import patch
+
 import numpy as np
 from numpy.testing import assert_allclose
 
 from qiskit.test import QiskitTestCase
 from qiskit import QiskitError
 from qiskit import QuantumRegister, QuantumCircuit
-from qiskit.circuit.library import HGate
+from qiskit.circuit.library import CCXGate, CU3Gate, HGate, RXXGate, RZZGate, SwapGate
 
 from qiskit.quantum_info.random import random_unitary
+from qiskit.quantum_info.states import _kernels
 from qiskit.quantum_info.states import DensityMatrix, Statevector
 from qiskit.quantum_info.operators.operator import Operator
 
@@ -284,6 +288,36 @@ class TestDensityMatrix(QiskitTestCase):
             target = DensityMatrix(np.dot(op_full.data, rho).dot(op_full.adjoint().data))
             self.assertEqual(state.evolve(op, qargs=[2, 1, 0]), target)
 
+    def test_evolve_gates(self):
+        """Test evolving by diagonal, controlled and dense gates on subsystems."""
+        gates = [CCXGate(), CU3Gate(0.1, 0.2, 0.3), RZZGate(0.4), SwapGate(), HGate(),
+                 RXXGate(0.6)]
+        rho = self.rand_rho(8)
+        # A small chunk size runs the kernels of the large states
+        for chunk_size in [2 ** 16, 2]:
+            with patch.object(_kernels, '_CHUNK_SIZE', chunk_size):
+                for gate in gates:
+                    for qargs in itertools.permutations(range(3), gate.num_qubits):
+                        qargs = list(qargs)
+                        op_full = Operator(np.eye(8)).compose(Operator(gate), qargs=qargs)
+                        target = DensityMatrix(np.dot(op_full.data, rho).dot(
+                            op_full.adjoint().data))
+                        with self.subTest(gate=gate.name, qargs=qargs, chunk_size=chunk_size):
+                            self.assertEqual(DensityMatrix(rho).evolve(gate, qargs=qargs),
+                                             target)
+                            self.assertEqual(
+                                DensityMatrix(rho).evolve(Operator(gate), qargs=qargs), target)
+
+    def test_evolve_does_not_modify(self):
+        """Test evolving a density matrix does not modify it."""
+        circ = QuantumCircuit(2)
+        circ.h(0)
+        circ.cx(0, 1)
+        state = DensityMatrix.from_label('00')
+        state.evolve(circ)
+        state.evolve(Operator(circ), qargs=[1, 0])
+        self.assertEqual(state, DensityMatrix.from_label('00'))
+
     def test_conjugate(self):
         """Test conjugate method."""
         for _ in range(10):
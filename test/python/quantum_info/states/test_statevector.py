@@ -14,8 +14,11 @@
 
 """Tests for Statevector quantum state class."""
 
+import itertools
 import unittest
 import logging
+from unittest.mock import patch
+
 import numpy as np
 from numpy.testing import assert_allclose
 
@@ -23,9 +26,11 @@ from qiskit.test import QiskitTestCase
 from qiskit import QiskitError
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit import transpile
-from qiskit.circuit.library import HGate
+from qiskit.circuit.library import (CCXGate, CSwapGate, CU3Gate, HGate, PhaseGate, RXXGate,
+                                    RZZGate, SwapGate)
 
 from qiskit.quantum_info.random import random_unitary
+from qiskit.quantum_info.states import _kernels
 from qiskit.quantum_info.states import Statevector
 from qiskit.quantum_info.operators.operator import Operator
 from qiskit.quantum_info.operators.predicates import matrix_equal
@@ -290,6 +295,34 @@ class TestStatevector(QiskitTestCase):
             target = Statevector(np.dot(op_full.data, vec))
             self.assertEqual(state.evolve(op, qargs=[2, 1, 0]), target)
 
+    def test_evolve_gates(self):
+        """Test evolving by diagonal, controlled and dense gates on subsystems."""
+        gates = [CCXGate(), CSwapGate(), CU3Gate(0.1, 0.2, 0.3), RZZGate(0.4),
+                 PhaseGate(0.5), SwapGate(), HGate(), RXXGate(0.6)]
+        vec = self.rand_vec(16, normalize=True)
+        # A small chunk size runs the kernels of the large states
+        for chunk_size in [2 ** 16, 2]:
+            with patch.object(_kernels, '_CHUNK_SIZE', chunk_size):
+                for gate in gates:
+                    for qargs in itertools.permutations(range(4), gate.num_qubits):
+                        qargs = list(qargs)
+                        op_full = Operator(np.eye(16)).compose(Operator(gate), qargs=qargs)
+                        target = Statevector(np.dot(op_full.data, vec))
+                        with self.subTest(gate=gate.name, qargs=qargs, chunk_size=chunk_size):
+                            self.assertEqual(Statevector(vec).evolve(gate, qargs=qargs), target)
+                            self.assertEqual(Statevector(vec).evolve(Operator(gate), qargs=qargs),
+                                             target)
+
+    def test_evolve_does_not_modify(self):
+        """Test evolving a statevector does not modify it."""
+        circ = QuantumCircuit(2, global_phase=np.pi / 4)
+        circ.h(0)
+        circ.cx(0, 1)
+        state = Statevector.from_label('00')
+        state.evolve(circ)
+        state.evolve(Operator(circ), qargs=[1, 0])
+        self.assertEqual(state, Statevector.from_label('00'))
+
     def test_evolve_global_phase(self):
         """Test evolve circuit with global phase."""
         state_i = Statevector([1, 0])
@@ -206,6 +206,18 @@ class TestOneQubitEulerDecomposer(CheckDecompositions):
         unitary = random_unitary(2, seed=seed)
         self.check_one_qubit_euler_angles(unitary, basis)
 
+    @combine(basis=['U3', 'U', 'PSX', 'ZSX', 'U1X', 'RR', 'ZYZ', 'ZXZ', 'XYX'],
+             name='test_one_qubit_stacked_angles_{basis}_basis')
+    def test_one_qubit_stacked_angles(self, basis):
+        """Verify the {basis} angles of a stack of unitaries match those of each unitary."""
+        decomposer = OneQubitEulerDecomposer(basis)
+        unitaries = [random_unitary(2, seed=seed).data for seed in range(10)]
+        unitaries += [Operator(clifford).data for clifford in ONEQ_CLIFFORDS]
+        stacked = decomposer.angles_and_phase(np.array(unitaries))
+        for index, unitary in enumerate(unitaries):
+            np.testing.assert_allclose([params[index] for params in stacked],
+                                       decomposer.angles_and_phase(unitary), atol=1e-12)
+
 
 # FIXME: streamline the set of test cases
 class TestTwoQubitWeylDecomposition(CheckDecompositions):
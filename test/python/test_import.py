@@ -0,0 +1,102 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the subsystems loaded by ``import qiskit``."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from qiskit.test import QiskitTestCase
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+LAZY_MODULES = ['qiskit.compiler', 'qiskit.transpiler', 'qiskit.providers.basicaer',
+                'qiskit.assembler', 'qiskit.scheduler', 'qiskit.visualization',
+                'qiskit.algorithms', 'qiskit.opflow', 'qiskit.utils.quantum_instance',
+                'jsonschema', 'pkg_resources']
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "Module __getattr__ requires Python 3.7")
+class TestImport(QiskitTestCase):
+    """Test the subsystems loaded by import qiskit."""
+
+    def run_script(self, script):
+        """Run a script in a fresh interpreter and return its decoded JSON output."""
+        env = {**os.environ,
+               'PYTHONPATH': os.pathsep.join(filter(None, [ROOT_DIR,
+                                                           os.environ.get('PYTHONPATH')])),
+               'PYTHONWARNINGS': 'ignore'}
+        proc = subprocess.run([sys.executable, '-c', script], stdout=subprocess.PIPE,
+                              stderr=subprocess.PIPE, env=env, universal_newlines=True,
+                              check=False)
+        self.assertEqual(proc.returncode, 0, proc.stderr)
+        return json.loads(proc.stdout)
+
+    def test_heavy_subsystems_are_lazy(self):
+        """Test import qiskit does not load the heavy subsystems."""
+        loaded = self.run_script(
+            "import json, sys; import qiskit; "
+            "from qiskit.validation.jsonschema import compiled_validators; "
+            "print(json.dumps([sorted(sys.modules), not compiled_validators._VALIDATORS]))")
+        self.assertEqual([module for module in LAZY_MODULES if module in loaded[0]], [])
+        self.assertTrue(loaded[1])
+
+    def test_lazy_attributes(self):
+        """Test the lazy attributes of qiskit are loaded on access."""
+        names = self.run_script(
+            "import json; import qiskit; from qiskit import transpile, BasicAer, execute; "
+            "import qiskit.utils; "
+            "print(json.dumps([transpile.__module__, type(BasicAer).__name__, "
+            "execute.__module__, qiskit.transpiler.__name__, "
+            "qiskit.__qiskit_version__['qiskit-terra'], qiskit.__version__, "
+            "qiskit.utils.QuantumInstance.__name__, "
+            "'assemble' in dir(qiskit)]))")
+        self.assertEqual(names[:4], ['qiskit.compiler.transpile', 'BasicAerProvider',
+                                     'qiskit.execute', 'qiskit.transpiler'])
+        self.assertEqual(names[4], names[5])
+        self.assertEqual(names[6:], ['QuantumInstance', True])
+
+    def test_import_subpackages_first(self):
+        """Test each subpackage can be imported before the others."""
+        import qiskit
+        for name in sorted(qiskit._LAZY_SUBPACKAGES):
+            with self.subTest(subpackage=name):
+                module = self.run_script(
+                    "import json; import qiskit.{0}; "
+                    "print(json.dumps(qiskit.{0}.__name__))".format(name))
+                self.assertEqual(module, 'qiskit.' + name)
+
+    def test_star_import(self):
+        """Test from qiskit import * imports the lazy attributes."""
+        names = self.run_script(
+            "import json; from qiskit import *; "
+            "print(json.dumps([transpile.__module__, type(BasicAer).__name__, "
+            "assemble.__name__, schedule.__name__, sequence.__name__, transpiler.__name__]))")
+        self.assertEqual(names, ['qiskit.compiler.transpile', 'BasicAerProvider', 'assemble',
+                                 'schedule', 'sequence', 'qiskit.transpiler'])
+
+    def test_missing_provider(self):
+        """Test a provider failing to import is not an attribute of qiskit."""
+        import qiskit
+        with patch.dict(qiskit._PROVIDERS, {'NotAProvider': 'qiskit.providers.not_a_provider'}):
+            self.assertFalse(hasattr(qiskit, 'NotAProvider'))
+            self.assertNotIn('NotAProvider', vars(qiskit))
+
+    def test_unknown_attribute(self):
+        """Test accessing an unknown attribute of qiskit raises an AttributeError."""
+        import qiskit
+        with self.assertRaises(AttributeError):
+            qiskit.not_a_qiskit_name  # pylint: disable=pointless-statement
@@ -14,7 +14,13 @@
 
 import json
 import os
+import tempfile
+from unittest import mock
 
+from fastjsonschema import JsonSchemaException
+
+from qiskit.validation.jsonschema import compiled_validators
+from qiskit.validation.jsonschema.exceptions import SchemaValidationError
 from qiskit.validation.jsonschema.schema_validation import (
     validate_json_against_schema, _get_validator)
 from qiskit.providers.models import (QasmBackendConfiguration, PulseBackendConfiguration,
@@ -107,3 +113,53 @@ class TestSchemaExamples(QiskitTestCase):
                 schema_name = test_name
             with self.subTest(schema_test=schema_name):
                 _get_validator(schema_name, check_schema=True)
+
+
+class TestCompiledValidators(QiskitTestCase):
+    """Tests the compiled validators of the schemas."""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        patches = [mock.patch.dict(os.environ, {'QISKIT_SCHEMA_CACHE_DIR': self.cache_dir.name}),
+                   mock.patch.object(compiled_validators, '_VALIDATORS', {})]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        examples_path = self._get_resource_path('examples', Path.SCHEMAS)
+        with open(os.path.join(examples_path, 'backend_status_example.json')) as example_file:
+            self.example = json.load(example_file)
+
+    def test_validators_are_cached(self):
+        """Test the validators are cached in memory and on disk."""
+        validator = compiled_validators.compiled_validator('backend_status')
+        self.assertIs(compiled_validators.compiled_validator('backend_status'), validator)
+        cache_dir = compiled_validators.schema_cache_dir()
+        self.assertTrue(cache_dir.startswith(self.cache_dir.name))
+        self.assertEqual(len([name for name in os.listdir(cache_dir)
+                              if name.startswith('backend_status_')]), 1)
+
+        compiled_validators._VALIDATORS.clear()
+        with mock.patch('fastjsonschema.compile_to_code') as compile_to_code:
+            loaded = compiled_validators.compiled_validator('backend_status')
+        compile_to_code.assert_not_called()
+        self.assertIsNot(loaded, validator)
+        self.assertEqual(loaded(self.example), self.example)
+        self.example['pending_jobs'] = 'many'
+        with self.assertRaises(JsonSchemaException):
+            loaded(self.example)
+
+    def test_disabled_disk_cache(self):
+        """Test the validators are compiled without disk cache."""
+        with mock.patch.dict(os.environ, {'QISKIT_SCHEMA_CACHE_DIR': ''}):
+            self.assertIsNone(compiled_validators.schema_cache_dir())
+            validator = compiled_validators.compiled_validator('backend_status')
+        self.assertEqual(validator(self.example), self.example)
+        self.assertEqual(os.listdir(self.cache_dir.name), [])
+
+    def test_validation_error(self):
+        """Test the validation errors of the standard schemas."""
+        del self.example['pending_jobs']
+        with self.assertRaisesRegex(SchemaValidationError, 'pending_jobs'):
+            validate_json_against_schema(self.example, 'backend_status')
@@ -14,10 +14,12 @@
 import os
 import time
 
-from qiskit.tools.parallel import parallel_map
+from qiskit.tools.parallel import (parallel_map, parallel_imap, start_pool, resize_pool,
+                                   shutdown_pool)
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
 from qiskit.pulse import Schedule
 from qiskit.test import QiskitTestCase
+from qiskit.tools.events.pubsub import Subscriber
 
 
 def _parfunc(x):
@@ -27,6 +29,16 @@ def _parfunc(x):
     return x
 
 
+def _getpid(_):
+    # Long enough for the tasks running at once to be spread over the workers
+    time.sleep(0.1)
+    return os.getpid()
+
+
+def _square(x):
+    return x * x
+
+
 def _build_simple_circuit(_):
     qreg = QuantumRegister(2)
     creg = ClassicalRegister(2)
@@ -62,3 +74,107 @@ class TestParallel(QiskitTestCase):
         out_schedules = parallel_map(_build_simple_schedule, list(range(10)))
         names = [schedule.name for schedule in out_schedules]
         self.assertEqual(len(names), len(set(names)))
+
+    def test_parallel_chunksize(self):
+        """Test parallel_map with an explicit chunksize"""
+        for chunksize in [1, 3, 100]:
+            ans = parallel_map(_square, list(range(50)), num_processes=2, chunksize=chunksize)
+            self.assertEqual(ans, [x * x for x in range(50)])
+
+    def test_parallel_imap(self):
+        """Test parallel_imap yields the results in order"""
+        ans = parallel_imap(_square, list(range(50)), num_processes=2)
+        self.assertNotIsInstance(ans, list)
+        self.assertEqual(list(ans), [x * x for x in range(50)])
+
+    def test_parallel_imap_unordered(self):
+        """Test parallel_imap yields indexed results when unordered"""
+        ans = parallel_imap(_square, list(range(50)), num_processes=2, ordered=False)
+        self.assertEqual(sorted(ans), [(x, x * x) for x in range(50)])
+
+    def test_parallel_imap_early_exit(self):
+        """Test the parallel flag is reset when parallel_imap is not exhausted"""
+        results = parallel_imap(_square, list(range(50)), num_processes=2, chunksize=1)
+        self.assertEqual(next(results), 0)
+        results.close()
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+
+    def test_parallel_imap_nested_parallel_map(self):
+        """Test a parallel_map between the results of parallel_imap runs in parallel"""
+        results = parallel_imap(_square, list(range(8)), num_processes=2, chunksize=1)
+        self.assertEqual(next(results), 0)
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
+        pids = parallel_map(_getpid, list(range(8)), num_processes=2)
+        self.assertNotIn(os.getpid(), pids)
+        self.assertEqual(list(results), [x * x for x in range(1, 8)])
+
+    def test_parallel_events(self):
+        """Test the progress events are published with chunked tasks"""
+        events = []
+
+        def _start(num_tasks):
+            events.append(('start', num_tasks))
+
+        def _done(num_done):
+            events.append(('done', num_done))
+
+        def _finish():
+            events.append(('finish',))
+
+        subscriber = Subscriber()
+        callbacks = {"terra.parallel.start": _start,
+                     "terra.parallel.done": _done,
+                     "terra.parallel.finish": _finish}
+        for event, callback in callbacks.items():
+            subscriber.subscribe(event, callback)
+        try:
+            parallel_map(_square, list(range(20)), num_processes=2, chunksize=5)
+        finally:
+            for event, callback in callbacks.items():
+                subscriber.unsubscribe(event, callback)
+        self.assertEqual(events[0], ('start', 20))
+        self.assertEqual(events[-2], ('done', 20))
+        self.assertEqual(events[-1], ('finish',))
+
+
+class TestParallelPool(QiskitTestCase):
+    """Tests for the shared worker pool used by parallel_map."""
+
+    def tearDown(self):
+        super().tearDown()
+        shutdown_pool()
+
+    def test_pool_reused_between_calls(self):
+        """Verify the same workers serve consecutive parallel_map calls."""
+        start_pool(2)
+        first = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        second = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        self.assertTrue(second.issubset(first))
+
+    def test_pool_reused_with_other_num_processes(self):
+        """Verify calls with another num_processes reuse the running workers."""
+        start_pool(2)
+        first = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        second = set(parallel_map(_getpid, list(range(8)), num_processes=3))
+        third = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        self.assertTrue(second.issubset(first))
+        self.assertTrue(third.issubset(first))
+
+    def test_pool_resize(self):
+        """Verify resizing the pool replaces the workers."""
+        start_pool(2)
+        first = set(parallel_map(_getpid, list(range(8)), num_processes=2))
+        resize_pool(3)
+        second = set(parallel_map(_getpid, list(range(8)), num_processes=3))
+        self.assertEqual(parallel_map(_parfunc, list(range(4)), num_processes=3),
+                         list(range(4)))
+        if os.getpid() not in first:
+            self.assertFalse(first & second)
+
+    def test_parallel_after_shutdown(self):
+        """Verify parallel_map restarts the pool after a shutdown."""
+        start_pool(2)
+        shutdown_pool()
+        ans = parallel_map(_parfunc, list(range(4)), num_processes=2)
+        self.assertEqual(ans, list(range(4)))
+        self.assertEqual(os.getenv('QISKIT_IN_PARALLEL', None), 'FALSE')
@@ -14,6 +14,8 @@
 """Test the BasisTranslator pass"""
 
 
+from unittest.mock import patch
+
 from numpy import pi
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
@@ -25,6 +27,7 @@ from qiskit.exceptions import QiskitError
 from qiskit.quantum_info import Operator
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.transpiler.passes.basis import BasisTranslator, UnrollCustomDefinitions
+from qiskit.transpiler.passes.basis import basis_translator
 
 
 from qiskit.circuit.library.standard_gates.equivalence_library \
@@ -235,6 +238,57 @@ class TestBasisTranslator(QiskitTestCase):
 
         self.assertEqual(actual, expected_dag)
 
+    def test_translation_plan_is_cached(self):
+        """Verify the basis search is run once for circuits with the same basis."""
+        eq_lib = EquivalenceLibrary()
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        eq_lib.add_equivalence(OneQubitZeroParamGate(), equiv)
+
+        qc = QuantumCircuit(1)
+        qc.append(OneQubitZeroParamGate(), [0])
+
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitOneParamGate(pi), [0])
+        expected_dag = circuit_to_dag(expected)
+
+        with patch('qiskit.transpiler.passes.basis.basis_translator._basis_search',
+                   wraps=basis_translator._basis_search) as basis_search:
+            for _ in range(3):
+                pass_ = BasisTranslator(eq_lib, ['1q1p'])
+                self.assertEqual(pass_.run(circuit_to_dag(qc)), expected_dag)
+        self.assertEqual(basis_search.call_count, 1)
+
+    def test_translation_plan_is_invalidated(self):
+        """Verify changes to the library or its base invalidate the cached plans."""
+        base_lib = EquivalenceLibrary()
+        eq_lib = EquivalenceLibrary(base=base_lib)
+
+        qc = QuantumCircuit(1)
+        qc.append(OneQubitZeroParamGate(), [0])
+
+        pass_ = BasisTranslator(eq_lib, ['1q1p'])
+        with self.assertRaises(TranspilerError):
+            pass_.run(circuit_to_dag(qc))
+
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi), [0])
+        base_lib.add_equivalence(OneQubitZeroParamGate(), equiv)
+        self.assertEqual(dag_to_circuit(pass_.run(circuit_to_dag(qc))), equiv)
+
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitOneParamGate(pi / 2), [0])
+        eq_lib.set_entry(OneQubitZeroParamGate(), [equiv])
+        self.assertEqual(dag_to_circuit(pass_.run(circuit_to_dag(qc))), equiv)
+
+        theta = Parameter('theta')
+        equiv = QuantumCircuit(1)
+        equiv.append(OneQubitTwoParamGate(theta, pi), [0])
+        base_lib.add_equivalence(OneQubitOneParamGate(theta), equiv)
+        expected = QuantumCircuit(1)
+        expected.append(OneQubitTwoParamGate(pi / 2, pi), [0])
+        pass_ = BasisTranslator(eq_lib, ['1q2p'])
+        self.assertEqual(dag_to_circuit(pass_.run(circuit_to_dag(qc))), expected)
 
 class TestUnrollerCompatability(QiskitTestCase):
     """Tests backward compatability with the Unroller pass.
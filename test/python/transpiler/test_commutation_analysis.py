@@ -17,6 +17,7 @@ import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import PropertySet
+from qiskit.circuit import CommutationLibrary
 from qiskit.transpiler.passes import CommutationAnalysis
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
@@ -285,6 +286,19 @@ class TestCommutationAnalysis(QiskitTestCase):
                     'qr[4]': [[8], [12, 15, 18], [9]]}
         self.assertCommutationSet(self.pset["commutation_set"], expected)
 
+    def test_deprecated_cache(self):
+        """Test the deprecated cache attribute returns the cache of the library."""
+        library = CommutationLibrary()
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[1])
+        pass_ = CommutationAnalysis(commutation_library=library)
+        pass_.run(circuit_to_dag(circuit))
+        with self.assertWarns(DeprecationWarning):
+            cache = pass_.cache
+        self.assertEqual(len(cache), library.cache_info()['currsize'])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,15 +15,18 @@ Tests for the ConsolidateBlocks transpiler pass.
 """
 
 import unittest
+from unittest.mock import patch
+
 import numpy as np
 
 from qiskit.circuit import QuantumCircuit, QuantumRegister
-from qiskit.circuit.library import U2Gate
+from qiskit.circuit.library import CXGate, U2Gate
 from qiskit.extensions import UnitaryGate
 from qiskit.converters import circuit_to_dag
 from qiskit.transpiler.passes import ConsolidateBlocks
 from qiskit.quantum_info.operators import Operator
 from qiskit.quantum_info.operators.measures import process_fidelity
+from qiskit.quantum_info.synthesis import TwoQubitBasisDecomposer
 from qiskit.test import QiskitTestCase
 from qiskit.transpiler import PassManager
 from qiskit.transpiler.passes import Collect2qBlocks
@@ -304,6 +307,81 @@ class TestConsolidateBlocks(QiskitTestCase):
         res = consolidate_blocks_pass.run(dag)
         self.assertEqual(res, dag)
 
+    def test_block_unitary(self):
+        """Test the unitary of a block mixing gates with and without matrices."""
+        custom = QuantumCircuit(2, name='custom')
+        custom.h(1)
+        custom.cz(1, 0)
+        block = QuantumCircuit(2)
+        block.cx(1, 0)
+        block.u(0.1, 0.2, 0.3, 0)
+        block.append(custom.to_gate(), [1, 0])
+        block.cx(0, 1)
+        block.rzz(0.4, 0, 1)
+        block.cx(1, 0)
+        block.u(0.5, 0.6, 0.7, 1)
+        block.cx(1, 0)
+        qc = QuantumCircuit(3)
+        qc.compose(block, [0, 2], inplace=True)
+        dag = circuit_to_dag(qc)
+
+        pass_ = ConsolidateBlocks(force_consolidate=True)
+        pass_.property_set['block_list'] = [list(dag.topological_op_nodes())]
+        new_dag = pass_.run(dag)
+
+        self.assertEqual(len(new_dag.op_nodes()), 1)
+        self.assertEqual(Operator(new_dag.op_nodes()[0].op), Operator(block))
+
+    def test_repeated_blocks(self):
+        """Test the number of basis gates of repeated blocks is computed once."""
+        qc = QuantumCircuit(2)
+        for _ in range(3):
+            qc.cx(0, 1)
+            qc.cx(1, 0)
+            qc.cx(0, 1)
+            qc.barrier()
+
+        pass_manager = PassManager()
+        pass_manager.append(Collect2qBlocks())
+        pass_manager.append(ConsolidateBlocks())
+        with patch.object(TwoQubitBasisDecomposer, 'num_basis_gates',
+                          autospec=True, return_value=3) as num_basis_gates:
+            qc1 = pass_manager.run(qc)
+        self.assertEqual(num_basis_gates.call_count, 1)
+        self.assertEqual(qc1, qc)
+
+    def test_controlled_gate_states(self):
+        """Test gates differing by their control state get their own matrices."""
+        qc = QuantumCircuit(2)
+        qc.cx(0, 1)
+        qc.h(0)
+        qc.append(CXGate(ctrl_state=0), [0, 1])
+        qc.h(1)
+        qc.cx(0, 1)
+
+        pass_manager = PassManager()
+        pass_manager.append(Collect2qBlocks())
+        pass_manager.append(ConsolidateBlocks(force_consolidate=True))
+        qc1 = pass_manager.run(qc)
+        self.assertEqual(Operator(qc1), Operator(qc))
+
+    def test_custom_gates_with_same_name(self):
+        """Test custom gates with the same name and different definitions."""
+        first = QuantumCircuit(2, name='custom')
+        first.cx(0, 1)
+        second = QuantumCircuit(2, name='custom')
+        second.cx(1, 0)
+        qc = QuantumCircuit(2)
+        qc.append(first.to_gate(), [0, 1])
+        qc.h(0)
+        qc.append(second.to_gate(), [0, 1])
+
+        pass_manager = PassManager()
+        pass_manager.append(Collect2qBlocks())
+        pass_manager.append(ConsolidateBlocks(force_consolidate=True))
+        qc1 = pass_manager.run(qc)
+        self.assertEqual(Operator(qc1), Operator(qc))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -12,12 +12,16 @@
 
 """Tests PassManager.run()"""
 
+from unittest.mock import patch
+
+import dill
+
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.circuit.library import CXGate
 from qiskit.transpiler.preset_passmanagers import level_1_pass_manager
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeMelbourne
-from qiskit.transpiler import Layout, CouplingMap
+from qiskit.transpiler import Layout, CouplingMap, PassManager
 from qiskit.transpiler.passmanager_config import PassManagerConfig
 
 
@@ -111,3 +115,27 @@ class TestPassManagerRun(QiskitTestCase):
             for gate, qargs, _ in new_circuit.data:
                 if isinstance(gate, CXGate):
                     self.assertIn([x.index for x in qargs], coupling_map)
+
+    def test_several_circuits_deserialize_once(self):
+        """Test the pass manager is deserialized once for several circuits."""
+        qr = QuantumRegister(2, 'qr')
+        circuits = []
+        for _ in range(4):
+            circuit = QuantumCircuit(qr)
+            circuit.h(qr[0])
+            circuit.cx(qr[0], qr[1])
+            circuits.append(circuit)
+
+        pass_manager = level_1_pass_manager(PassManagerConfig(
+            basis_gates=['u1', 'u2', 'u3', 'cx'],
+            coupling_map=CouplingMap([[0, 1]]),
+            seed_transpiler=42))
+        pm_dill = dill.dumps(pass_manager)
+        expected = pass_manager.run(circuits[0])
+
+        with patch('qiskit.transpiler.passmanager.dill.loads', wraps=dill.loads) as loads:
+            results = [PassManager._in_parallel(circuit, pm_dill=pm_dill)
+                       for circuit in circuits]
+        self.assertEqual(loads.call_count, 1)
+        for result in results:
+            self.assertEqual(result, expected)
@@ -15,8 +15,11 @@
 import unittest
 
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.circuit.library import QuantumVolume
 from qiskit.transpiler import CouplingMap
 from qiskit.transpiler.passes import SabreLayout
+from qiskit.transpiler.passes.layout.sabre_layout import _layout_trial
+from qiskit.transpiler.passes.routing.sabre_swap import _trial_seeds
 from qiskit.converters import circuit_to_dag
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock import FakeAlmaden
@@ -79,6 +82,30 @@ class TestSabreLayout(QiskitTestCase):
         self.assertEqual(layout[qr1[1]], 7)
         self.assertEqual(layout[qr1[2]], 5)
 
+    def test_trials(self):
+        """Test the layout of several trials is the best one and deterministic."""
+        circuit = QuantumVolume(6, seed=2).decompose()
+        dag = circuit_to_dag(circuit)
+        coupling_map = CouplingMap(self.cmap20)
+        pass_ = SabreLayout(coupling_map, seed=5, trials=4)
+        pass_.run(dag)
+        layout = pass_.property_set['layout']
+
+        again = SabreLayout(coupling_map, seed=5, trials=4)
+        again.run(dag)
+        self.assertEqual(again.property_set['layout'].get_physical_bits(),
+                         layout.get_physical_bits())
+
+        single = SabreLayout(coupling_map, seed=5)
+        single.run(dag)
+        seeds = _trial_seeds(5, 4)
+        self.assertEqual(seeds[0], 5)
+        trials = [_layout_trial(seed, single, dag) for seed in seeds]
+        self.assertEqual(trials[0][0].get_physical_bits(),
+                         single.property_set['layout'].get_physical_bits())
+        best = min(trials, key=lambda trial: trial[1])[0]
+        self.assertEqual(layout.get_physical_bits(), best.get_physical_bits())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,12 +13,20 @@
 """Test the Sabre Swap pass"""
 
 import unittest
-from qiskit.transpiler.passes import SabreSwap
+
+from ddt import ddt, data
+import numpy as np
+
+from qiskit.circuit.library import QuantumVolume
+from qiskit.transpiler.passes import SabreSwap, CheckMap
+from qiskit.transpiler.passes.routing.sabre_swap import _trial_seeds
 from qiskit.transpiler import CouplingMap, PassManager
 from qiskit import QuantumRegister, QuantumCircuit
+from qiskit.quantum_info import Operator
 from qiskit.test import QiskitTestCase
 
 
+@ddt
 class TestSabreSwap(QiskitTestCase):
     """Tests the SabreSwap pass."""
 
@@ -84,6 +92,64 @@ class TestSabreSwap(QiskitTestCase):
 
         self.assertEqual(new_qc.num_nonlocal_gates(), 7)
 
+    @data('basic', 'lookahead', 'decay')
+    def test_routing_is_valid_and_seeded(self, heuristic):
+        """Test the {heuristic} routing is valid and only depends on the seed."""
+        coupling = CouplingMap.from_grid(2, 3)
+        qc = QuantumCircuit(QuantumRegister(6, 'q'))
+        qc.compose(QuantumVolume(6, seed=12).decompose(), inplace=True)
+
+        routing_pass = SabreSwap(coupling, heuristic, seed=42)
+        new_qc = PassManager(routing_pass).run(qc)
+        self.assertEqual(PassManager(SabreSwap(coupling, heuristic, seed=42)).run(qc), new_qc)
+
+        check_map = CheckMap(coupling)
+        PassManager(check_map).run(new_qc)
+        self.assertTrue(check_map.property_set['is_swap_mapped'])
+
+        # Undo the final permutation of the qubits to compare the unitaries.
+        final_layout = routing_pass.property_set['final_layout']
+        undo = QuantumCircuit(QuantumRegister(6, 'q'))
+        undo.compose(new_qc, inplace=True)
+        permutation = [final_layout[qubit] for qubit in undo.qubits]
+        self.assertEqual(Operator(qc), Operator(undo).compose(
+            _permutation_operator(permutation)))
+
+    def test_trials(self):
+        """Test the routing of several trials is the best one and deterministic."""
+        coupling = CouplingMap.from_grid(2, 3)
+        qc = QuantumCircuit(QuantumRegister(6, 'q'))
+        qc.compose(QuantumVolume(6, seed=3).decompose(), inplace=True)
+
+        routing_pass = SabreSwap(coupling, 'decay', seed=7, trials=5)
+        new_qc = PassManager(routing_pass).run(qc)
+        self.assertEqual(PassManager(SabreSwap(coupling, 'decay', seed=7, trials=5)).run(qc),
+                         new_qc)
+
+        single_swaps = [PassManager(SabreSwap(coupling, 'decay', seed=seed)).run(qc).count_ops()
+                        .get('swap', 0) for seed in _trial_seeds(7, 5)]
+        self.assertEqual(new_qc.count_ops().get('swap', 0), min(single_swaps))
+
+        check_map = CheckMap(coupling)
+        PassManager(check_map).run(new_qc)
+        self.assertTrue(check_map.property_set['is_swap_mapped'])
+        final_layout = routing_pass.property_set['final_layout']
+        undo = QuantumCircuit(QuantumRegister(6, 'q'))
+        undo.compose(new_qc, inplace=True)
+        permutation = [final_layout[qubit] for qubit in undo.qubits]
+        self.assertEqual(Operator(qc), Operator(undo).compose(
+            _permutation_operator(permutation)))
+
+
+def _permutation_operator(permutation):
+    """Operator moving the state of qubit ``permutation[i]`` to qubit ``i``."""
+    dim = 2 ** len(permutation)
+    matrix = np.zeros((dim, dim))
+    for index in range(dim):
+        bits = [(index >> source) & 1 for source in permutation]
+        matrix[sum(bit << target for target, bit in enumerate(bits)), index] = 1
+    return Operator(matrix)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,6 +14,7 @@
 
 import unittest
 from qiskit.transpiler.passes import StochasticSwap
+from qiskit.transpiler.passes.routing import stochastic_swap
 from qiskit.transpiler import CouplingMap, PassManager
 from qiskit.transpiler.exceptions import TranspilerError
 from qiskit.converters import circuit_to_dag, dag_to_circuit
@@ -534,6 +535,29 @@ class TestStochasticSwap(QiskitTestCase):
         after = circuit_to_dag(after)
         self.assertEqual(expected_dag, after)
 
+    def test_threaded_trials(self):
+        """Test the swaps found do not depend on the number of threads running the trials."""
+        coupling = CouplingMap.from_grid(4, 4)
+        qr = QuantumRegister(16, 'q')
+        circuit = QuantumCircuit(qr)
+        for qubit in range(8):
+            circuit.cx(qr[qubit], qr[15 - qubit])
+            circuit.cx(qr[qubit], qr[(5 * qubit + 3) % 16])
+        dag = circuit_to_dag(circuit)
+
+        expected = StochasticSwap(coupling, seed=42, num_threads=1).run(dag)
+        for num_threads in [2, 3, 7]:
+            with self.subTest(num_threads=num_threads):
+                after = StochasticSwap(coupling, seed=42, num_threads=num_threads).run(dag)
+                self.assertEqual(expected, after)
+
+    def test_trial_pool_replaced_while_used(self):
+        """Test a trial pool still runs trials after a larger pool replaced it."""
+        pool = stochastic_swap._trial_pool(2)
+        larger = stochastic_swap._trial_pool(stochastic_swap._TRIAL_POOL_SIZE + 1)
+        self.assertIsNot(larger, pool)
+        self.assertEqual(list(pool.map(abs, [-1, -2])), [1, 2])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2021.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+"""Benchmark the time of ``import qiskit`` against a regression budget."""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+_IMPORT_TIME = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)$')
+
+
+def import_times(module, env=None):
+    """Import a module in a fresh interpreter and return its import times.
+
+    Args:
+        module (str): the module to import.
+        env (dict): the environment of the interpreter.
+
+    Returns:
+        dict: the cumulative import time in microseconds of every module
+        imported, keyed by module name.
+    """
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import %s' % module],
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                          universal_newlines=True, env=env, check=True)
+    times = {}
+    for line in proc.stderr.splitlines():
+        match = _IMPORT_TIME.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2))
+    return times
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    parser = argparse.ArgumentParser(description="Benchmark the time of 'import qiskit'.")
+    parser.add_argument('--module', type=str, default='qiskit',
+                        help='module to import, by default qiskit')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='number of imports, the fastest one is reported')
+    parser.add_argument('--budget', type=float, default=None,
+                        help='fail if the import takes longer than this many milliseconds')
+    parser.add_argument('--top', type=int, default=10,
+                        help='number of the slowest imported subpackages to report')
+    args = parser.parse_args()
+
+    env = {**os.environ,
+           'PYTHONPATH': os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])),
+           'PYTHONWARNINGS': 'ignore'}
+    runs = [import_times(args.module, env) for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times[args.module])
+    total = best[args.module] / 1000
+
+    print("import %s: %.1f ms (best of %d)" % (args.module, total, args.repeat))
+    subpackages = sorted(((time, name) for name, time in best.items()
+                          if name.count('.') == 1 and name.startswith(args.module + '.')),
+                         reverse=True)
+    for time, name in subpackages[:args.top]:
+        print("  %-40s %8.1f ms" % (name, time / 1000))
+
+    if args.budget is not None and total > args.budget:
+        sys.stderr.write("import %s took %.1f ms, over the budget of %.1f ms\n"
+                         % (args.module, total, args.budget))
+        sys.exit(1)
+    sys.exit(0)
+
+
+if __name__ == '__main__':
+    main()